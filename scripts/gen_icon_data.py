@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Generate src/styledconsole/utils/_icon_data_generated.py.
+
+Flattens the hand-written category tables in
+``styledconsole.utils.icon_categories`` into literal ``ICON_REGISTRY`` and
+``EMOJI_TO_ICON`` dicts, plus ``ICON_CATEGORIES`` listing the icon names of
+each table, so importing the icon data neither resolves emoji names nor
+merges the categories at runtime.
+
+Usage:
+  uv run python scripts/gen_icon_data.py          # Rewrite the generated module
+  uv run python scripts/gen_icon_data.py --check  # Exit 1 if it is out of date
+"""
+
+import sys
+from pathlib import Path
+
+from styledconsole.utils.icon_categories import (
+    CATEGORY_TABLES,
+    build_emoji_to_icon,
+    build_icon_registry,
+)
+from styledconsole.utils.icon_data_types import IconMapping
+
+PROJECT_ROOT = Path(__file__).parent.parent
+OUTPUT = PROJECT_ROOT / "src" / "styledconsole" / "utils" / "_icon_data_generated.py"
+
+LINE_LENGTH = 100
+
+HEADER = '''"""Icon registry data generated from ``icon_categories``.
+
+DO NOT EDIT: regenerate with ``python scripts/gen_icon_data.py``.
+"""
+
+from typing import Final
+
+from styledconsole.utils.icon_data_types import IconMapping
+
+'''
+
+
+def _literal(value: str | None) -> str:
+    """Render a string as a double-quoted Python literal."""
+    text = repr(value)
+    if text.startswith("'") and '"' not in value:
+        text = f'"{text[1:-1]}"'
+    return text
+
+
+def _entry(key: str, mapping: IconMapping) -> list[str]:
+    """Render one dict entry, wrapping the call the way ruff format does."""
+    args = ", ".join(_literal(field) for field in mapping)
+    line = f"    {_literal(key)}: IconMapping({args}),"
+    if len(line) <= LINE_LENGTH:
+        return [line]
+    return [f"    {_literal(key)}: IconMapping(", f"        {args}", "    ),"]
+
+
+def _dict_block(name: str, comment: str, data: dict[str, IconMapping]) -> str:
+    lines = [f"# {comment}", f"{name}: Final[dict[str, IconMapping]] = {{"]
+    for key, mapping in data.items():
+        lines.extend(_entry(key, mapping))
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def _categories_block() -> str:
+    lines = [
+        "# Category table name -> icon names, in table order",
+        "ICON_CATEGORIES: Final[dict[str, tuple[str, ...]]] = {",
+    ]
+    for table_name, table in CATEGORY_TABLES.items():
+        lines.append(f"    {_literal(table_name)}: (")
+        lines.extend(f"        {_literal(key)}," for key in table)
+        lines.append("    ),")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def render_module() -> str:
+    """Return the source of the generated module."""
+    registry = build_icon_registry()
+    emoji_to_icon = build_emoji_to_icon(registry)
+    return (
+        HEADER
+        + _dict_block("ICON_REGISTRY", "Master registry - maps icon name to IconMapping", registry)
+        + "\n"
+        + _dict_block(
+            "EMOJI_TO_ICON",
+            "Reverse lookup - maps emoji to IconMapping (for runtime conversion)",
+            emoji_to_icon,
+        )
+        + "\n"
+        + _categories_block()
+    )
+
+
+def main() -> int:
+    source = render_module()
+    if "--check" in sys.argv[1:]:
+        if OUTPUT.read_text(encoding="utf-8") != source:
+            print(f"{OUTPUT.relative_to(PROJECT_ROOT)} is out of date; run {sys.argv[0]}")
+            return 1
+        return 0
+    OUTPUT.write_text(source, encoding="utf-8")
+    print(f"Wrote {OUTPUT.relative_to(PROJECT_ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
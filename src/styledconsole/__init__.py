@@ -168,9 +168,11 @@ from styledconsole.utils.color import (
     CSS4_COLORS,
     RGBColor,
     color_distance,
+    color_distance_sq,
     hex_to_rgb,
     interpolate_color,
     interpolate_rgb,
+    nearest_color_name,
     normalize_color_for_rich,
     parse_color,
     rgb_to_hex,
@@ -325,6 +327,7 @@ __all__ = [
     "analyze_emoji_safety",
     "auto_size_content",
     "color_distance",
+    "color_distance_sq",
     "convert_emoji_to_ascii",
     "create_object",
     "create_palette_effect",
@@ -365,6 +368,7 @@ __all__ = [
     "load_jinja_file",
     "load_json",
     "load_yaml",
+    "nearest_color_name",
     "normalize",
     "normalize_color_for_rich",
     "pad_to_width",
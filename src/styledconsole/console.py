@@ -13,7 +13,7 @@ from __future__ import annotations
 import logging
 import sys
 import warnings
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, TextIO
 
@@ -1075,6 +1075,24 @@ class Console:
                 frame_align=frame_align,
             )
 
+    @contextmanager
+    def buffered(self) -> Iterator[None]:
+        """Collect all output printed in the block and write it at once.
+
+        Each print normally writes and flushes the output stream on its own.
+        Inside this block output is buffered and written with a single flush
+        when the outermost block exits. Blocks may be nested.
+
+        Example:
+            >>> console = Console()
+            >>> with console.buffered():
+            ...     console.frame("Header")
+            ...     console.rule()
+            ...     console.frame("Body")
+        """
+        with self._rich_console:
+            yield
+
     def _print_ansi_output(self, output: str, align: str = "left") -> None:
         """Print ANSI output with proper alignment handling.
 
@@ -219,23 +219,29 @@ class FrameGroupContext:
         """
         from styledconsole.utils.text import visual_width
 
+        # Sibling frames repeat lines and titles (e.g. status summaries), and
+        # visual_width is uncached for image/HTML export, so measure each
+        # distinct string once per alignment pass.
+        widths: dict[str, int] = {}
+
+        def measure(text: str) -> int:
+            w = widths.get(text)
+            if w is None:
+                # Use markup=True to handle Rich markup tags in content
+                w = widths[text] = visual_width(text, markup=True)
+            return w
+
         # Calculate max width needed across all frames
         max_width = 0
         for frame in self._captured_frames:
             # Calculate content width
             content = frame.content
             lines = content.split("\n") if isinstance(content, str) else content
-
-            content_width = 0
-            for line in lines:
-                # Use markup=True to handle Rich markup tags in content
-                w = visual_width(line, markup=True)
-                if w > content_width:
-                    content_width = w
+            content_width = max(map(measure, lines), default=0)
 
             # Calculate title width if present
             title = frame.kwargs.get("title", "")
-            title_width = visual_width(title, markup=True) if title else 0
+            title_width = measure(title) if title else 0
 
             # Frame needs to fit both content and title
             # Title appears in border, so it needs ~4 extra chars for decoration
@@ -470,7 +470,13 @@ class RenderingEngine:
             from io import StringIO
 
             buffer = StringIO()
-            temp_console = RichConsole(file=buffer, force_terminal=True, width=10000)
+            # Keep the target console's color system so truecolor isn't downgraded
+            temp_console = RichConsole(
+                file=buffer,
+                force_terminal=True,
+                width=10000,
+                color_system=self._rich_console.color_system,
+            )
             temp_console.print(text_obj, highlight=False, soft_wrap=False)
             lines = buffer.getvalue().splitlines()
 
@@ -36,7 +36,18 @@ FONT_MEASURE_CHAR = "M"
 """Character used for measuring monospace font dimensions."""
 
 TEMP_IMAGE_SIZE = (100, 100)
-"""Temporary image size for font measurement."""
+"""Temporary image size for font measurement.
+
+No longer used: fonts are measured with getbbox() instead of a scratch image.
+Kept so existing imports keep working.
+"""
+
+FONT_METRIC_CACHE_SIZE = 4096
+"""Maximum number of cached text widths per font.
+
+Text measurement goes through FreeType on every call, while the same
+chunks (box-drawing runs, log prefixes) recur constantly in console output.
+"""
 
 # Font Search Paths (Standard Locations)
 FONT_DIRS: dict[str, list[str]] = {
@@ -92,6 +103,13 @@ EMOJI_LINE_HEIGHT_FACTOR = 0.75
 EMOJI_POSITION_OFFSET = (0, -2)
 """Default pixel offset (x, y) for emoji positioning."""
 
+EMOJI_BILINEAR_RESIZE_TOLERANCE = 0.15
+"""Relative size change below which emojis are resized with BILINEAR.
+
+LANCZOS is much slower and gives no visible benefit when the source is
+already close to the target size. Equal sizes skip resampling entirely.
+"""
+
 # =============================================================================
 # Text Decoration Rendering
 # =============================================================================
@@ -113,3 +131,34 @@ TEXT_DECORATION_UNDERLINE_OFFSET = 3
 
 TEXT_DECORATION_OVERLINE_OFFSET = 2
 """Pixels from top of character cell for overline position."""
+
+# =============================================================================
+# Glyph Cache
+# =============================================================================
+
+GLYPH_CACHE_SIZE = 4096
+"""Maximum number of rendered glyph masks kept per ImageExporter.
+
+A full terminal frame usually contains only a few hundred distinct
+(character, font, decoration) combinations, so this comfortably holds
+the working set of long animations.
+"""
+
+LAYOUT_CACHE_SIZE = 2048
+"""Maximum number of segment layouts (width and font runs) kept per ImageExporter.
+
+Consecutive animation frames mostly repeat the same segment texts, so
+their layout is computed once and reused across frames.
+"""
+
+# =============================================================================
+# Animation Encoding
+# =============================================================================
+
+GIF_MAX_COLORS = 256
+"""Maximum number of colors in a GIF palette.
+
+Animations whose distinct frames use at most this many colors in total are
+encoded losslessly against one shared palette; larger ones fall back to
+Pillow's per-frame adaptive palettes.
+"""
@@ -8,20 +8,25 @@ from __future__ import annotations
 
 import re
 from enum import Enum
-from typing import NamedTuple
+from functools import cache
+from typing import Any, NamedTuple
 
 __all__ = [
-    "EMOJI_REGEX",
+    "EMOJI_REGEX",  # noqa: F822 - built lazily by __getattr__
     "Node",
     "NodeType",
+    "parse_line",
     "parse_text_with_emojis",
 ]
 
 
+@cache
 def _build_emoji_regex() -> re.Pattern[str]:
     """Build regex pattern to match emoji characters.
 
-    Uses the central EMOJI registry as the source of truth.
+    Uses the central EMOJI registry as the source of truth. Compiling the
+    alternation of every emoji sequence is the most expensive step of
+    importing this module, so it is deferred until first use.
     """
     try:
         from styledconsole.emoji_registry import EMOJI
@@ -32,7 +37,50 @@ def _build_emoji_regex() -> re.Pattern[str]:
         return re.compile(r"(\x00)")  # Won't match anything useful
 
 
-EMOJI_REGEX = _build_emoji_regex()
+@cache
+def _build_emoji_hint_regex() -> re.Pattern[str] | None:
+    """Build a character-class pattern that any emoji match must hit.
+
+    Every emoji sequence contains at least one non-ASCII codepoint (keycaps
+    like "1️⃣" start with an ASCII digit but carry U+FE0F/U+20E3). Collecting
+    the first non-ASCII codepoint of each sequence gives a set of sentinels:
+    a line containing none of them cannot match EMOJI_REGEX, so the expensive
+    alternation can be skipped entirely.
+
+    Returns:
+        Compiled pattern, or None if emoji data is unavailable.
+    """
+    try:
+        import emoji as _emoji_pkg
+
+        sentinels = {
+            next(c for c in seq if not c.isascii())
+            for seq in _emoji_pkg.EMOJI_DATA
+            if not seq.isascii()
+        }
+        return re.compile("[" + "".join(map(re.escape, sorted(sentinels))) + "]")
+    except ImportError:
+        return None
+
+
+# Line boundaries recognized by str.splitlines()
+_LINE_BREAK_PATTERN = r"\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]"
+
+
+@cache
+def _build_token_regex() -> re.Pattern[str]:
+    """Build a pattern matching either a line break or an emoji.
+
+    Used to tokenize a whole multi-line text in a single pass.
+    """
+    return re.compile(f"(?P<newline>{_LINE_BREAK_PATTERN})|{_build_emoji_regex().pattern}")
+
+
+def __getattr__(name: str) -> Any:
+    """Build EMOJI_REGEX lazily on first attribute access (PEP 562)."""
+    if name == "EMOJI_REGEX":
+        return _build_emoji_regex()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class NodeType(Enum):
@@ -52,7 +100,8 @@ class Node(NamedTuple):
 def parse_text_with_emojis(text: str) -> list[list[Node]]:
     """Parse text into nodes, separating emojis from regular text.
 
-    Splits text by lines and identifies emoji vs text segments within each line.
+    Splits text by lines (same boundaries as str.splitlines) and identifies
+    emoji vs text segments within each line, in a single regex pass.
 
     Args:
         text: Text to parse, may contain emoji characters.
@@ -68,17 +117,58 @@ def parse_text_with_emojis(text: str) -> list[list[Node]]:
         >>> len(nodes[0])  # Three nodes: "Hello ", "🌍", " World"
         3
     """
-    result = []
-    for line in text.splitlines():
-        nodes = []
-        for i, chunk in enumerate(EMOJI_REGEX.split(line)):
-            if not chunk:
-                continue
-            if i % 2 == 0:
-                # Regular text (even indices after split)
-                nodes.append(Node(NodeType.TEXT, chunk))
-            else:
-                # Emoji (odd indices - captured groups)
-                nodes.append(Node(NodeType.EMOJI, chunk))
+    hint_regex = _build_emoji_hint_regex()
+    if hint_regex is not None and hint_regex.search(text) is None:
+        return [[Node(NodeType.TEXT, line)] if line else [] for line in text.splitlines()]
+
+    result: list[list[Node]] = []
+    nodes: list[Node] = []
+    pos = 0
+    for match in _build_token_regex().finditer(text):
+        start = match.start()
+        if start > pos:
+            nodes.append(Node(NodeType.TEXT, text[pos:start]))
+        if match.lastgroup == "newline":
+            result.append(nodes)
+            nodes = []
+        else:
+            nodes.append(Node(NodeType.EMOJI, match.group()))
+        pos = match.end()
+
+    if pos < len(text):
+        nodes.append(Node(NodeType.TEXT, text[pos:]))
+    # Like str.splitlines(), a trailing line break does not open a new line
+    if nodes:
         result.append(nodes)
     return result
+
+
+def parse_line(line: str) -> list[Node]:
+    """Parse a single line of text into nodes.
+
+    Lines without any emoji sentinel codepoint (the vast majority of console
+    output) are returned as a single TEXT node without running EMOJI_REGEX.
+
+    Args:
+        line: Text without newlines.
+
+    Returns:
+        List of TEXT and EMOJI nodes in order of appearance.
+    """
+    if not line:
+        return []
+    hint_regex = _build_emoji_hint_regex()
+    if hint_regex is not None and hint_regex.search(line) is None:
+        return [Node(NodeType.TEXT, line)]
+
+    nodes = []
+    for i, chunk in enumerate(_build_emoji_regex().split(line)):
+        if not chunk:
+            continue
+        if i % 2 == 0:
+            # Regular text (even indices after split)
+            nodes.append(Node(NodeType.TEXT, chunk))
+        else:
+            # Emoji (odd indices - captured groups)
+            nodes.append(Node(NodeType.EMOJI, chunk))
+    return nodes
@@ -13,10 +13,16 @@ from __future__ import annotations
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary
 
 # Re-export commonly used classes for convenience
-from .emoji_parser import EMOJI_REGEX, Node, NodeType, parse_text_with_emojis
+from .emoji_parser import (
+    Node,
+    NodeType,
+    parse_line,
+    parse_text_with_emojis,
+)
 from .emoji_sources import (
     AppleEmojiSource,
     BaseEmojiSource,
@@ -24,7 +30,9 @@ from .emoji_sources import (
     MicrosoftEmojiSource,
     NotoColorEmojiSource,
     OpenmojiSource,
+    SpriteAtlasEmojiSource,
     TwemojiSource,
+    resize_emoji_image,
 )
 
 if TYPE_CHECKING:
@@ -38,6 +46,7 @@ from .config import (
     EMOJI_MIN_SIZE_PX,
     EMOJI_POSITION_OFFSET,
     EMOJI_SCALE_FACTOR,
+    FONT_METRIC_CACHE_SIZE,
 )
 
 __all__ = [
@@ -48,12 +57,84 @@ __all__ = [
     "MicrosoftEmojiSource",
     "NotoColorEmojiSource",
     "OpenmojiSource",
+    "SpriteAtlasEmojiSource",
     "TwemojiSource",
 ]
 
 logger = logging.getLogger("styledconsole.export.emoji_renderer")
 
 
+def __getattr__(name: str) -> Any:
+    """Re-export EMOJI_REGEX without compiling it at import time (PEP 562)."""
+    if name == "EMOJI_REGEX":
+        from . import emoji_parser
+
+        return emoji_parser.EMOJI_REGEX
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Per-font text width cache. Keyed weakly on the font object so entries go
+# away with the font and a recycled id() can never return stale metrics.
+_metric_cache: WeakKeyDictionary[Any, dict[str, int]] = WeakKeyDictionary()
+
+# Per-font metric capabilities (has getlength, has getbbox), probed once
+# when a font is first measured instead of on every text chunk.
+_font_caps: WeakKeyDictionary[Any, tuple[bool, bool]] = WeakKeyDictionary()
+
+
+def _probe_font(font) -> tuple[bool, bool]:
+    """Detect which metric methods a font provides."""
+    return (
+        callable(getattr(font, "getlength", None)),
+        callable(getattr(font, "getbbox", None)),
+    )
+
+
+def _font_text_length(font, content: str) -> int:
+    """Measure text width with font metrics, bypassing the cache."""
+    try:
+        caps = _font_caps.get(font)
+        if caps is None:
+            caps = _font_caps[font] = _probe_font(font)
+    except TypeError:
+        # Font object does not support weak references
+        caps = _probe_font(font)
+    has_getlength, has_getbbox = caps
+
+    if has_getlength:
+        try:
+            return int(font.getlength(content) or 0)
+        except Exception:
+            logger.debug("getlength failed for content", exc_info=True)
+    if has_getbbox:
+        try:
+            bbox = font.getbbox(content)
+            if bbox:
+                return int(bbox[2] - bbox[0])
+        except Exception:
+            logger.debug("bbox text width measurement failed", exc_info=True)
+    return len(content) * 8
+
+
+def _cached_text_length(font, content: str) -> int:
+    """Measure text width with font metrics, memoized per (font, text)."""
+    try:
+        widths = _metric_cache.get(font)
+    except TypeError:
+        # Font object does not support weak references; measure directly
+        return _font_text_length(font, content)
+
+    if widths is None:
+        widths = _metric_cache[font] = {}
+
+    width = widths.get(content)
+    if width is None:
+        width = _font_text_length(font, content)
+        if len(widths) < FONT_METRIC_CACHE_SIZE:
+            widths[content] = width
+    return width
+
+
 @dataclass
 class EmojiRenderer:
     """Renders text with emoji support onto PIL images.
@@ -189,15 +270,7 @@ class EmojiRenderer:
             font = ImageFont.load_default()
 
         font_size = self._get_font_size(font)
-        nodes = self._parse_single_line(text)
-
-        total_width = 0
-        for node in nodes:
-            if node.type == NodeType.TEXT:
-                total_width += self._measure_text_width(node.content, font)
-            else:
-                total_width += self._measure_emoji_width(node.content, font_size)
-        return total_width
+        return self._measure_line(self._parse_single_line(text), font, font_size)
 
     def getsize(
         self,
@@ -227,13 +300,7 @@ class EmojiRenderer:
         total_height = 0
 
         for line_nodes in lines:
-            line_width = 0
-            for node in line_nodes:
-                if node.type == NodeType.TEXT:
-                    line_width += self._measure_text_width(node.content, font)
-                else:
-                    line_width += self._measure_emoji_width(node.content, font_size)
-            max_width = max(max_width, line_width)
+            max_width = max(max_width, self._measure_line(line_nodes, font, font_size))
             total_height += font_size + spacing
 
         if total_height > 0:
@@ -397,17 +464,28 @@ class EmojiRenderer:
 
     def _render_emoji_node(self, x: int, y: int, node, font_size: int, font, fill) -> int:
         """Render an emoji node and return new x position."""
-        emoji_stream = self.source.get_emoji(node.content) if self.source else None
         emoji_width = int(self._measure_emoji_width(node.content, font_size))
         emoji_size = int(self._get_emoji_size(font_size))
         if emoji_size > emoji_width:
             emoji_size = emoji_width
 
-        if emoji_stream:
+        # BaseEmojiSource subclasses hand out decoded, pre-sized images; the
+        # stream API is only used for duck-typed third-party sources.
+        get_emoji_image = getattr(self.source, "get_emoji_image", None)
+        if callable(get_emoji_image):
             try:
-                return self._paste_emoji(x, y, emoji_stream, emoji_size, emoji_width, font)
+                emoji_img = get_emoji_image(node.content, emoji_size)
+                if emoji_img is not None:
+                    return self._paste_emoji_image(x, y, emoji_img, emoji_width, font)
             except Exception:
                 logger.debug("Failed to paste emoji at (%d, %d)", x, y, exc_info=True)
+        else:
+            emoji_stream = self.source.get_emoji(node.content) if self.source else None
+            if emoji_stream:
+                try:
+                    return self._paste_emoji(x, y, emoji_stream, emoji_size, emoji_width, font)
+                except Exception:
+                    logger.debug("Failed to paste emoji at (%d, %d)", x, y, exc_info=True)
 
         # Fallback: draw placeholder
         self._draw.text((x, y), "□", fill=fill, font=font)
@@ -416,18 +494,27 @@ class EmojiRenderer:
     def _paste_emoji(
         self, x: int, y: int, emoji_stream, emoji_size: int, emoji_width: int, font
     ) -> int:
-        """Paste emoji image at position and return new x position."""
+        """Decode emoji stream, paste it at position and return new x position."""
         from PIL import Image
 
         with Image.open(emoji_stream) as emoji_img:
-            emoji_img = emoji_img.convert("RGBA")  # type: ignore[assignment]
-            emoji_img = emoji_img.resize((emoji_size, emoji_size), Image.Resampling.LANCZOS)  # type: ignore[assignment]
-
-            ox = (emoji_width - emoji_size) // 2
-            oy = self._calculate_emoji_y_offset(emoji_size, font)
-
-            self.image.paste(emoji_img, (int(x + ox), int(y + oy)), emoji_img)
-            return x + emoji_width
+            emoji_img = resize_emoji_image(emoji_img.convert("RGBA"), emoji_size)  # type: ignore[assignment]
+            return self._paste_emoji_image(x, y, emoji_img, emoji_width, font)
+
+    def _paste_emoji_image(self, x: int, y: int, emoji_img, emoji_width: int, font) -> int:
+        """Paste an already-sized RGBA emoji image and return new x position."""
+        emoji_size = emoji_img.width
+        ox = (emoji_width - emoji_size) // 2
+        oy = self._calculate_emoji_y_offset(emoji_size, font)
+        dest = (int(x + ox), int(y + oy))
+
+        if self.image.mode == "RGBA" and dest[0] >= 0 and dest[1] >= 0:
+            # Composite onto the tile region in place: blends alpha correctly
+            # on transparent canvases, where a masked paste would overwrite it.
+            self.image.alpha_composite(emoji_img, dest)
+        else:
+            self.image.paste(emoji_img, dest, emoji_img)
+        return x + emoji_width
 
     def _calculate_emoji_y_offset(self, emoji_size: int, font) -> int:
         """Calculate vertical offset for emoji alignment."""
@@ -471,15 +558,17 @@ class EmojiRenderer:
 
     def _parse_single_line(self, text: str) -> list[Node]:
         """Parse a single line of text into nodes."""
-        nodes = []
-        for i, chunk in enumerate(EMOJI_REGEX.split(text)):
-            if not chunk:
-                continue
-            if i % 2 == 0:
-                nodes.append(Node(NodeType.TEXT, chunk))
+        return parse_line(text)
+
+    def _measure_line(self, nodes: list[Node], font, font_size: int) -> int:
+        """Measure the total width of a parsed line in pixels."""
+        width = 0
+        for node in nodes:
+            if node.type == NodeType.TEXT:
+                width += self._measure_text_width(node.content, font)
             else:
-                nodes.append(Node(NodeType.EMOJI, chunk))
-        return nodes
+                width += self._measure_emoji_width(node.content, font_size)
+        return width
 
     def _measure_text_width(self, content: str, font) -> int:
         """Measure width of text content.
@@ -493,16 +582,4 @@ class EmojiRenderer:
             return visual_width(content) * self.char_width
 
         # Fallback to font metrics
-        try:
-            _getlen = getattr(font, "getlength", None)
-            if callable(_getlen):
-                return int(_getlen(content) or 0)
-        except Exception:
-            logger.debug("_getlen failed for content", exc_info=True)
-        try:
-            bbox = font.getbbox(content)
-            if bbox:
-                return int(bbox[2] - bbox[0])
-        except Exception:
-            logger.debug("bbox text width measurement failed", exc_info=True)
-        return len(content) * 8
+        return _cached_text_length(font, content)
@@ -9,14 +9,21 @@ but rewritten from scratch to support emoji v2.x library.
 
 from __future__ import annotations
 
+import os
+import sys
+import threading
 from abc import ABC, abstractmethod
 from io import BytesIO
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar
 from urllib.error import HTTPError
 from urllib.parse import quote_plus
 from urllib.request import Request, urlopen
 
+from .config import EMOJI_BILINEAR_RESIZE_TOLERANCE
+
 if TYPE_CHECKING:
+    from PIL import Image as PILImage
     from PIL import ImageFont as PILImageFont
 
 __all__ = [
@@ -27,7 +34,10 @@ __all__ = [
     "MicrosoftEmojiSource",
     "NotoColorEmojiSource",
     "OpenmojiSource",
+    "SpriteAtlasEmojiSource",
     "TwemojiSource",
+    "emoji_to_hex_sequence",
+    "resize_emoji_image",
 ]
 
 
@@ -85,6 +95,13 @@ Small margin prevents edge artifacts from cropping
 too close to the rendered content.
 """
 
+NOTO_COLOR_EMOJI_CANVAS_POOL_SIZE = 4
+"""Maximum number of idle render canvases kept for reuse.
+
+Each canvas is a full RGBA image of the padded glyph size, so pooling a
+few avoids reallocating one per rendered emoji.
+"""
+
 NOTO_COLOR_EMOJI_FONT_NAME = "NotoColorEmoji.ttf"
 """Filename of the NotoColorEmoji font.
 
@@ -93,6 +110,72 @@ of the export module.
 """
 
 
+# =============================================================================
+# Sprite Atlas Configuration
+# =============================================================================
+
+EMOJI_ATLAS_SIZE_PX = 64
+"""Canonical tile size for SpriteAtlasEmojiSource.
+
+Tiles are stored decoded at this size. Requests for exactly this size are
+served without any resampling; smaller sizes are downscaled from the tile
+once and cached, and larger ones come from the wrapped source.
+"""
+
+EMOJI_ATLAS_CACHE_SUBDIR = "emoji"
+"""Subdirectory of the user cache directory holding persisted atlas tiles."""
+
+
+def _user_cache_dir() -> Path:
+    """Get the per-user cache directory for styledconsole.
+
+    Honors XDG_CACHE_HOME on Linux, uses ~/Library/Caches on macOS and
+    %LOCALAPPDATA% on Windows.
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return Path(base) / "styledconsole"
+
+
+def resize_emoji_image(img: PILImage.Image, size: int) -> PILImage.Image:
+    """Resize an emoji image to a square, choosing the cheapest filter.
+
+    Images already at the target size are returned unchanged. Small
+    adjustments (within EMOJI_BILINEAR_RESIZE_TOLERANCE) use BILINEAR;
+    larger ones use LANCZOS for quality.
+
+    Args:
+        img: Source emoji image.
+        size: Target width and height in pixels.
+
+    Returns:
+        Image of size x size pixels (may be the input image itself).
+    """
+    from PIL import Image
+
+    if img.size == (size, size):
+        return img
+    if abs(img.width - size) / img.width < EMOJI_BILINEAR_RESIZE_TOLERANCE:
+        return img.resize((size, size), Image.Resampling.BILINEAR)
+    return img.resize((size, size), Image.Resampling.LANCZOS)
+
+
+def emoji_to_hex_sequence(emoji: str) -> str:
+    """Convert an emoji to its dash-joined codepoint sequence.
+
+    Variation selector U+FE0F is dropped, matching Twemoji file naming.
+
+    Example:
+        >>> emoji_to_hex_sequence("❤️")
+        '2764'
+    """
+    return "-".join(f"{ord(c):x}" for c in emoji if c != "\ufe0f")
+
+
 # =============================================================================
 # Base Classes
 # =============================================================================
@@ -117,6 +200,33 @@ class BaseEmojiSource(ABC):
         """
         raise NotImplementedError
 
+    def get_emoji_image(self, emoji: str, size: int) -> PILImage.Image | None:
+        """Get emoji as a decoded RGBA image resized to a square.
+
+        The default implementation decodes the get_emoji() stream on every
+        call. Sources that can keep decoded images around should override
+        this to skip the decode and resize.
+
+        Args:
+            emoji: The emoji character to fetch.
+            size: Target width and height in pixels.
+
+        Returns:
+            RGBA image of size x size pixels, or None if not found or the
+            image can't be decoded or resized.
+        """
+        stream = self.get_emoji(emoji)
+        if stream is None:
+            return None
+
+        from PIL import Image
+
+        try:
+            with Image.open(stream) as img:
+                return resize_emoji_image(img.convert("RGBA"), size)
+        except Exception:
+            return None
+
 
 class CDNEmojiSource(BaseEmojiSource):
     """Emoji source that fetches images from a CDN.
@@ -134,6 +244,7 @@ class CDNEmojiSource(BaseEmojiSource):
     def __init__(self) -> None:
         """Initialize the CDN source with an empty cache."""
         self._cache: dict[str, BytesIO] = {}
+        self._image_cache: dict[tuple[str, int], PILImage.Image] = {}
 
     def _request(self, url: str) -> bytes | None:
         """Make HTTP request to fetch emoji image.
@@ -177,6 +288,27 @@ class CDNEmojiSource(BaseEmojiSource):
             return stream
         return None
 
+    def get_emoji_image(self, emoji: str, size: int) -> PILImage.Image | None:
+        """Get emoji as a decoded RGBA image resized to a square.
+
+        Decoded images are cached per (emoji, size), so each downloaded PNG
+        is decoded and resized once.
+
+        Args:
+            emoji: The emoji character to fetch.
+            size: Target width and height in pixels.
+
+        Returns:
+            RGBA image of size x size pixels, or None if not found.
+        """
+        key = (emoji, size)
+        img = self._image_cache.get(key)
+        if img is None:
+            img = super().get_emoji_image(emoji, size)
+            if img is not None:
+                self._image_cache[key] = img
+        return img
+
     def _build_url(self, emoji: str) -> str:
         """Build URL for emoji image.
 
@@ -264,11 +396,21 @@ class NotoColorEmojiSource(BaseEmojiSource):
     Note:
         NotoColorEmoji is a bitmap font that only works correctly
         at the specific size defined in NOTO_COLOR_EMOJI_FONT_SIZE.
+
+        Only the render canvas pool, which is shared by all instances, is
+        thread-safe. The rendered and resized image caches belong to each
+        instance and are filled without locking, so don't share one
+        instance between threads.
     """
 
+    _canvas_pool: ClassVar[list[PILImage.Image]] = []
+    _canvas_pool_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self) -> None:
         """Initialize the local font source."""
         self._cache: dict[str, BytesIO] = {}
+        self._rendered: dict[str, PILImage.Image | None] = {}
+        self._image_cache: dict[tuple[str, int], PILImage.Image] = {}
         self._font: PILImageFont.FreeTypeFont | PILImageFont.ImageFont | None = None
         self._font_loaded: bool = False
 
@@ -295,37 +437,40 @@ class NotoColorEmojiSource(BaseEmojiSource):
             pass
         return False
 
-    def get_emoji(self, emoji: str) -> BytesIO | None:
-        """Render emoji from font and return as image stream.
+    def _render(self, emoji: str) -> PILImage.Image | None:
+        """Render emoji from font, cropped to content.
+
+        Rendered images (and failures) are cached so FreeType runs at most
+        once per emoji. The cache is per instance and not locked; only the
+        canvas pool is safe to use from several threads.
 
         Args:
             emoji: The emoji character to render.
 
         Returns:
-            BytesIO stream with PNG image data, or None on error.
+            RGBA image of the emoji, or None on error.
         """
-        if emoji in self._cache:
-            stream = self._cache[emoji]
-            stream.seek(0)
-            return stream
+        if emoji in self._rendered:
+            return self._rendered[emoji]
 
         if not self._load_font():
             return None
 
+        img = None
+        canvas = self._acquire_canvas()
         try:
-            from PIL import Image, ImageDraw
+            from PIL import ImageDraw
 
-            # Create transparent canvas with padding
             padding = NOTO_COLOR_EMOJI_PADDING
-            img_size = NOTO_COLOR_EMOJI_FONT_SIZE + padding * 2
-            img = Image.new("RGBA", (img_size, img_size), (0, 0, 0, 0))
-            draw = ImageDraw.Draw(img)
+            img_size = canvas.width
+            draw = ImageDraw.Draw(canvas)
 
             # Render emoji with embedded color
             draw.text((padding, padding), emoji, font=self._font, embedded_color=True)
 
-            # Crop to content with margin
-            bbox = img.getbbox()
+            # Crop to content with margin; crop() copies, so the canvas
+            # can go back to the pool afterwards.
+            bbox = canvas.getbbox()
             if bbox:
                 margin = NOTO_COLOR_EMOJI_CROP_MARGIN
                 x1, y1, x2, y2 = bbox
@@ -333,17 +478,234 @@ class NotoColorEmojiSource(BaseEmojiSource):
                 y1 = max(0, y1 - margin)
                 x2 = min(img_size, x2 + margin)
                 y2 = min(img_size, y2 + margin)
-                img = img.crop((x1, y1, x2, y2))
+                img = canvas.crop((x1, y1, x2, y2))
+            else:
+                img = canvas.copy()
+        except Exception:
+            img = None
+        finally:
+            self._release_canvas(canvas)
 
-            # Save to BytesIO
-            stream = BytesIO()
-            img.save(stream, format="PNG")
-            stream.seek(0)
+        self._rendered[emoji] = img
+        return img
+
+    @classmethod
+    def _acquire_canvas(cls) -> PILImage.Image:
+        """Take a cleared transparent render canvas from the pool."""
+        from PIL import Image, ImageDraw
+
+        img_size = NOTO_COLOR_EMOJI_FONT_SIZE + NOTO_COLOR_EMOJI_PADDING * 2
+        with cls._canvas_pool_lock:
+            canvas = cls._canvas_pool.pop() if cls._canvas_pool else None
 
-            # Cache the result
-            self._cache[emoji] = BytesIO(stream.read())
+        if canvas is None:
+            return Image.new("RGBA", (img_size, img_size), (0, 0, 0, 0))
+
+        ImageDraw.Draw(canvas).rectangle((0, 0, img_size, img_size), fill=(0, 0, 0, 0))
+        return canvas
+
+    @classmethod
+    def _release_canvas(cls, canvas: PILImage.Image) -> None:
+        """Return a render canvas to the pool."""
+        with cls._canvas_pool_lock:
+            if len(cls._canvas_pool) < NOTO_COLOR_EMOJI_CANVAS_POOL_SIZE:
+                cls._canvas_pool.append(canvas)
+
+    def get_emoji(self, emoji: str) -> BytesIO | None:
+        """Render emoji from font and return as image stream.
+
+        Args:
+            emoji: The emoji character to render.
+
+        Returns:
+            BytesIO stream with PNG image data, or None on error.
+        """
+        if emoji in self._cache:
+            stream = self._cache[emoji]
             stream.seek(0)
             return stream
 
+        img = self._render(emoji)
+        if img is None:
+            return None
+
+        try:
+            stream = BytesIO()
+            img.save(stream, format="PNG")
         except Exception:
             return None
+
+        self._cache[emoji] = stream
+        stream.seek(0)
+        return stream
+
+    def get_emoji_image(self, emoji: str, size: int) -> PILImage.Image | None:
+        """Get emoji as a decoded RGBA image resized to a square.
+
+        Unlike get_emoji(), this never round-trips through PNG bytes, and
+        resized results are cached per (emoji, size) so repeated emojis
+        cost no pixel work at all.
+
+        Args:
+            emoji: The emoji character to render.
+            size: Target width and height in pixels.
+
+        Returns:
+            RGBA image of size x size pixels, or None on error.
+        """
+        key = (emoji, size)
+        cached = self._image_cache.get(key)
+        if cached is not None:
+            return cached
+
+        img = self._render(emoji)
+        if img is None:
+            return None
+
+        try:
+            resized = resize_emoji_image(img, size)
+        except Exception:
+            return None
+
+        self._image_cache[key] = resized
+        return resized
+
+
+# =============================================================================
+# Sprite Atlas Source
+# =============================================================================
+
+
+class SpriteAtlasEmojiSource(BaseEmojiSource):
+    """Emoji source serving decoded tiles at one canonical size.
+
+    Wraps another source (Twemoji by default). Each emoji is fetched from
+    it once, decoded and resized to the atlas size. Tiles are kept in memory;
+    with persist=True they are also saved to the user cache directory, so
+    later processes skip per-emoji HTTP requests entirely.
+
+    Sizes larger than the atlas size are fetched from the wrapped source
+    directly rather than upscaled from a tile.
+
+    Example:
+        >>> source = SpriteAtlasEmojiSource(persist=True)
+        >>> exporter = ImageExporter(console, emoji_source=source)
+    """
+
+    def __init__(
+        self,
+        source: BaseEmojiSource | None = None,
+        *,
+        atlas_size: int = EMOJI_ATLAS_SIZE_PX,
+        cache_dir: str | Path | None = None,
+        persist: bool = False,
+    ) -> None:
+        """Initialize the atlas source.
+
+        Args:
+            source: Source used to fetch missing tiles. Defaults to TwemojiSource.
+            atlas_size: Canonical tile size in pixels.
+            cache_dir: Directory for persisted tiles. Defaults to the user
+                cache directory, in a subdirectory per wrapped source style.
+            persist: If True, save tiles to cache_dir and load them from there
+                in later processes. By default tiles are only kept in memory
+                and nothing is written to disk.
+        """
+        self._source = source if source is not None else TwemojiSource()
+        self.atlas_size = atlas_size
+        self._persist = persist
+        if cache_dir is None:
+            style = getattr(self._source, "STYLE", "") or type(self._source).__name__.lower()
+            cache_dir = _user_cache_dir() / EMOJI_ATLAS_CACHE_SUBDIR / style / str(atlas_size)
+        self._cache_dir = Path(cache_dir)
+        self._atlas: dict[str, PILImage.Image | None] = {}
+        self._resized: dict[tuple[str, int], PILImage.Image] = {}
+
+    def _tile_path(self, emoji: str) -> Path:
+        """Get the on-disk path for an emoji tile."""
+        return self._cache_dir / f"{emoji_to_hex_sequence(emoji)}.png"
+
+    def _load_tile(self, emoji: str) -> PILImage.Image | None:
+        """Load a tile from disk or fetch it from the wrapped source."""
+        from PIL import Image
+
+        path = self._tile_path(emoji)
+        if self._persist and path.exists():
+            try:
+                with Image.open(path) as img:
+                    return img.convert("RGBA")
+            except OSError:
+                pass
+
+        stream = self._source.get_emoji(emoji)
+        if stream is None:
+            return None
+
+        try:
+            with Image.open(stream) as img:
+                tile = resize_emoji_image(img.convert("RGBA"), self.atlas_size)
+        except Exception:
+            return None
+
+        if self._persist:
+            try:
+                self._cache_dir.mkdir(parents=True, exist_ok=True)
+                tile.save(path, format="PNG")
+            except OSError:
+                pass
+        return tile
+
+    def _tile(self, emoji: str) -> PILImage.Image | None:
+        """Get the canonical-size tile for an emoji."""
+        if emoji not in self._atlas:
+            self._atlas[emoji] = self._load_tile(emoji)
+        return self._atlas[emoji]
+
+    def get_emoji(self, emoji: str) -> BytesIO | None:
+        """Get the emoji tile as a PNG stream.
+
+        Args:
+            emoji: The emoji character to fetch.
+
+        Returns:
+            BytesIO stream with PNG image data, or None if not found.
+        """
+        tile = self._tile(emoji)
+        if tile is None:
+            return None
+        stream = BytesIO()
+        tile.save(stream, format="PNG")
+        stream.seek(0)
+        return stream
+
+    def get_emoji_image(self, emoji: str, size: int) -> PILImage.Image | None:
+        """Get emoji as a decoded RGBA image resized to a square.
+
+        Args:
+            emoji: The emoji character to fetch.
+            size: Target width and height in pixels.
+
+        Returns:
+            RGBA image of size x size pixels, or None if not found or the
+            image can't be decoded or resized.
+        """
+        key = (emoji, size)
+        resized = self._resized.get(key)
+        if resized is not None:
+            return resized
+
+        if size > self.atlas_size:
+            # Upscaling a tile would blur it; ask the wrapped source instead
+            resized = self._source.get_emoji_image(emoji, size)
+        else:
+            tile = self._tile(emoji)
+            if tile is None or size == self.atlas_size:
+                return tile
+            try:
+                resized = resize_emoji_image(tile, size)
+            except Exception:
+                return None
+
+        if resized is not None:
+            self._resized[key] = resized
+        return resized
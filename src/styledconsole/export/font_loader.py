@@ -21,7 +21,6 @@ from .config import (
     FONT_MEASURE_CHAR,
     FONT_NAMES_EMOJI,
     FONT_NAMES_MONOSPACE,
-    TEMP_IMAGE_SIZE,
 )
 
 if TYPE_CHECKING:
@@ -308,20 +307,17 @@ class FontLoader:
             self.fallback_font = self._try_load_font(image_font_module, path, font_size)
 
     def _calculate_char_dimensions(self) -> None:
-        """Calculate character width and height for the loaded font."""
-        from PIL import Image, ImageDraw
-
-        temp_img = Image.new("RGB", TEMP_IMAGE_SIZE)
-        draw = ImageDraw.Draw(temp_img)
+        """Calculate character width and height for the loaded font.
 
+        Measured with the font's own metrics, so no scratch image is needed.
+        """
         assert self.font is not None
 
+        bbox = self.font.getbbox(FONT_MEASURE_CHAR)
         try:
             self.char_width = int(self.font.getlength(FONT_MEASURE_CHAR))
         except AttributeError:
-            bbox = draw.textbbox((0, 0), FONT_MEASURE_CHAR, font=self.font)
             self.char_width = int(bbox[2] - bbox[0])
 
-        bbox = draw.textbbox((0, 0), FONT_MEASURE_CHAR, font=self.font)
         char_height = bbox[3] - bbox[1]
         self.char_height = char_height * self._theme.line_height
@@ -6,6 +6,7 @@ with consistent margins, including support for animation frames.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -18,6 +19,28 @@ __all__ = [
 ]
 
 
+@lru_cache(maxsize=16)
+def _background_lut(background_color: str) -> tuple[int, ...]:
+    """Build an RGB point() table that maps background channel values to 0.
+
+    Every other value maps to 255, so after Image.point() a pixel is black
+    exactly when it matches the background on all three channels.
+    """
+    from PIL import ImageColor
+
+    background = ImageColor.getrgb(background_color)[:3]
+    return tuple(0 if value == channel else 255 for channel in background for value in range(256))
+
+
+def _content_mask(img: PILImage.Image, background_color: str) -> PILImage.Image:
+    """Get an RGB mask that is black exactly where the image shows the background."""
+    # A single lookup-table pass marks non-background pixels, without
+    # allocating a background image or a difference image.
+    # Rendered frames are already RGB; converting would only copy them
+    src = img if img.mode == "RGB" else img.convert("RGB")
+    return src.point(_background_lut(background_color))
+
+
 def get_content_bbox(
     img: PILImage.Image,
     background_color: str,
@@ -31,11 +54,7 @@ def get_content_bbox(
     Returns:
         Bounding box tuple (x1, y1, x2, y2) or None if image is entirely background.
     """
-    from PIL import Image, ImageChops
-
-    bg = Image.new("RGB", img.size, background_color)
-    diff = ImageChops.difference(img.convert("RGB"), bg)
-    return diff.getbbox()
+    return _content_mask(img, background_color).getbbox()
 
 
 def auto_crop(
@@ -72,31 +91,25 @@ def auto_crop(
     return img.crop((x1, y1, x2, y2))
 
 
-def auto_crop_frames(
+def _frames_content_bbox(
     frames: list[PILImage.Image],
     background_color: str,
-    margin: int = 20,
-) -> list[PILImage.Image]:
-    """Auto-crop multiple frames to a common bounding box.
-
-    Calculates the union of all content bounding boxes across frames,
-    then crops all frames to that same area. This prevents "jumping"
-    in animations.
+) -> tuple[int, int, int, int] | None:
+    """Get the union bounding box of non-background content across frames."""
+    from PIL import ImageChops
 
-    Args:
-        frames: List of PIL Images to crop.
-        background_color: Background color to detect (hex string).
-        margin: Margin in pixels around content. Defaults to 20.
+    # Repeated frame objects cannot change the union, so measure each once
+    frames = list({id(frame): frame for frame in frames}.values())
 
-    Returns:
-        List of cropped PIL Images, all with identical dimensions.
-    """
-    if not frames:
-        return frames
+    if all(frame.size == frames[0].size for frame in frames):
+        # Fold every frame's content mask into one union mask, then measure
+        # it once, instead of computing and merging a bounding box per frame.
+        union_mask = _content_mask(frames[0], background_color)
+        for frame in frames[1:]:
+            union_mask = ImageChops.lighter(union_mask, _content_mask(frame, background_color))
+        return union_mask.getbbox()
 
-    # Calculate union of all bounding boxes
     union_bbox: tuple[int, int, int, int] | None = None
-
     for frame in frames:
         bbox = get_content_bbox(frame, background_color)
         if bbox is None:
@@ -112,7 +125,32 @@ def auto_crop_frames(
                 max(union_bbox[2], bbox[2]),
                 max(union_bbox[3], bbox[3]),
             )
+    return union_bbox
+
+
+def auto_crop_frames(
+    frames: list[PILImage.Image],
+    background_color: str,
+    margin: int = 20,
+) -> list[PILImage.Image]:
+    """Auto-crop multiple frames to a common bounding box.
+
+    Calculates the union of all content bounding boxes across frames,
+    then crops all frames to that same area. This prevents "jumping"
+    in animations.
 
+    Args:
+        frames: List of PIL Images to crop.
+        background_color: Background color to detect (hex string).
+        margin: Margin in pixels around content. Defaults to 20.
+
+    Returns:
+        List of cropped PIL Images, all with identical dimensions.
+    """
+    if not frames:
+        return frames
+
+    union_bbox = _frames_content_bbox(frames, background_color)
     if union_bbox is None:
         # All frames are entirely background
         return frames
@@ -124,5 +162,13 @@ def auto_crop_frames(
     x2 = min(frames[0].width, x2 + margin)
     y2 = min(frames[0].height, y2 + margin)
 
-    # Crop all frames to the same bbox
-    return [frame.crop((x1, y1, x2, y2)) for frame in frames]
+    # Crop all frames to the same bbox; repeated frame objects (identical
+    # captures share one image) are cropped once and keep sharing storage.
+    crops: dict[int, PILImage.Image] = {}
+    cropped = []
+    for frame in frames:
+        crop = crops.get(id(frame))
+        if crop is None:
+            crop = crops[id(frame)] = frame.crop((x1, y1, x2, y2))
+        cropped.append(crop)
+    return cropped
@@ -14,12 +14,25 @@ Requires: pip install styledconsole[image] (or Pillow>=10.0.0)
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import math
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from rich.segment import Segment as RichSegment
+
+from styledconsole.utils.color import RGBColor, parse_color
+
 # Re-export theme classes for convenience
 from .config import (
+    GIF_MAX_COLORS,
+    GLYPH_CACHE_SIZE,
+    LAYOUT_CACHE_SIZE,
     TEXT_DECORATION_OVERLINE_OFFSET,
     TEXT_DECORATION_THICKNESS_DIVISOR,
     TEXT_DECORATION_UNDERLINE_OFFSET,
@@ -36,6 +49,7 @@ from .image_theme import (
 if TYPE_CHECKING:
     from PIL import Image as PILImage
     from PIL import ImageFont as PILImageFont
+    from rich.color import Color as RichColor
     from rich.console import Console as RichConsole
     from rich.segment import Segment
 
@@ -43,6 +57,61 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("styledconsole.export.image_exporter")
 
+# Braille patterns occupy the Unicode block U+2800 to U+28FF
+_BRAILLE_CHARS = frozenset(map(chr, range(0x2800, 0x2900)))
+
+
+@lru_cache(maxsize=1024)
+def _color_to_rgb(color: RichColor) -> RGBColor:
+    """Convert a Rich color to an RGB tuple, memoized per color."""
+    triplet = color.get_truecolor()
+    return (triplet.red, triplet.green, triplet.blue)
+
+
+def _apply_dim_color(color: RGBColor) -> RGBColor:
+    """Dim an RGB color to half brightness (same result as apply_dim)."""
+    r, g, b = color
+    return (r >> 1, g >> 1, b >> 1)
+
+
+def _frame_digest(img: PILImage.Image) -> bytes:
+    """Hash the mode, size and pixels of an image.
+
+    Used to spot pixel-identical captures; the shape is hashed too so equal
+    byte strings from differently sized frames never collide.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((img.mode, img.size)).encode())
+    digest.update(img.tobytes())
+    return digest.digest()
+
+
+def _merge_repeated_frames(
+    frames: list[PILImage.Image], durations: list[int]
+) -> tuple[list[PILImage.Image], list[int]]:
+    """Collapse runs of identical consecutive frames into one longer frame.
+
+    capture_frame() stores pixel-identical captures as the same image object,
+    so repeats are found by identity without comparing pixels.
+
+    Args:
+        frames: Captured frames in order.
+        durations: Display time of each frame in milliseconds.
+
+    Returns:
+        Tuple of (frames, durations) with each run replaced by its first frame
+        shown for the run's total duration.
+    """
+    merged_frames: list[PILImage.Image] = []
+    merged_durations: list[int] = []
+    for frame, duration in zip(frames, durations, strict=True):
+        if merged_frames and frame is merged_frames[-1]:
+            merged_durations[-1] += duration
+        else:
+            merged_frames.append(frame)
+            merged_durations.append(duration)
+    return merged_frames, merged_durations
+
 
 class ImageExporter:
     """Export console output to image formats using Pillow.
@@ -80,7 +149,22 @@ class ImageExporter:
         self._emoji_source = emoji_source
         self._render_emojis = render_emojis
         self._font_loader = FontLoader(self._theme, font_path)
+        # Theme colors parsed once; Pillow takes RGB tuples without re-parsing
+        self._background_rgb = parse_color(self._theme.background)
+        self._foreground_rgb = parse_color(self._theme.foreground)
         self._frames: list[PILImage.Image] = []
+        # Per-frame display time in ms; None means 1000 // fps at save time
+        self._frame_durations: list[int | None] = []
+        self._frame_pool: dict[bytes, PILImage.Image] = {}
+        self._glyph_cache: OrderedDict[tuple, PILImage.Image] = OrderedDict()
+        self._pillow_modules: tuple[Any, Any, Any] | None = None
+        self._width_calculator: Any = None
+        self._grid_rows: tuple[int, range] | None = None
+        self._layout_cache: OrderedDict[tuple, list] = OrderedDict()
+        self._width_cache: OrderedDict[str, int] = OrderedDict()
+        self._frame_buffer: PILImage.Image | None = None
+        self._frame_draw: Any = None
+        self._frame_emoji_renderer: Any = None
 
     # -------------------------------------------------------------------------
     # Pillow imports
@@ -89,16 +173,23 @@ class ImageExporter:
     def _lazy_import_pillow(self) -> tuple:
         """Lazy import Pillow modules.
 
+        The modules are resolved once and kept on the exporter, so hot paths
+        do not go through the import machinery on every call.
+
         Returns:
             Tuple of (Image, ImageDraw, ImageFont) modules.
 
         Raises:
             ImportError: If Pillow is not installed.
         """
+        if self._pillow_modules is not None:
+            return self._pillow_modules
+
         try:
             from PIL import Image, ImageDraw, ImageFont
 
-            return Image, ImageDraw, ImageFont
+            self._pillow_modules = (Image, ImageDraw, ImageFont)
+            return self._pillow_modules
         except ImportError as e:
             raise ImportError(
                 "Image export requires Pillow. Install with: pip install styledconsole[image]"
@@ -119,10 +210,7 @@ class ImageExporter:
         Returns:
             True if character is a Braille pattern.
         """
-        if len(char) != 1:
-            return False
-        code = ord(char)
-        return 0x2800 <= code <= 0x28FF
+        return char in _BRAILLE_CHARS
 
     def _get_font_for_char(
         self, char: str, text_style: TextStyle | None = None
@@ -140,10 +228,22 @@ class ImageExporter:
             Font to use for rendering the character.
         """
         # Braille characters always use fallback font
-        if self._is_braille(char) and self._font_loader.fallback_font is not None:
+        if char in _BRAILLE_CHARS and self._font_loader.fallback_font is not None:
             return self._font_loader.fallback_font
 
-        # Select font variant based on style
+        return self._get_styled_font(text_style)
+
+    def _get_styled_font(
+        self, text_style: TextStyle | None = None
+    ) -> PILImageFont.FreeTypeFont | PILImageFont.ImageFont | None:
+        """Get the primary font variant for a text style.
+
+        Args:
+            text_style: Text style properties.
+
+        Returns:
+            Bold/italic variant if text_style requests one, else the regular font.
+        """
         if self._font_loader.font_family and text_style:
             return self._font_loader.font_family.get_font(text_style.bold, text_style.italic)
 
@@ -153,20 +253,19 @@ class ImageExporter:
     # Color utilities
     # -------------------------------------------------------------------------
 
-    def _get_color_hex(self, color: Any) -> str | None:
-        """Convert Rich color to hex string.
+    def _get_color_rgb(self, color: Any) -> RGBColor | None:
+        """Convert Rich color to an RGB tuple.
 
         Args:
             color: Rich Color object or None.
 
         Returns:
-            Hex color string like "#RRGGBB" or None.
+            RGB tuple like (255, 0, 0) or None.
         """
         if color is None:
             return None
 
-        triplet = color.get_truecolor()
-        return f"#{triplet.red:02x}{triplet.green:02x}{triplet.blue:02x}"
+        return _color_to_rgb(color)
 
     # -------------------------------------------------------------------------
     # Text rendering
@@ -178,54 +277,190 @@ class ImageExporter:
         x: int,
         y: int,
         text: str,
-        color: str,
+        color: RGBColor,
         text_style: TextStyle | None = None,
     ) -> None:
-        """Render text character by character, using fallback font for Braille.
+        """Render text in same-font runs, using fallback font for Braille.
+
+        Consecutive graphemes that share a font are grouped into a run. A run
+        whose font advance lands exactly on the cell grid is drawn with a
+        single draw.text() call (plus one line per decoration); anything else
+        (wide or combined graphemes, non-monospace fallbacks) is placed cell
+        by cell from a per-exporter cache of glyph coverage masks.
 
         Args:
             draw: PIL ImageDraw instance.
             x: Starting x position.
             y: Starting y position.
             text: Text to render.
-            color: Text color (hex string).
+            color: Text color as an RGB tuple.
             text_style: Text style properties (bold, italic, underline, etc.).
         """
         current_x = x
-        actual_color = color
-        if text_style and text_style.dim:
-            from styledconsole.utils.color import apply_dim
+        actual_color = _apply_dim_color(color) if text_style and text_style.dim else color
+
+        char_width = self._font_loader.char_width
+        char_height = self._font_loader.char_height
+        pad = self._glyph_mask_padding()
+        decorated = bool(
+            text_style and (text_style.underline or text_style.strike or text_style.overline)
+        )
+
+        # Fast path: printable ASCII never needs the Braille fallback font, so
+        # the whole text is one run in the styled font.
+        if text.isascii() and text.isprintable() and text:
+            font = self._get_styled_font(text_style)
+            text_pixel_width = len(text) * char_width
+            if self._is_grid_aligned(text, font, text_pixel_width):
+                draw.text((x, y), text, font=font, fill=actual_color)
+                if decorated:
+                    self._draw_char_decorations(
+                        draw, x, y, text_pixel_width, char_height, text_style, actual_color
+                    )
+                return
+
+        for font, run, cells in self._get_text_layout(text, text_style):
+            if cells is None:
+                run_pixel_width = len(run) * char_width
+                draw.text((current_x, y), run, font=font, fill=actual_color)
+                if decorated:
+                    self._draw_char_decorations(
+                        draw, current_x, y, run_pixel_width, char_height, text_style, actual_color
+                    )
+                current_x += run_pixel_width
+                continue
+
+            for grapheme, grapheme_pixel_width in cells:
+                mask = self._get_glyph_mask(grapheme, font, grapheme_pixel_width, text_style)
+                draw.bitmap((current_x - pad, y - pad), mask, fill=actual_color)
+
+                current_x += grapheme_pixel_width
+
+    def _get_text_layout(
+        self, text: str, text_style: TextStyle | None
+    ) -> list[tuple[Any, str, tuple[tuple[str, int], ...] | None]]:
+        """Get the font runs for a text, computing them on first use.
+
+        Layouts depend only on the text and the font variant, so they are
+        cached per exporter and shared by every frame that repeats a segment.
+
+        Args:
+            text: Text to lay out.
+            text_style: Text style properties (bold/italic select the font).
 
-            # apply_dim returns None only if input is None, but here color is guaranteed str
-            dimmed = apply_dim(color)
-            if dimmed:
-                actual_color = str(dimmed)
+        Returns:
+            List of (font, run, cells) tuples. cells is None for runs that can
+            be drawn with a single draw.text() call, otherwise a tuple of
+            (grapheme, pixel width) pairs to place cell by cell.
+        """
+        key = (text, text_style.bold, text_style.italic) if text_style else (text,)
+        cache = self._layout_cache
+        layout = cache.get(key)
+        if layout is not None:
+            cache.move_to_end(key)
+            return layout
 
         from styledconsole.utils.text import split_graphemes, visual_width
 
         char_width = self._font_loader.char_width
+        layout = []
+        runs = groupby(
+            split_graphemes(text),
+            key=lambda grapheme: self._get_font_for_char(grapheme, text_style),
+        )
+        for font, group in runs:
+            graphemes = list(group)
+            run = "".join(graphemes)
+            if len(graphemes) == len(run) and self._is_grid_aligned(
+                run, font, len(run) * char_width
+            ):
+                layout.append((font, run, None))
+            else:
+                # Place by grapheme clusters using visual_width which respects the
+                # render target context ("image" mode = consistent emoji widths).
+                cells = tuple((g, visual_width(g) * char_width) for g in graphemes)
+                layout.append((font, run, cells))
+
+        cache[key] = layout
+        if len(cache) > LAYOUT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return layout
+
+    def _is_grid_aligned(self, run: str, font: Any, run_pixel_width: int) -> bool:
+        """Check whether drawing a run in one call keeps every glyph on its cell.
+
+        Args:
+            run: Run of single-codepoint graphemes.
+            font: Font the run is drawn with.
+            run_pixel_width: Width of the run's cells in pixels.
+
+        Returns:
+            True if each character is one cell wide and the font's unrounded
+            advance for the whole run equals the cell width, so fractional
+            advances can't drift glyphs off their cells.
+        """
+        from styledconsole.utils.text import visual_width
+
+        if visual_width(run) != len(run):
+            return False
+        try:
+            return font.getlength(run) == run_pixel_width
+        except Exception:
+            return False
+
+    def _glyph_mask_padding(self) -> int:
+        """Get the margin around glyph masks that absorbs glyph overhang."""
+        return max(1, self._font_loader.char_width)
+
+    def _get_glyph_mask(
+        self,
+        grapheme: str,
+        font: Any,
+        width: int,
+        text_style: TextStyle | None,
+    ) -> PILImage.Image:
+        """Get the coverage mask for a grapheme, rendering it on first use.
+
+        The mask holds the glyph and its decorations as an "L" image with a
+        padding margin on every side. Drawing it with ImageDraw.bitmap() and
+        the text color blends exactly like ImageDraw.text(), so the color is
+        not part of the cache key and one mask serves every color.
+
+        Args:
+            grapheme: Grapheme cluster to render.
+            font: Font to render with.
+            width: Cell width of the grapheme in pixels.
+            text_style: Text style properties (decorations are baked in).
+
+        Returns:
+            Cached "L" mode mask image.
+        """
+        decorations = (
+            (text_style.underline, text_style.strike, text_style.overline)
+            if text_style
+            else (False, False, False)
+        )
+        key = (grapheme, id(font), width, decorations)
+        cache = self._glyph_cache
+        mask = cache.get(key)
+        if mask is not None:
+            cache.move_to_end(key)
+            return mask
+
+        pil_image, pil_draw, _ = self._lazy_import_pillow()
         char_height = self._font_loader.char_height
+        pad = self._glyph_mask_padding()
 
-        # Render by grapheme clusters using visual_width which respects the
-        # render target context ("image" mode = consistent emoji widths).
-        for grapheme in split_graphemes(text):
-            font = self._get_font_for_char(grapheme, text_style)
-            draw.text((current_x, y), grapheme, font=font, fill=actual_color)
-
-            grapheme_pixel_width = visual_width(grapheme) * char_width
-
-            if text_style:
-                self._draw_char_decorations(
-                    draw,
-                    current_x,
-                    y,
-                    grapheme_pixel_width,
-                    char_height,
-                    text_style,
-                    actual_color,
-                )
+        mask = pil_image.new("L", (width + pad * 2, math.ceil(char_height) + pad * 2), 0)
+        mask_draw = pil_draw.Draw(mask)
+        mask_draw.text((pad, pad), grapheme, font=font, fill=255)
+        if text_style and any(decorations):
+            self._draw_char_decorations(mask_draw, pad, pad, width, char_height, text_style, 255)
 
-            current_x += grapheme_pixel_width
+        cache[key] = mask
+        if len(cache) > GLYPH_CACHE_SIZE:
+            cache.popitem(last=False)
+        return mask
 
     def _draw_char_decorations(
         self,
@@ -235,7 +470,7 @@ class ImageExporter:
         width: int,
         height: float,
         text_style: TextStyle,
-        color: str,
+        color: RGBColor | int,
     ) -> None:
         """Draw text decorations (underline, strikethrough, overline).
 
@@ -305,8 +540,6 @@ class ImageExporter:
             segment: Rich Segment to split.
             lines: List of lines to append to.
         """
-        from rich.segment import Segment as RichSegment
-
         parts = segment.text.split("\n")
         for i, part in enumerate(parts):
             if part:
@@ -318,9 +551,13 @@ class ImageExporter:
     # Dimension calculation
     # -------------------------------------------------------------------------
 
-    def _calculate_dimensions(self) -> tuple[int, int]:
+    def _calculate_dimensions(self, lines: list[list[Segment]] | None = None) -> tuple[int, int]:
         """Calculate image dimensions based on recorded content or fixed size.
 
+        Args:
+            lines: Segments organized by line, if the caller already has them.
+                Defaults to reading the console record buffer.
+
         Returns:
             Tuple of (width, height) in pixels.
         """
@@ -334,12 +571,13 @@ class ImageExporter:
             height = int(self._theme.padding * 2 + rows * char_height)
             return width, height
 
-        lines = self._get_segments_by_line()
+        if lines is None:
+            lines = self._get_segments_by_line()
 
         if not lines:
             return self._get_minimum_dimensions()
 
-        width_calculator = self._create_width_calculator()
+        width_calculator = self._get_width_calculator()
         max_width = self._calculate_max_line_width(lines, width_calculator)
 
         width = int(self._theme.padding * 2 + max_width)
@@ -360,6 +598,16 @@ class ImageExporter:
             int(self._theme.padding * 2 + char_height),
         )
 
+    def _get_width_calculator(self) -> Any:
+        """Get the emoji-aware width calculator, creating it on first use.
+
+        Returns:
+            EmojiRenderer instance or None.
+        """
+        if self._width_calculator is None:
+            self._width_calculator = self._create_width_calculator()
+        return self._width_calculator
+
     def _create_width_calculator(self) -> Any:
         """Create emoji renderer for width calculation if enabled.
 
@@ -370,11 +618,11 @@ class ImageExporter:
             return None
 
         try:
-            from PIL import Image as PILImage
+            pil_image, _, _ = self._lazy_import_pillow()
 
             from .emoji_renderer import EmojiRenderer, NotoColorEmojiSource
 
-            temp_img = PILImage.new("RGB", (1, 1))
+            temp_img = pil_image.new("RGB", (1, 1))
             source = self._emoji_source or NotoColorEmojiSource()
             return EmojiRenderer(
                 image=temp_img,
@@ -395,20 +643,40 @@ class ImageExporter:
         Returns:
             Maximum width in pixels.
         """
-        font = self._font_loader.font
         max_width = 0
 
         for line in lines:
-            line_width = 0
-            for seg in line:
-                if width_calculator:
-                    line_width += width_calculator.getwidth(seg.text, font=font)
-                else:
-                    line_width += self._measure_text_width_cells(seg.text)
+            line_width = sum(self._get_segment_width(seg.text, width_calculator) for seg in line)
             max_width = max(max_width, line_width)
 
         return max_width
 
+    def _get_segment_width(self, text: str, width_calculator: Any) -> int:
+        """Get the pixel width of a segment's text, cached across frames.
+
+        Args:
+            text: Segment text.
+            width_calculator: EmojiRenderer for width calculation or None.
+
+        Returns:
+            Width in pixels.
+        """
+        cache = self._width_cache
+        width = cache.get(text)
+        if width is not None:
+            cache.move_to_end(text)
+            return width
+
+        if width_calculator:
+            width = width_calculator.getwidth(text, font=self._font_loader.font)
+        else:
+            width = self._measure_text_width_cells(text)
+
+        cache[text] = width
+        if len(cache) > LAYOUT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return width
+
     # -------------------------------------------------------------------------
     # Frame rendering
     # -------------------------------------------------------------------------
@@ -416,28 +684,26 @@ class ImageExporter:
     def _render_frame(self) -> PILImage.Image:
         """Render current console output to PIL Image.
 
+        The image is a buffer reused by the next render; callers that keep it
+        beyond that (like capture_frame) must copy it.
+
         Returns:
             PIL Image with rendered console output.
         """
-        pil_image, pil_draw, pil_font = self._lazy_import_pillow()
+        _, _, pil_font = self._lazy_import_pillow()
 
         # Load font if not already loaded
         if self._font_loader.font is None:
             self._font_loader.load(pil_font)
 
-        # Calculate dimensions
-        width, height = self._calculate_dimensions()
-
-        # Create image with background color
-        img = pil_image.new("RGB", (width, height), self._theme.background)
-        draw = pil_draw.Draw(img)
+        # Get segments organized by line once; dimensions and drawing share them
+        lines = self._get_segments_by_line()
 
-        # Set up emoji renderer if enabled
-        emoji_renderer = self._create_emoji_renderer(img)
+        # Calculate dimensions
+        width, height = self._calculate_dimensions(lines)
 
-        # Get segments organized by line and render
-        lines = self._get_segments_by_line()
-        self._render_lines(draw, lines, emoji_renderer)
+        img, draw, emoji_renderer = self._get_frame_buffer(width, height)
+        self._render_lines(draw, lines, emoji_renderer, width, height)
 
         # Optional: overlay debug grid showing terminal cell boundaries
         if getattr(self._theme, "debug_grid", False):
@@ -445,6 +711,29 @@ class ImageExporter:
 
         return img
 
+    def _get_frame_buffer(self, width: int, height: int) -> tuple[PILImage.Image, Any, Any]:
+        """Get the frame image cleared to the background color.
+
+        The image, its ImageDraw and its emoji renderer are kept between
+        renders and only recreated when the frame size changes.
+
+        Args:
+            width: Frame width in pixels.
+            height: Frame height in pixels.
+
+        Returns:
+            Tuple of (image, ImageDraw instance, EmojiRenderer or None).
+        """
+        if self._frame_buffer is not None and self._frame_buffer.size == (width, height):
+            self._frame_buffer.paste(self._background_rgb, (0, 0, width, height))
+        else:
+            pil_image, pil_draw, _ = self._lazy_import_pillow()
+            self._frame_buffer = pil_image.new("RGB", (width, height), self._background_rgb)
+            self._frame_draw = pil_draw.Draw(self._frame_buffer)
+            self._frame_emoji_renderer = self._create_emoji_renderer(self._frame_buffer)
+
+        return self._frame_buffer, self._frame_draw, self._frame_emoji_renderer
+
     def _draw_debug_grid(self, draw: Any, width: int, height: int) -> None:
         """Overlay a terminal cell grid for debugging alignment issues."""
         char_width = self._font_loader.char_width
@@ -466,15 +755,7 @@ class ImageExporter:
             every = 1
 
         # Use a dimmed foreground so the grid is visible but not overpowering.
-        grid_color: str = self._theme.foreground
-        try:
-            from styledconsole.utils.color import apply_dim
-
-            dimmed = apply_dim(grid_color)
-            if isinstance(dimmed, str) and dimmed:
-                grid_color = dimmed
-        except Exception:
-            logger.debug("Failed to dim grid color", exc_info=True)
+        grid_color = _apply_dim_color(self._foreground_rgb)
 
         # Vertical lines
         for c in range(0, cols + 1, every):
@@ -513,14 +794,30 @@ class ImageExporter:
         except ImportError:
             return None
 
-    def _render_lines(self, draw: Any, lines: list[list[Segment]], emoji_renderer: Any) -> None:
+    def _render_lines(
+        self,
+        draw: Any,
+        lines: list[list[Segment]],
+        emoji_renderer: Any,
+        width: int | None = None,
+        height: int | None = None,
+    ) -> None:
         """Render all lines to the image.
 
         Args:
             draw: PIL ImageDraw instance.
             lines: List of lines with segments.
             emoji_renderer: EmojiRenderer instance or None.
+            width: Image width, used to skip content past a fixed terminal size.
+            height: Image height, used to skip content past a fixed terminal size.
         """
+        if self._theme.terminal_size is not None and width is not None and height is not None:
+            # Fixed-size frames: rows and their y positions are known up front,
+            # and lines or segments starting outside the image are never drawn.
+            for line, y in zip(lines, self._get_grid_rows(height), strict=False):
+                self._render_line(draw, line, y, emoji_renderer, max_x=width)
+            return
+
         y = self._theme.padding
         char_height = self._font_loader.char_height
 
@@ -528,7 +825,28 @@ class ImageExporter:
             self._render_line(draw, line, y, emoji_renderer)
             y += int(char_height)
 
-    def _render_line(self, draw: Any, line: list[Segment], y: int, emoji_renderer: Any) -> None:
+    def _get_grid_rows(self, height: int) -> range:
+        """Get the y positions of the rows that start inside a fixed-size frame.
+
+        Args:
+            height: Image height in pixels.
+
+        Returns:
+            Range of row y positions, computed once per frame height.
+        """
+        if self._grid_rows is None or self._grid_rows[0] != height:
+            row_height = max(1, int(self._font_loader.char_height))
+            self._grid_rows = (height, range(self._theme.padding, height, row_height))
+        return self._grid_rows[1]
+
+    def _render_line(
+        self,
+        draw: Any,
+        line: list[Segment],
+        y: int,
+        emoji_renderer: Any,
+        max_x: int | None = None,
+    ) -> None:
         """Render a single line to the image.
 
         Args:
@@ -536,41 +854,49 @@ class ImageExporter:
             line: List of segments in the line.
             y: Y position for the line.
             emoji_renderer: EmojiRenderer instance or None.
+            max_x: Stop at the first segment starting at or beyond this x.
         """
         x = self._theme.padding
         char_height = self._font_loader.char_height
         font = self._font_loader.font
 
+        # First pass: lay out segments and resolve their colors
+        placed: list[tuple[int, int, str, RGBColor, RGBColor | None, TextStyle]] = []
         for segment in line:
+            if max_x is not None and x >= max_x:
+                break
             text = segment.text
             style = segment.style
 
             # Get colors and text style
-            fg_color = self._theme.foreground
+            fg_color = self._foreground_rgb
             bg_color = None
             text_style = TextStyle()
 
             if style:
                 if style.color:
-                    fg_color = self._get_color_hex(style.color) or fg_color
+                    fg_color = self._get_color_rgb(style.color) or fg_color
                 if style.bgcolor:
-                    bg_color = self._get_color_hex(style.bgcolor)
+                    bg_color = self._get_color_rgb(style.bgcolor)
                 text_style = TextStyle.from_rich_style(style)
 
             # Calculate text width
-            if emoji_renderer:
-                text_width = emoji_renderer.getwidth(text, font=font)
-            else:
-                text_width = self._measure_text_width_cells(text)
+            text_width = self._get_segment_width(text, emoji_renderer)
+
+            placed.append((x, text_width, text, fg_color, bg_color, text_style))
+            x += text_width
 
-            # Draw background if present
+        # Draw backgrounds, one rectangle per run of adjacent same-color segments
+        for bg_color, group in groupby(placed, key=itemgetter(4)):
             if bg_color:
+                run = list(group)
                 draw.rectangle(
-                    [x, y, x + text_width, y + int(char_height)],
+                    [run[0][0], y, run[-1][0] + run[-1][1], y + int(char_height)],
                     fill=bg_color,
                 )
 
-            # Draw text
+        # Draw text
+        for x, _, text, fg_color, _, text_style in placed:
             if emoji_renderer:
                 emoji_renderer.text(
                     (x, y),
@@ -586,8 +912,6 @@ class ImageExporter:
             else:
                 self._render_text_with_fallback(draw, x, y, text, fg_color, text_style)
 
-            x += text_width
-
     def _measure_text_width_cells(self, text: str) -> int:
         """Measure text width in pixels using visual_width.
 
@@ -603,17 +927,30 @@ class ImageExporter:
     # Animation support
     # -------------------------------------------------------------------------
 
-    def capture_frame(self) -> None:
+    def capture_frame(self, duration: int | None = None) -> None:
         """Capture current console output as a frame for animation.
 
         Call this method after each state change to build an animation.
+        Frames with identical pixels share a single stored image.
+
+        Args:
+            duration: How long to show this frame, in milliseconds. Defaults
+                to the frame interval derived from fps when saving.
         """
-        frame = self._render_frame()
+        rendered = self._render_frame()
+        key = _frame_digest(rendered)
+        frame = self._frame_pool.get(key)
+        if frame is None:
+            # The render buffer is reused, so keep a copy
+            frame = self._frame_pool[key] = rendered.copy()
         self._frames.append(frame)
+        self._frame_durations.append(duration)
 
     def clear_frames(self) -> None:
         """Clear all captured frames."""
         self._frames.clear()
+        self._frame_durations.clear()
+        self._frame_pool.clear()
 
     # -------------------------------------------------------------------------
     # Save methods
@@ -735,18 +1072,27 @@ class ImageExporter:
             do_auto_crop: If True, crop all frames to common bounding box.
             crop_margin: Margin in pixels when do_auto_crop is True.
         """
-        frames = self._frames if self._frames else [self._render_frame()]
-        bg_color = self._theme.background
+        # Render at most once: without captured frames the current output is
+        # the only frame, and it is saved (and cropped) as a static image.
+        if len(self._frames) <= 1:
+            frame = self._frames[0] if self._frames else self._render_frame()
+            self._save_single_frame(path, fmt, frame, quality, do_auto_crop, crop_margin)
+            return
 
-        # Auto-crop all frames to common bounding box
-        if do_auto_crop and len(frames) > 1:
-            frames = auto_crop_frames(frames, bg_color, margin=crop_margin)
+        default_duration = 1000 // fps
+        frames, durations = _merge_repeated_frames(
+            self._frames,
+            [
+                default_duration if duration is None else duration
+                for duration in self._frame_durations
+            ],
+        )
 
-        if len(frames) == 1:
-            self._save_single_frame(path, fmt, frames[0], quality, do_auto_crop, crop_margin)
-            return
+        # Auto-crop all frames to common bounding box
+        if do_auto_crop:
+            frames = auto_crop_frames(frames, self._theme.background, margin=crop_margin)
 
-        self._save_multiple_frames(path, fmt, frames, fps, loop, quality)
+        self._save_multiple_frames(path, fmt, frames, durations, loop, quality)
 
     def _save_single_frame(
         self,
@@ -779,7 +1125,7 @@ class ImageExporter:
         path: str,
         fmt: str,
         frames: list[PILImage.Image],
-        fps: int,
+        durations: list[int],
         loop: int,
         quality: int,
     ) -> None:
@@ -789,23 +1135,62 @@ class ImageExporter:
             path: Output file path.
             fmt: Image format.
             frames: List of frames to save.
-            fps: Frames per second.
+            durations: Display time of each frame in milliseconds.
             loop: Number of loops.
             quality: Quality for WebP.
         """
-        duration = 1000 // fps
-
         save_kwargs: dict[str, Any] = {
             "save_all": True,
             "append_images": frames[1:],
-            "duration": duration,
+            # A single value keeps the encoders on their constant-rate path
+            "duration": durations[0] if len(set(durations)) == 1 else durations,
             "loop": loop,
         }
 
         if fmt == "WEBP":
             save_kwargs["quality"] = quality
+        elif fmt == "GIF":
+            frames = self._quantize_gif_frames(frames)
+            save_kwargs["append_images"] = frames[1:]
 
         frames[0].save(path, fmt, **save_kwargs)
 
+    def _quantize_gif_frames(self, frames: list[PILImage.Image]) -> list[PILImage.Image]:
+        """Map all GIF frames onto one shared palette.
+
+        The palette holds exactly the colors used across all distinct frames,
+        so mapping every frame onto it without dithering is lossless. Pillow
+        would otherwise build an adaptive palette per frame.
+
+        Args:
+            frames: RGB frames to quantize.
+
+        Returns:
+            Palette ("P" mode) frames, one per input frame. When the frames use
+            more than GIF_MAX_COLORS colors in total, the input frames are
+            returned unchanged and Pillow quantizes each one adaptively.
+        """
+        pil_image, _, _ = self._lazy_import_pillow()
+
+        # Identical captures share one image, so scan and map each distinct frame once
+        distinct = list({id(frame): frame for frame in frames}.values())
+        colors: set[tuple[int, ...]] = set()
+        for frame in distinct:
+            frame_colors = frame.getcolors(GIF_MAX_COLORS)
+            if frame_colors is None:
+                return frames
+            colors.update(color for _, color in frame_colors)
+            if len(colors) > GIF_MAX_COLORS:
+                return frames
+
+        palette = pil_image.new("P", (1, 1))
+        palette.putpalette([channel for color in sorted(colors) for channel in color])
+
+        quantized = {
+            id(frame): frame.quantize(palette=palette, dither=pil_image.Dither.NONE)
+            for frame in distinct
+        }
+        return [quantized[id(frame)] for frame in frames]
+
 
 __all__ = ["DEFAULT_THEME", "FontFamily", "ImageExporter", "ImageTheme", "TextStyle"]
@@ -3,11 +3,17 @@
 Provides a grid-based dashboard layout using Console API methods.
 """
 
+from __future__ import annotations
+
+from itertools import zip_longest
 from typing import Any, TypedDict
 
+from rich.table import Table
+from rich.text import Text
 from typing_extensions import NotRequired
 
 from styledconsole.console import Console
+from styledconsole.utils.rich_compat import patched_cell_len
 
 
 class DashboardWidget(TypedDict):
@@ -30,6 +36,28 @@ class DashboardWidget(TypedDict):
     ratio: NotRequired[int]
 
 
+def _render_widget(console: Console, widget: DashboardWidget) -> Text:
+    """Render a single widget as a grid cell."""
+    widget_border_color = widget.get("border_color", "secondary")
+    widget_content = widget["content"]
+
+    # Normalize content to string or list
+    if isinstance(widget_content, (str, list)):
+        # Render widget frame using Console API
+        rendered = console.render_frame(
+            widget_content,
+            title=widget["title"],
+            border="rounded",
+            border_color=widget_border_color,
+            title_color=widget_border_color,
+        )
+        return Text.from_ansi(rendered)
+
+    # For Rich renderables, wrap in a simple text representation
+    # (backwards compatibility for complex content)
+    return Text(str(widget_content))
+
+
 def dashboard(
     title: str,
     widgets: list[DashboardWidget],
@@ -64,59 +92,27 @@ def dashboard(
     if console is None:
         console = Console()
 
-    # Import Rich Table only for grid layout (accessed via console.print pass-through)
-    from rich.table import Table
-    from rich.text import Text
-
-    # Import patched_cell_len from shared utils for emoji width fix
-    from styledconsole.utils.rich_compat import patched_cell_len
-
-    # Render header using Console frame method
-    console.frame(
-        title,
-        border="rounded",
-        border_color=header_color,
-        align="center",
-    )
-
-    # Use patched cell_len context for proper emoji width in grid layout
-    with patched_cell_len():
-        # Create grid for widget layout
-        grid_table = Table.grid(expand=True, padding=1)
-        for _ in range(columns):
-            grid_table.add_column(ratio=1)
-
-        # Render each widget using Console API and collect for grid
-        row_widgets: list[str | Text] = []
-        for widget in widgets:
-            widget_border_color = widget.get("border_color", "secondary")
-            widget_content = widget["content"]
-
-            # Normalize content to string or list
-            if isinstance(widget_content, (str, list)):
-                # Render widget frame using Console API
-                rendered = console.render_frame(
-                    widget_content,
-                    title=widget["title"],
-                    border="rounded",
-                    border_color=widget_border_color,
-                    title_color=widget_border_color,
-                )
-                row_widgets.append(Text.from_ansi(rendered))
-            else:
-                # For Rich renderables, wrap in a simple text representation
-                # (backwards compatibility for complex content)
-                row_widgets.append(Text(str(widget_content)))
-
-            if len(row_widgets) == columns:
-                grid_table.add_row(*row_widgets)
-                row_widgets = []
-
-        # Add remaining widgets if row is incomplete
-        if row_widgets:
-            while len(row_widgets) < columns:
-                row_widgets.append(Text(""))
-            grid_table.add_row(*row_widgets)
-
-        # Print grid using Console's Rich pass-through
-        console.print(grid_table)
+    # Write header and grid with a single flush
+    with console.buffered():
+        # Render header using Console frame method
+        console.frame(
+            title,
+            border="rounded",
+            border_color=header_color,
+            align="center",
+        )
+
+        # Use patched cell_len context for proper emoji width in grid layout
+        with patched_cell_len():
+            # Create grid for widget layout
+            grid_table = Table.grid(expand=True, padding=1)
+            for _ in range(columns):
+                grid_table.add_column(ratio=1)
+
+            # Render each widget using Console API, then lay them out row by row
+            cells = [_render_widget(console, widget) for widget in widgets]
+            for row in zip_longest(*[iter(cells)] * columns, fillvalue=Text("")):
+                grid_table.add_row(*row)
+
+            # Print grid using Console's Rich pass-through
+            console.print(grid_table)
@@ -23,6 +23,25 @@ STATUS_THEME = {
 }
 DEFAULT_STATUS = {"color": "info", "icon": icons.INFORMATION}
 
+# Flattened (color, icon) lookup keyed by both upper- and lower-case status,
+# so common inputs resolve with one dict.get and no upper-cased copy.
+# Icons stay as objects: their text is resolved against the emoji policy
+# only when rendered.
+_STATUS_STYLES: dict[str, tuple[str, Any]] = {
+    key: (str(theme["color"]), theme["icon"])
+    for status, theme in STATUS_THEME.items()
+    for key in (status, status.lower())
+}
+_DEFAULT_STYLE: tuple[str, Any] = (str(DEFAULT_STATUS["color"]), DEFAULT_STATUS["icon"])
+
+
+def _status_style(status: str) -> tuple[str, Any]:
+    """Get the (color, icon) pair for a status, case-insensitively."""
+    style = _STATUS_STYLES.get(status)
+    if style is None:
+        style = _STATUS_STYLES.get(status.upper(), _DEFAULT_STYLE)
+    return style
+
 
 class StatusEntry(TypedDict):
     """Represents a single status entry for summary rendering."""
@@ -44,11 +63,9 @@ def _build_status_content(
     Returns:
         Tuple of (content_lines, color) for the frame.
     """
-    status_key = status.upper()
-    theme = STATUS_THEME.get(status_key, DEFAULT_STATUS)
-    color = str(theme["color"])  # Cast to str for type safety
-    icon = str(theme["icon"])  # Uses icons module for policy-aware rendering
+    color, icon = _status_style(status)
 
+    # str(icon) uses the icons module for policy-aware rendering
     lines: list[str] = [f"{icon}  [bold]{escape(name)}[/]"]
 
     if duration is not None:
@@ -85,12 +102,9 @@ def status_frame(
         console = Console()
 
     status_key = status.upper()
-    theme = STATUS_THEME.get(status_key, DEFAULT_STATUS)
-    color = theme["color"]
-
-    content, _ = _build_status_content(
+    content, color = _build_status_content(
         name=test_name,
-        status=status_key,
+        status=status,
         duration=duration,
         message=message,
     )
@@ -130,19 +144,16 @@ def status_summary(
     # Use context manager with align_widths for automatic width alignment
     with console.group(align_widths=True, gap=1):
         for entry in results:
-            status_key = entry["status"].upper()
-            theme = STATUS_THEME.get(status_key, DEFAULT_STATUS)
-            color = theme["color"]
-
-            content, _ = _build_status_content(
+            status = entry["status"]
+            content, color = _build_status_content(
                 name=entry["name"],
-                status=status_key,
+                status=status,
                 duration=entry.get("duration"),
                 message=entry.get("message"),
             )
 
             frame_args: dict[str, Any] = {
-                "title": f" {status_key} ",
+                "title": f" {status.upper()} ",
                 "border": "rounded",
                 "border_color": color,
                 "title_color": color,
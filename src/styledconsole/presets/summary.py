@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import Counter
 from typing import TYPE_CHECKING, TypedDict
 
 from typing_extensions import NotRequired
@@ -35,12 +36,15 @@ def _calculate_status(
         return "MIXED", "warning", str(icons.WARNING)
 
 
-def _list_failures(console: Console, results: list[TestResult]) -> None:
+def _list_failures(console: Console, failures: list[tuple[str, TestResult]]) -> None:
     """List failed tests.
 
     Uses semantic color 'error' and icons module for policy-aware rendering.
+
+    Args:
+        console: Console to render to.
+        failures: (upper-cased status, result) pairs for FAIL/ERROR results.
     """
-    failures = [r for r in results if r["status"].upper() in ("FAIL", "ERROR")]
     if not failures:
         return
 
@@ -48,8 +52,7 @@ def _list_failures(console: Console, results: list[TestResult]) -> None:
     console.rule("[bold]Failures & Errors[/]", style="error")
     console.newline()
 
-    for fail in failures:
-        status = fail["status"].upper()
+    for status, fail in failures:
         icon = str(icons.CROSS_MARK) if status == "FAIL" else str(icons.FIRE)
 
         content = [f"{icon} [bold]{fail['name']}[/]"]
@@ -83,34 +86,42 @@ def test_summary(
         console = Console()
 
     total = len(results)
-    passed = sum(1 for r in results if r["status"].upper() == "PASS")
-    failed = sum(1 for r in results if r["status"].upper() == "FAIL")
-    skipped = sum(1 for r in results if r["status"].upper() == "SKIP")
-    errors = sum(1 for r in results if r["status"].upper() == "ERROR")
+    # One pass classifies every result for both the counters and the failure list
+    counts: Counter[str] = Counter()
+    failures: list[tuple[str, TestResult]] = []
+    for result in results:
+        status = result["status"].upper()
+        counts[status] += 1
+        if status in ("FAIL", "ERROR"):
+            failures.append((status, result))
+    passed, failed = counts["PASS"], counts["FAIL"]
+    skipped, errors = counts["SKIP"], counts["ERROR"]
 
     overall_status, color, icon = _calculate_status(passed, failed, skipped, errors, total)
 
-    # Header - uses semantic colors that themes can resolve
-    # The border_color uses semantic names resolved by console.frame()
-    console.frame(
-        content=[
-            f"[bold]{icon}  Test Execution Summary[/]",
-            "",
-            f"Total:   [bold]{total}[/]",
-            f"Passed:  {passed}",
-            f"Failed:  {failed}",
-            f"Skipped: {skipped}",
-            f"Errors:  {errors}",
-            "",
-            f"Duration: {total_duration:.2f}s" if total_duration is not None else "",
-        ],
-        title=f" {overall_status} ",
-        border="thick",
-        border_color=color,
-        title_color=color,
-        padding=1,
-        align="left",
-    )
-
-    # List failures if any
-    _list_failures(console, results)
+    # Write the summary and failure details with a single flush
+    with console.buffered():
+        # Header - uses semantic colors that themes can resolve
+        # The border_color uses semantic names resolved by console.frame()
+        console.frame(
+            content=[
+                f"[bold]{icon}  Test Execution Summary[/]",
+                "",
+                f"Total:   [bold]{total}[/]",
+                f"Passed:  {passed}",
+                f"Failed:  {failed}",
+                f"Skipped: {skipped}",
+                f"Errors:  {errors}",
+                "",
+                f"Duration: {total_duration:.2f}s" if total_duration is not None else "",
+            ],
+            title=f" {overall_status} ",
+            border="thick",
+            border_color=color,
+            title_color=color,
+            padding=1,
+            align="left",
+        )
+
+        # List failures if any
+        _list_failures(console, failures)
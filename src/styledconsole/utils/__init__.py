@@ -3,9 +3,11 @@
 from styledconsole.utils.color import (
     CSS4_COLORS,
     color_distance,
+    color_distance_sq,
     get_color_names,
     hex_to_rgb,
     interpolate_color,
+    nearest_color_name,
     parse_color,
     rgb_to_hex,
 )
@@ -44,6 +46,7 @@ __all__ = [
     "TerminalProfile",
     "analyze_emoji_safety",
     "color_distance",
+    "color_distance_sq",
     "create_rich_text",
     "demojize",
     "detect_terminal_capabilities",
@@ -58,6 +61,7 @@ __all__ = [
     "interpolate_color",
     "is_valid_emoji",
     "is_zwj_sequence",
+    "nearest_color_name",
     "pad_to_width",
     # Color utilities
     "parse_color",
@@ -0,0 +1,677 @@
+"""Icon registry data generated from ``icon_categories``.
+
+DO NOT EDIT: regenerate with ``python scripts/gen_icon_data.py``.
+"""
+
+from typing import Final
+
+from styledconsole.utils.icon_data_types import IconMapping
+
+# Master registry - maps icon name to IconMapping
+ICON_REGISTRY: Final[dict[str, IconMapping]] = {
+    "CHECK_MARK_BUTTON": IconMapping("✅", "(OK)", "green"),
+    "CROSS_MARK": IconMapping("❌", "(FAIL)", "red"),
+    "WARNING": IconMapping("⚠️", "(WARN)", "yellow"),
+    "INFORMATION": IconMapping("ℹ️", "(INFO)", "cyan"),
+    "RED_QUESTION_MARK": IconMapping("❓", "(?)", "magenta"),
+    "COUNTERCLOCKWISE_ARROWS_BUTTON": IconMapping("🔄", "(~)", "cyan"),
+    "RED_CIRCLE": IconMapping("🔴", "●", "red"),
+    "YELLOW_CIRCLE": IconMapping("🟡", "●", "yellow"),
+    "GREEN_CIRCLE": IconMapping("🟢", "●", "green"),
+    "BLUE_CIRCLE": IconMapping("🔵", "●", "blue"),
+    "PURPLE_CIRCLE": IconMapping("🟣", "●", "magenta"),
+    "ORANGE_CIRCLE": IconMapping("🟠", "●", "darkorange"),
+    "WHITE_CIRCLE": IconMapping("⚪", "○", None),
+    "BLACK_CIRCLE": IconMapping("⚫", "●", None),
+    "STAR": IconMapping("⭐", "*", "yellow"),
+    "SPARKLES": IconMapping("✨", "**", "yellow"),
+    "DIZZY": IconMapping("💫", "*~", "yellow"),
+    "GLOWING_STAR": IconMapping("🌟", "(*)", "yellow"),
+    "BAR_CHART": IconMapping("📊", "(#)", "blue"),
+    "CHART_INCREASING": IconMapping("📈", "(^)", "green"),
+    "CHART_DECREASING": IconMapping("📉", "(v)", "red"),
+    "PACKAGE": IconMapping("📦", "(P)", "saddlebrown"),
+    "FILE_FOLDER": IconMapping("📁", "(/)", "blue"),
+    "OPEN_FILE_FOLDER": IconMapping("📂", "(+)", "blue"),
+    "FILE_CABINET": IconMapping("🗄️", "(=)", "gray"),
+    "CARD_FILE_BOX": IconMapping("🗃️", "(=)", "gray"),
+    "WASTEBASKET": IconMapping("🗑️", "(x)", "gray"),
+    "PAGE_FACING_UP": IconMapping("📄", "(f)", None),
+    "PAGE_WITH_CURL": IconMapping("📃", "(d)", None),
+    "SCROLL": IconMapping("📜", "(s)", "goldenrod"),
+    "MEMO": IconMapping("📝", "(m)", None),
+    "CLIPBOARD": IconMapping("📋", "(c)", None),
+    "PUSHPIN": IconMapping("📌", "(*)", "red"),
+    "PAPERCLIP": IconMapping("📎", "(-)", "gray"),
+    "BOOKMARK": IconMapping("🔖", "(>)", "tomato"),
+    "LABEL": IconMapping("🏷️", "(t)", None),
+    "CARD_INDEX": IconMapping("📇", "(i)", None),
+    "CONSTRUCTION": IconMapping("🚧", "(!!)", "yellow"),
+    "OPEN_BOOK": IconMapping("📖", "(B)", None),
+    "BOOKS": IconMapping("📚", "(BB)", None),
+    "NOTEBOOK": IconMapping("📓", "(N)", None),
+    "LEDGER": IconMapping("📒", "(L)", "yellow"),
+    "CLOSED_BOOK": IconMapping("📕", "(B)", "red"),
+    "GREEN_BOOK": IconMapping("📗", "(B)", "green"),
+    "BLUE_BOOK": IconMapping("📘", "(B)", "blue"),
+    "ORANGE_BOOK": IconMapping("📙", "(B)", "darkorange"),
+    "NEWSPAPER": IconMapping("📰", "(N)", None),
+    "ROLLED_UP_NEWSPAPER": IconMapping("🗞️", "(N)", None),
+    "LAPTOP": IconMapping("💻", "(PC)", None),
+    "DESKTOP": IconMapping("🖥️", "(PC)", None),
+    "KEYBOARD": IconMapping("⌨️", "(kb)", None),
+    "MOUSE": IconMapping("🐁", "(m)", None),
+    "FLOPPY_DISK": IconMapping("💾", "(D)", None),
+    "CD": IconMapping("💿", "(O)", None),
+    "DVD": IconMapping("📀", "(O)", "gold"),
+    "DESKTOP_COMPUTER": IconMapping("🖥️", "(C)", None),
+    "SATELLITE_ANTENNA": IconMapping("📡", "(A)", None),
+    "GLOBE_WITH_MERIDIANS": IconMapping("🌐", "(@)", "blue"),
+    "TEST_TUBE": IconMapping("🧪", "(T)", "mediumpurple"),
+    "MICROSCOPE": IconMapping("🔬", "(M)", None),
+    "TRIANGULAR_RULER": IconMapping("📐", "(/)", None),
+    "WRENCH": IconMapping("🔧", "(w)", "gray"),
+    "HAMMER": IconMapping("🔨", "(h)", "gray"),
+    "GEAR": IconMapping("⚙️", "(*)", "gray"),
+    "NUT_BOLT": IconMapping("🔩", "(o)", "gray"),
+    "BULLSEYE": IconMapping("🎯", "(o)", "red"),
+    "ARTIST_PALETTE": IconMapping("🎨", "(~)", None),
+    "PAINTBRUSH": IconMapping("🖌️", "(/)", None),
+    "PARTY_POPPER": IconMapping("🎉", "(!)", "gold"),
+    "CONFETTI_BALL": IconMapping("🎊", "(!)", "gold"),
+    "WRAPPED_GIFT": IconMapping("🎁", "(G)", "red"),
+    "BALLOON": IconMapping("🎈", "o", "red"),
+    "TROPHY": IconMapping("🏆", "(#)", "gold"),
+    "MEDAL": IconMapping("🏅", "(m)", "gold"),
+    "FIREWORKS": IconMapping("🎆", "(*)", "gold"),
+    "CIRCUS_TENT": IconMapping("🎪", "(^)", "red"),
+    "PERFORMING_ARTS": IconMapping("🎭", "(:))", None),
+    "ROCKET": IconMapping("🚀", ">>>", "cyan"),
+    "AIRPLANE": IconMapping("✈️", "->", None),
+    "AUTOMOBILE": IconMapping("🚗", "(>)", "red"),
+    "BIKE": IconMapping("🚲", "(o)", None),
+    "LOCOMOTIVE": IconMapping("🚂", "(=)", None),
+    "SHIP": IconMapping("🚢", "(~)", None),
+    "RAINBOW": IconMapping("🌈", "(~)", None),
+    "SUN": IconMapping("☀️", "(O)", "yellow"),
+    "SUNRISE": IconMapping("🌅", "(^)", "darkorange"),
+    "MOON": IconMapping("🌙", "(C)", "yellow"),
+    "DROPLET": IconMapping("💧", "o", "blue"),
+    "WATER_WAVE": IconMapping("🌊", "~~~", "blue"),
+    "FIRE": IconMapping("🔥", "~", "orangered"),
+    "SNOWFLAKE": IconMapping("❄️", "*", "cyan"),
+    "CLOUD": IconMapping("☁️", "(~)", None),
+    "HIGH_VOLTAGE": IconMapping("⚡", "/\\", "yellow"),
+    "TORNADO": IconMapping("🌪️", "@", "gray"),
+    "MILKY_WAY": IconMapping("🌌", "(*)", "mediumpurple"),
+    "GLOBE_SHOWING_EUROPE_AFRICA": IconMapping("🌍", "(@)", "green"),
+    "EVERGREEN_TREE": IconMapping("🌲", "(T)", "green"),
+    "PALM": IconMapping("🌴", "(Y)", "green"),
+    "CACTUS": IconMapping("🌵", "(|)", "green"),
+    "SEEDLING": IconMapping("🌱", "(.)", "green"),
+    "HERB": IconMapping("🌿", "(~)", "green"),
+    "SHAMROCK": IconMapping("☘️", "(*)", "green"),
+    "FOUR_LEAF_CLOVER": IconMapping("🍀", "(+)", "green"),
+    "CHERRY_BLOSSOM": IconMapping("🌸", "(*)", "lightpink"),
+    "LEAF_FLUTTERING_IN_WIND": IconMapping("🍃", "~~", "green"),
+    "MAPLE_LEAF": IconMapping("🍁", "(*)", "orangered"),
+    "PIZZA": IconMapping("🍕", "(>)", "darkorange"),
+    "BURGER": IconMapping("🍔", "(=)", "saddlebrown"),
+    "FRIES": IconMapping("🍟", "(|)", "yellow"),
+    "COFFEE": IconMapping("☕", "(c)", "saddlebrown"),
+    "BEER": IconMapping("🍺", "(U)", "gold"),
+    "WINE": IconMapping("🍷", "(Y)", "darkred"),
+    "COCKTAIL": IconMapping("🍹", "(Y)", None),
+    "CAKE": IconMapping("🍰", "(^)", "lightpink"),
+    "COOKIE": IconMapping("🍪", "(o)", "saddlebrown"),
+    "TANGERINE": IconMapping("🍊", "(o)", "darkorange"),
+    "GRAPES": IconMapping("🍇", "oo", "purple"),
+    "WATERMELON": IconMapping("🍉", "[>", "green"),
+    "CHESTNUT": IconMapping("🌰", "()", "saddlebrown"),
+    "BUSTS_IN_SILHOUETTE": IconMapping("👥", "(PP)", None),
+    "PERSON": IconMapping("🧑", "(P)", None),
+    "THUMBS_UP": IconMapping("👍", "(+)", "green"),
+    "THUMBS_DOWN": IconMapping("👎", "(-)", "red"),
+    "WAVING_HAND": IconMapping("👋", "(/)", None),
+    "HANDS_UP": IconMapping("🙌", "(^^)", None),
+    "CLAP": IconMapping("👏", "(*)", None),
+    "MUSCLE": IconMapping("💪", "(!)", None),
+    "ARROW_RIGHT": IconMapping("→", "->", None),
+    "ARROW_LEFT": IconMapping("←", "<-", None),
+    "ARROW_UP": IconMapping("↑", "^", None),
+    "ARROW_DOWN": IconMapping("↓", "v", None),
+    "UP_RIGHT_ARROW": IconMapping("↗️", "/^", None),
+    "ARROW_DOWN_RIGHT": IconMapping("↘️", "\\v", None),
+    "ARROW_DOWN_LEFT": IconMapping("↙️", "/v", None),
+    "ARROW_UP_LEFT": IconMapping("↖️", "\\^", None),
+    "HEAVY_RIGHT": IconMapping("➡️", "==>", None),
+    "HEAVY_LEFT": IconMapping("⬅️", "<==", None),
+    "HEAVY_UP": IconMapping("⬆️", "^^", None),
+    "HEAVY_DOWN": IconMapping("⬇️", "vv", None),
+    "LIGHT_BULB": IconMapping("💡", "(!)", "yellow"),
+    "BELL": IconMapping("🔔", "(b)", "yellow"),
+    "POLICE_CAR_LIGHT": IconMapping("🚨", "(!)", "red"),
+    "LOCKED": IconMapping("🔒", "(L)", "gray"),
+    "UNLOCK": IconMapping("🔓", "(U)", "gray"),
+    "KEY": IconMapping("🔑", "(k)", "gold"),
+    "LINK": IconMapping("🔗", "(-)", "blue"),
+    "CHAIN": IconMapping("⛓️", "(-)", "gray"),
+    "MAG": IconMapping("🔍", "(?)", None),
+    "SHIELD": IconMapping("🛡️", "(#)", "gray"),
+    "CROWN": IconMapping("👑", "(^)", "gold"),
+    "PLUS": IconMapping("➕", "+", "green"),
+    "MINUS": IconMapping("➖", "-", "red"),
+    "MULTIPLY": IconMapping("✖️", "x", None),
+    "DIVIDE": IconMapping("➗", "/", None),
+    "EQUALS": IconMapping("🟰", "=", None),
+    "RED_HEART": IconMapping("❤️", "<3", "red"),
+    "ORANGE_HEART": IconMapping("🧡", "<3", "darkorange"),
+    "YELLOW_HEART": IconMapping("💛", "<3", "yellow"),
+    "GREEN_HEART": IconMapping("💚", "<3", "green"),
+    "BLUE_HEART": IconMapping("💙", "<3", "blue"),
+    "PURPLE_HEART": IconMapping("💜", "<3", "magenta"),
+    "BROKEN_HEART": IconMapping("💔", "</3", "red"),
+    "SPARKLING_HEART": IconMapping("💖", "<*>", "hotpink"),
+    "GROWING_HEART": IconMapping("💗", "<3>", "hotpink"),
+    "DOLLAR_BANKNOTE": IconMapping("💵", "($)", "green"),
+    "MONEY_BAG": IconMapping("💰", "($)", "gold"),
+    "COIN": IconMapping("🪙", "(o)", "gold"),
+    "CREDIT_CARD": IconMapping("💳", "(=)", None),
+    "GEM_STONE": IconMapping("💎", "<>", "cyan"),
+    "ONE_OCLOCK": IconMapping("🕐", "(t)", None),
+    "ALARM_CLOCK": IconMapping("⏰", "(!)", "red"),
+    "STOPWATCH": IconMapping("⏱️", "(t)", "cyan"),
+    "TIMER": IconMapping("⏲️", "(t)", "cyan"),
+    "HOURGLASS_DONE": IconMapping("⌛", "(t)", None),
+    "HOURGLASS_NOT_DONE": IconMapping("⏳", "(...)", "cyan"),
+    "CALENDAR": IconMapping("📅", "(#)", None),
+    "MOBILE_PHONE": IconMapping("📱", "(p)", None),
+    "TELEPHONE": IconMapping("☎️", "(p)", None),
+    "E_MAIL": IconMapping("📧", "(@)", None),
+    "ENVELOPE": IconMapping("✉️", "(_)", None),
+    "MAILBOX": IconMapping("📬", "(M)", None),
+    "SPEAKER": IconMapping("🔊", "(>)", None),
+    "MEGAPHONE": IconMapping("📣", "(>)", None),
+    "LOUDSPEAKER": IconMapping("📢", "(>)", None),
+    "HOME": IconMapping("🏠", "(H)", None),
+    "OFFICE": IconMapping("🏢", "(O)", None),
+    "FACTORY": IconMapping("🏭", "(F)", "gray"),
+    "HOSPITAL": IconMapping("🏥", "(+)", "red"),
+    "SCHOOL": IconMapping("🏫", "(S)", None),
+    "BANK": IconMapping("🏦", "($)", None),
+    "HOTEL": IconMapping("🏨", "(H)", None),
+    "CASTLE": IconMapping("🏰", "(M)", None),
+    "DESERT": IconMapping("🏜️", "(~)", "goldenrod"),
+    "CLASSICAL_BUILDING": IconMapping("🏛️", "(|)", None),
+    "STADIUM": IconMapping("🏟️", "(U)", None),
+    "FLAG_CHECKERED": IconMapping("🏁", "(F)", None),
+    "FLAG_TRIANGULAR": IconMapping("🚩", "[>", "red"),
+    "WHITE_FLAG": IconMapping("🏳️", "(F)", None),
+    "BUTTERFLY": IconMapping("🦋", "(W)", "mediumpurple"),
+    "BUG": IconMapping("🐛", "(b)", "green"),
+    "BEE": IconMapping("🐝", "(b)", "yellow"),
+    "LADY_BEETLE": IconMapping("🐞", "(b)", "red"),
+    "SNAIL": IconMapping("🐌", "(@)", None),
+    "TURTLE": IconMapping("🐢", "(T)", "green"),
+}
+
+# Reverse lookup - maps emoji to IconMapping (for runtime conversion)
+EMOJI_TO_ICON: Final[dict[str, IconMapping]] = {
+    "✅": IconMapping("✅", "(OK)", "green"),
+    "❌": IconMapping("❌", "(FAIL)", "red"),
+    "⚠️": IconMapping("⚠️", "(WARN)", "yellow"),
+    "ℹ️": IconMapping("ℹ️", "(INFO)", "cyan"),
+    "❓": IconMapping("❓", "(?)", "magenta"),
+    "🔄": IconMapping("🔄", "(~)", "cyan"),
+    "🔴": IconMapping("🔴", "●", "red"),
+    "🟡": IconMapping("🟡", "●", "yellow"),
+    "🟢": IconMapping("🟢", "●", "green"),
+    "🔵": IconMapping("🔵", "●", "blue"),
+    "🟣": IconMapping("🟣", "●", "magenta"),
+    "🟠": IconMapping("🟠", "●", "darkorange"),
+    "⚪": IconMapping("⚪", "○", None),
+    "⚫": IconMapping("⚫", "●", None),
+    "⭐": IconMapping("⭐", "*", "yellow"),
+    "✨": IconMapping("✨", "**", "yellow"),
+    "💫": IconMapping("💫", "*~", "yellow"),
+    "🌟": IconMapping("🌟", "(*)", "yellow"),
+    "📊": IconMapping("📊", "(#)", "blue"),
+    "📈": IconMapping("📈", "(^)", "green"),
+    "📉": IconMapping("📉", "(v)", "red"),
+    "📦": IconMapping("📦", "(P)", "saddlebrown"),
+    "📁": IconMapping("📁", "(/)", "blue"),
+    "📂": IconMapping("📂", "(+)", "blue"),
+    "🗄️": IconMapping("🗄️", "(=)", "gray"),
+    "🗃️": IconMapping("🗃️", "(=)", "gray"),
+    "🗑️": IconMapping("🗑️", "(x)", "gray"),
+    "📄": IconMapping("📄", "(f)", None),
+    "📃": IconMapping("📃", "(d)", None),
+    "📜": IconMapping("📜", "(s)", "goldenrod"),
+    "📝": IconMapping("📝", "(m)", None),
+    "📋": IconMapping("📋", "(c)", None),
+    "📌": IconMapping("📌", "(*)", "red"),
+    "📎": IconMapping("📎", "(-)", "gray"),
+    "🔖": IconMapping("🔖", "(>)", "tomato"),
+    "🏷️": IconMapping("🏷️", "(t)", None),
+    "📇": IconMapping("📇", "(i)", None),
+    "🚧": IconMapping("🚧", "(!!)", "yellow"),
+    "📖": IconMapping("📖", "(B)", None),
+    "📚": IconMapping("📚", "(BB)", None),
+    "📓": IconMapping("📓", "(N)", None),
+    "📒": IconMapping("📒", "(L)", "yellow"),
+    "📕": IconMapping("📕", "(B)", "red"),
+    "📗": IconMapping("📗", "(B)", "green"),
+    "📘": IconMapping("📘", "(B)", "blue"),
+    "📙": IconMapping("📙", "(B)", "darkorange"),
+    "📰": IconMapping("📰", "(N)", None),
+    "🗞️": IconMapping("🗞️", "(N)", None),
+    "💻": IconMapping("💻", "(PC)", None),
+    "🖥️": IconMapping("🖥️", "(C)", None),
+    "⌨️": IconMapping("⌨️", "(kb)", None),
+    "🐁": IconMapping("🐁", "(m)", None),
+    "💾": IconMapping("💾", "(D)", None),
+    "💿": IconMapping("💿", "(O)", None),
+    "📀": IconMapping("📀", "(O)", "gold"),
+    "📡": IconMapping("📡", "(A)", None),
+    "🌐": IconMapping("🌐", "(@)", "blue"),
+    "🧪": IconMapping("🧪", "(T)", "mediumpurple"),
+    "🔬": IconMapping("🔬", "(M)", None),
+    "📐": IconMapping("📐", "(/)", None),
+    "🔧": IconMapping("🔧", "(w)", "gray"),
+    "🔨": IconMapping("🔨", "(h)", "gray"),
+    "⚙️": IconMapping("⚙️", "(*)", "gray"),
+    "🔩": IconMapping("🔩", "(o)", "gray"),
+    "🎯": IconMapping("🎯", "(o)", "red"),
+    "🎨": IconMapping("🎨", "(~)", None),
+    "🖌️": IconMapping("🖌️", "(/)", None),
+    "🎉": IconMapping("🎉", "(!)", "gold"),
+    "🎊": IconMapping("🎊", "(!)", "gold"),
+    "🎁": IconMapping("🎁", "(G)", "red"),
+    "🎈": IconMapping("🎈", "o", "red"),
+    "🏆": IconMapping("🏆", "(#)", "gold"),
+    "🏅": IconMapping("🏅", "(m)", "gold"),
+    "🎆": IconMapping("🎆", "(*)", "gold"),
+    "🎪": IconMapping("🎪", "(^)", "red"),
+    "🎭": IconMapping("🎭", "(:))", None),
+    "🚀": IconMapping("🚀", ">>>", "cyan"),
+    "✈️": IconMapping("✈️", "->", None),
+    "🚗": IconMapping("🚗", "(>)", "red"),
+    "🚲": IconMapping("🚲", "(o)", None),
+    "🚂": IconMapping("🚂", "(=)", None),
+    "🚢": IconMapping("🚢", "(~)", None),
+    "🌈": IconMapping("🌈", "(~)", None),
+    "☀️": IconMapping("☀️", "(O)", "yellow"),
+    "🌅": IconMapping("🌅", "(^)", "darkorange"),
+    "🌙": IconMapping("🌙", "(C)", "yellow"),
+    "💧": IconMapping("💧", "o", "blue"),
+    "🌊": IconMapping("🌊", "~~~", "blue"),
+    "🔥": IconMapping("🔥", "~", "orangered"),
+    "❄️": IconMapping("❄️", "*", "cyan"),
+    "☁️": IconMapping("☁️", "(~)", None),
+    "⚡": IconMapping("⚡", "/\\", "yellow"),
+    "🌪️": IconMapping("🌪️", "@", "gray"),
+    "🌌": IconMapping("🌌", "(*)", "mediumpurple"),
+    "🌍": IconMapping("🌍", "(@)", "green"),
+    "🌲": IconMapping("🌲", "(T)", "green"),
+    "🌴": IconMapping("🌴", "(Y)", "green"),
+    "🌵": IconMapping("🌵", "(|)", "green"),
+    "🌱": IconMapping("🌱", "(.)", "green"),
+    "🌿": IconMapping("🌿", "(~)", "green"),
+    "☘️": IconMapping("☘️", "(*)", "green"),
+    "🍀": IconMapping("🍀", "(+)", "green"),
+    "🌸": IconMapping("🌸", "(*)", "lightpink"),
+    "🍃": IconMapping("🍃", "~~", "green"),
+    "🍁": IconMapping("🍁", "(*)", "orangered"),
+    "🍕": IconMapping("🍕", "(>)", "darkorange"),
+    "🍔": IconMapping("🍔", "(=)", "saddlebrown"),
+    "🍟": IconMapping("🍟", "(|)", "yellow"),
+    "☕": IconMapping("☕", "(c)", "saddlebrown"),
+    "🍺": IconMapping("🍺", "(U)", "gold"),
+    "🍷": IconMapping("🍷", "(Y)", "darkred"),
+    "🍹": IconMapping("🍹", "(Y)", None),
+    "🍰": IconMapping("🍰", "(^)", "lightpink"),
+    "🍪": IconMapping("🍪", "(o)", "saddlebrown"),
+    "🍊": IconMapping("🍊", "(o)", "darkorange"),
+    "🍇": IconMapping("🍇", "oo", "purple"),
+    "🍉": IconMapping("🍉", "[>", "green"),
+    "🌰": IconMapping("🌰", "()", "saddlebrown"),
+    "👥": IconMapping("👥", "(PP)", None),
+    "🧑": IconMapping("🧑", "(P)", None),
+    "👍": IconMapping("👍", "(+)", "green"),
+    "👎": IconMapping("👎", "(-)", "red"),
+    "👋": IconMapping("👋", "(/)", None),
+    "🙌": IconMapping("🙌", "(^^)", None),
+    "👏": IconMapping("👏", "(*)", None),
+    "💪": IconMapping("💪", "(!)", None),
+    "→": IconMapping("→", "->", None),
+    "←": IconMapping("←", "<-", None),
+    "↑": IconMapping("↑", "^", None),
+    "↓": IconMapping("↓", "v", None),
+    "↗️": IconMapping("↗️", "/^", None),
+    "↘️": IconMapping("↘️", "\\v", None),
+    "↙️": IconMapping("↙️", "/v", None),
+    "↖️": IconMapping("↖️", "\\^", None),
+    "➡️": IconMapping("➡️", "==>", None),
+    "⬅️": IconMapping("⬅️", "<==", None),
+    "⬆️": IconMapping("⬆️", "^^", None),
+    "⬇️": IconMapping("⬇️", "vv", None),
+    "💡": IconMapping("💡", "(!)", "yellow"),
+    "🔔": IconMapping("🔔", "(b)", "yellow"),
+    "🚨": IconMapping("🚨", "(!)", "red"),
+    "🔒": IconMapping("🔒", "(L)", "gray"),
+    "🔓": IconMapping("🔓", "(U)", "gray"),
+    "🔑": IconMapping("🔑", "(k)", "gold"),
+    "🔗": IconMapping("🔗", "(-)", "blue"),
+    "⛓️": IconMapping("⛓️", "(-)", "gray"),
+    "🔍": IconMapping("🔍", "(?)", None),
+    "🛡️": IconMapping("🛡️", "(#)", "gray"),
+    "👑": IconMapping("👑", "(^)", "gold"),
+    "➕": IconMapping("➕", "+", "green"),
+    "➖": IconMapping("➖", "-", "red"),
+    "✖️": IconMapping("✖️", "x", None),
+    "➗": IconMapping("➗", "/", None),
+    "🟰": IconMapping("🟰", "=", None),
+    "❤️": IconMapping("❤️", "<3", "red"),
+    "🧡": IconMapping("🧡", "<3", "darkorange"),
+    "💛": IconMapping("💛", "<3", "yellow"),
+    "💚": IconMapping("💚", "<3", "green"),
+    "💙": IconMapping("💙", "<3", "blue"),
+    "💜": IconMapping("💜", "<3", "magenta"),
+    "💔": IconMapping("💔", "</3", "red"),
+    "💖": IconMapping("💖", "<*>", "hotpink"),
+    "💗": IconMapping("💗", "<3>", "hotpink"),
+    "💵": IconMapping("💵", "($)", "green"),
+    "💰": IconMapping("💰", "($)", "gold"),
+    "🪙": IconMapping("🪙", "(o)", "gold"),
+    "💳": IconMapping("💳", "(=)", None),
+    "💎": IconMapping("💎", "<>", "cyan"),
+    "🕐": IconMapping("🕐", "(t)", None),
+    "⏰": IconMapping("⏰", "(!)", "red"),
+    "⏱️": IconMapping("⏱️", "(t)", "cyan"),
+    "⏲️": IconMapping("⏲️", "(t)", "cyan"),
+    "⌛": IconMapping("⌛", "(t)", None),
+    "⏳": IconMapping("⏳", "(...)", "cyan"),
+    "📅": IconMapping("📅", "(#)", None),
+    "📱": IconMapping("📱", "(p)", None),
+    "☎️": IconMapping("☎️", "(p)", None),
+    "📧": IconMapping("📧", "(@)", None),
+    "✉️": IconMapping("✉️", "(_)", None),
+    "📬": IconMapping("📬", "(M)", None),
+    "🔊": IconMapping("🔊", "(>)", None),
+    "📣": IconMapping("📣", "(>)", None),
+    "📢": IconMapping("📢", "(>)", None),
+    "🏠": IconMapping("🏠", "(H)", None),
+    "🏢": IconMapping("🏢", "(O)", None),
+    "🏭": IconMapping("🏭", "(F)", "gray"),
+    "🏥": IconMapping("🏥", "(+)", "red"),
+    "🏫": IconMapping("🏫", "(S)", None),
+    "🏦": IconMapping("🏦", "($)", None),
+    "🏨": IconMapping("🏨", "(H)", None),
+    "🏰": IconMapping("🏰", "(M)", None),
+    "🏜️": IconMapping("🏜️", "(~)", "goldenrod"),
+    "🏛️": IconMapping("🏛️", "(|)", None),
+    "🏟️": IconMapping("🏟️", "(U)", None),
+    "🏁": IconMapping("🏁", "(F)", None),
+    "🚩": IconMapping("🚩", "[>", "red"),
+    "🏳️": IconMapping("🏳️", "(F)", None),
+    "🦋": IconMapping("🦋", "(W)", "mediumpurple"),
+    "🐛": IconMapping("🐛", "(b)", "green"),
+    "🐝": IconMapping("🐝", "(b)", "yellow"),
+    "🐞": IconMapping("🐞", "(b)", "red"),
+    "🐌": IconMapping("🐌", "(@)", None),
+    "🐢": IconMapping("🐢", "(T)", "green"),
+}
+
+# Category table name -> icon names, in table order
+ICON_CATEGORIES: Final[dict[str, tuple[str, ...]]] = {
+    "STATUS_ICONS": (
+        "CHECK_MARK_BUTTON",
+        "CROSS_MARK",
+        "WARNING",
+        "INFORMATION",
+        "RED_QUESTION_MARK",
+        "COUNTERCLOCKWISE_ARROWS_BUTTON",
+        "RED_CIRCLE",
+        "YELLOW_CIRCLE",
+        "GREEN_CIRCLE",
+        "BLUE_CIRCLE",
+        "PURPLE_CIRCLE",
+        "ORANGE_CIRCLE",
+        "WHITE_CIRCLE",
+        "BLACK_CIRCLE",
+    ),
+    "STARS_ICONS": (
+        "STAR",
+        "SPARKLES",
+        "DIZZY",
+        "GLOWING_STAR",
+    ),
+    "DOCUMENT_ICONS": (
+        "BAR_CHART",
+        "CHART_INCREASING",
+        "CHART_DECREASING",
+        "PACKAGE",
+        "FILE_FOLDER",
+        "OPEN_FILE_FOLDER",
+        "FILE_CABINET",
+        "CARD_FILE_BOX",
+        "WASTEBASKET",
+        "PAGE_FACING_UP",
+        "PAGE_WITH_CURL",
+        "SCROLL",
+        "MEMO",
+        "CLIPBOARD",
+        "PUSHPIN",
+        "PAPERCLIP",
+        "BOOKMARK",
+        "LABEL",
+        "CARD_INDEX",
+        "CONSTRUCTION",
+    ),
+    "BOOK_ICONS": (
+        "OPEN_BOOK",
+        "BOOKS",
+        "NOTEBOOK",
+        "LEDGER",
+        "CLOSED_BOOK",
+        "GREEN_BOOK",
+        "BLUE_BOOK",
+        "ORANGE_BOOK",
+        "NEWSPAPER",
+        "ROLLED_UP_NEWSPAPER",
+    ),
+    "TECH_ICONS": (
+        "LAPTOP",
+        "DESKTOP",
+        "KEYBOARD",
+        "MOUSE",
+        "FLOPPY_DISK",
+        "CD",
+        "DVD",
+        "DESKTOP_COMPUTER",
+        "SATELLITE_ANTENNA",
+        "GLOBE_WITH_MERIDIANS",
+    ),
+    "TOOLS_ICONS": (
+        "TEST_TUBE",
+        "MICROSCOPE",
+        "TRIANGULAR_RULER",
+        "WRENCH",
+        "HAMMER",
+        "GEAR",
+        "NUT_BOLT",
+    ),
+    "ACTIVITY_ICONS": (
+        "BULLSEYE",
+        "ARTIST_PALETTE",
+        "PAINTBRUSH",
+        "PARTY_POPPER",
+        "CONFETTI_BALL",
+        "WRAPPED_GIFT",
+        "BALLOON",
+        "TROPHY",
+        "MEDAL",
+        "FIREWORKS",
+        "CIRCUS_TENT",
+        "PERFORMING_ARTS",
+    ),
+    "TRANSPORT_ICONS": (
+        "ROCKET",
+        "AIRPLANE",
+        "AUTOMOBILE",
+        "BIKE",
+        "LOCOMOTIVE",
+        "SHIP",
+    ),
+    "WEATHER_ICONS": (
+        "RAINBOW",
+        "SUN",
+        "SUNRISE",
+        "MOON",
+        "DROPLET",
+        "WATER_WAVE",
+        "FIRE",
+        "SNOWFLAKE",
+        "CLOUD",
+        "HIGH_VOLTAGE",
+        "TORNADO",
+        "MILKY_WAY",
+        "GLOBE_SHOWING_EUROPE_AFRICA",
+    ),
+    "PLANT_ICONS": (
+        "EVERGREEN_TREE",
+        "PALM",
+        "CACTUS",
+        "SEEDLING",
+        "HERB",
+        "SHAMROCK",
+        "FOUR_LEAF_CLOVER",
+        "CHERRY_BLOSSOM",
+        "LEAF_FLUTTERING_IN_WIND",
+        "MAPLE_LEAF",
+    ),
+    "FOOD_ICONS": (
+        "PIZZA",
+        "BURGER",
+        "FRIES",
+        "COFFEE",
+        "BEER",
+        "WINE",
+        "COCKTAIL",
+        "CAKE",
+        "COOKIE",
+        "TANGERINE",
+        "GRAPES",
+        "WATERMELON",
+        "CHESTNUT",
+    ),
+    "PEOPLE_ICONS": (
+        "BUSTS_IN_SILHOUETTE",
+        "PERSON",
+        "THUMBS_UP",
+        "THUMBS_DOWN",
+        "WAVING_HAND",
+        "HANDS_UP",
+        "CLAP",
+        "MUSCLE",
+    ),
+    "ARROW_ICONS": (
+        "ARROW_RIGHT",
+        "ARROW_LEFT",
+        "ARROW_UP",
+        "ARROW_DOWN",
+        "UP_RIGHT_ARROW",
+        "ARROW_DOWN_RIGHT",
+        "ARROW_DOWN_LEFT",
+        "ARROW_UP_LEFT",
+        "HEAVY_RIGHT",
+        "HEAVY_LEFT",
+        "HEAVY_UP",
+        "HEAVY_DOWN",
+    ),
+    "SYMBOL_ICONS": (
+        "LIGHT_BULB",
+        "BELL",
+        "POLICE_CAR_LIGHT",
+        "TRIANGULAR_RULER",
+        "LOCKED",
+        "UNLOCK",
+        "KEY",
+        "LINK",
+        "CHAIN",
+        "MAG",
+        "SHIELD",
+        "CROWN",
+    ),
+    "MATH_ICONS": (
+        "PLUS",
+        "MINUS",
+        "MULTIPLY",
+        "DIVIDE",
+        "EQUALS",
+    ),
+    "HEART_ICONS": (
+        "RED_HEART",
+        "ORANGE_HEART",
+        "YELLOW_HEART",
+        "GREEN_HEART",
+        "BLUE_HEART",
+        "PURPLE_HEART",
+        "BROKEN_HEART",
+        "SPARKLING_HEART",
+        "GROWING_HEART",
+    ),
+    "MONEY_ICONS": (
+        "DOLLAR_BANKNOTE",
+        "MONEY_BAG",
+        "COIN",
+        "CREDIT_CARD",
+        "GEM_STONE",
+    ),
+    "TIME_ICONS": (
+        "ONE_OCLOCK",
+        "ALARM_CLOCK",
+        "STOPWATCH",
+        "TIMER",
+        "HOURGLASS_DONE",
+        "HOURGLASS_NOT_DONE",
+        "CALENDAR",
+    ),
+    "COMM_ICONS": (
+        "MOBILE_PHONE",
+        "TELEPHONE",
+        "E_MAIL",
+        "ENVELOPE",
+        "MAILBOX",
+        "SPEAKER",
+        "MEGAPHONE",
+        "LOUDSPEAKER",
+        "GLOBE_WITH_MERIDIANS",
+    ),
+    "BUILDING_ICONS": (
+        "HOME",
+        "OFFICE",
+        "FACTORY",
+        "HOSPITAL",
+        "SCHOOL",
+        "BANK",
+        "HOTEL",
+        "CASTLE",
+        "DESERT",
+        "CLASSICAL_BUILDING",
+        "STADIUM",
+    ),
+    "FLAG_ICONS": (
+        "FLAG_CHECKERED",
+        "FLAG_TRIANGULAR",
+        "WHITE_FLAG",
+    ),
+    "ANIMAL_ICONS": (
+        "BUTTERFLY",
+        "BUG",
+        "BEE",
+        "LADY_BEETLE",
+        "SNAIL",
+        "TURTLE",
+    ),
+}
@@ -27,18 +27,37 @@ from styledconsole.utils.color_data import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from rich.console import Console
 
     from styledconsole.policy import RenderPolicy
 
-# Regex patterns for color parsing
-HEX_PATTERN = re.compile(r"^#?([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$")
-RGB_PATTERN = re.compile(r"^rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)$")
-TUPLE_PATTERN = re.compile(r"^\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)$")
+# Regex patterns for color parsing (ASCII-only: \d and \s would otherwise
+# accept any Unicode digit or space)
+HEX_PATTERN = re.compile(r"^#?([0-9a-fA-F]{6}|[0-9a-fA-F]{3})$", re.ASCII)
+RGB_PATTERN = re.compile(r"^rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)$", re.ASCII)
+TUPLE_PATTERN = re.compile(r"^\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)$", re.ASCII)
+
+# The three formats above as one alternation, so a single match classifies
+# a value (rgb(...) and the bare tuple differ only in the optional prefix)
+_COLOR_PATTERN = re.compile(
+    r"^(?:#?(?P<hex>[0-9a-fA-F]{6}|[0-9a-fA-F]{3})"
+    r"|(?:rgb\s*)?\(\s*(?P<r>\d+)\s*,\s*(?P<g>\d+)\s*,\s*(?P<b>\d+)\s*\))$",
+    re.ASCII,
+)
+_color_match = _COLOR_PATTERN.match
 
 # Type alias for RGB color
 RGBColor = tuple[int, int, int]
 
+# Two-digit hex string -> byte value, for every case combination ("aB" too)
+_HEX_DIGITS = "0123456789abcdefABCDEF"
+HEX_BYTE: dict[str, int] = {a + b: int(a + b, 16) for a in _HEX_DIGITS for b in _HEX_DIGITS}
+
+# Byte value -> two uppercase hex digits
+_HEX2 = tuple(f"{i:02X}" for i in range(256))
+
 
 def hex_to_rgb(hex_str: str) -> RGBColor:
     """Convert hex color string to RGB tuple.
@@ -63,20 +82,16 @@ def hex_to_rgb(hex_str: str) -> RGBColor:
     # Remove # if present
     hex_str = hex_str.lstrip("#")
 
-    # Validate format
-    if not HEX_PATTERN.match("#" + hex_str):
-        raise ValueError(f"Invalid hex color: #{hex_str}")
-
-    # Expand shorthand (e.g., "f00" -> "ff0000")
-    if len(hex_str) == 3:
-        hex_str = "".join([c * 2 for c in hex_str])
-
-    # Convert to RGB
-    r = int(hex_str[0:2], 16)
-    g = int(hex_str[2:4], 16)
-    b = int(hex_str[4:6], 16)
-
-    return (r, g, b)
+    # Table lookups validate and convert in one step: a non-hex pair is a KeyError
+    try:
+        if len(hex_str) == 6:
+            return (HEX_BYTE[hex_str[0:2]], HEX_BYTE[hex_str[2:4]], HEX_BYTE[hex_str[4:6]])
+        if len(hex_str) == 3:
+            # Expand shorthand (e.g., "f00" -> "ff0000")
+            return (HEX_BYTE[hex_str[0] * 2], HEX_BYTE[hex_str[1] * 2], HEX_BYTE[hex_str[2] * 2])
+    except KeyError:
+        pass
+    raise ValueError(f"Invalid hex color: #{hex_str}")
 
 
 def rgb_to_hex(r: int, g: int, b: int) -> str:
@@ -99,43 +114,60 @@ def rgb_to_hex(r: int, g: int, b: int) -> str:
         >>> rgb_to_hex(30, 144, 255)
         '#1E90FF'
     """
-    # Validate ranges
-    if not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
+    # Validate ranges: any bit above the low byte, or a negative value
+    # (which shifts to -1), means out of range
+    if (r | g | b) >> 8:
         raise ValueError(f"RGB values must be 0-255, got ({r}, {g}, {b})")
 
-    return f"#{r:02X}{g:02X}{b:02X}"
+    return "#" + _HEX2[r] + _HEX2[g] + _HEX2[b]
+
+
+@lru_cache(maxsize=1)
+def _named_rgb() -> dict[str, RGBColor]:
+    """Build one name -> RGB table from the CSS4 and Rich color names.
+
+    Both tables are converted once, so a named color resolves with a single
+    dict lookup. CSS4 entries are merged last because they take precedence.
+    """
+    return {
+        name: hex_to_rgb(hex_code)
+        for name, hex_code in {**RICH_TO_CSS4_MAPPING, **CSS4_COLORS}.items()
+    }
+
+
+@lru_cache(maxsize=1)
+def _named_hex() -> dict[str, str]:
+    """Build the name -> "#RRGGBB" table matching _named_rgb()."""
+    return {name: rgb_to_hex(*rgb) for name, rgb in _named_rgb().items()}
 
 
 def _try_named_color(value_lower: str) -> RGBColor | None:
     """Try to parse as CSS4 or Rich named color."""
-    if value_lower in CSS4_COLORS:
-        return hex_to_rgb(CSS4_COLORS[value_lower])
-    if value_lower in RICH_TO_CSS4_MAPPING:
-        return hex_to_rgb(RICH_TO_CSS4_MAPPING[value_lower])
-    return None
+    return _named_rgb().get(value_lower)
 
 
-def _validate_rgb_range(r: int, g: int, b: int) -> None:
-    """Validate RGB values are in 0-255 range."""
-    if not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
-        raise ValueError(f"RGB values must be 0-255, got ({r}, {g}, {b})")
-
+def _try_color_pattern(value: str) -> RGBColor | None:
+    """Try to parse as hex, rgb(r, g, b) or (r, g, b) format."""
+    # "#RGB" / "#RRGGBB" skip the regex: the byte table validates the digits
+    if value[:1] == "#" and (len(value) == 7 or len(value) == 4):
+        try:
+            return hex_to_rgb(value[1:])
+        except ValueError:
+            return None
 
-def _try_rgb_pattern(value: str) -> RGBColor | None:
-    """Try to parse as rgb(r, g, b) or (r, g, b) format."""
-    rgb_match = RGB_PATTERN.match(value)
-    if rgb_match:
-        r, g, b = map(int, rgb_match.groups())
-        _validate_rgb_range(r, g, b)
-        return (r, g, b)
+    match = _color_match(value)
+    if match is None:
+        return None
 
-    tuple_match = TUPLE_PATTERN.match(value)
-    if tuple_match:
-        r, g, b = map(int, tuple_match.groups())
-        _validate_rgb_range(r, g, b)
-        return (r, g, b)
+    hex_digits = match["hex"]
+    if hex_digits is not None:
+        return hex_to_rgb(hex_digits)
 
-    return None
+    r, g, b = int(match["r"]), int(match["g"]), int(match["b"])
+    # Digits are never negative, so only the bits above the low byte matter
+    if (r | g | b) >> 8:
+        raise ValueError(f"RGB values must be 0-255, got ({r}, {g}, {b})")
+    return (r, g, b)
 
 
 @lru_cache(maxsize=512)
@@ -179,30 +211,30 @@ def parse_color(value: str, include_extended: bool = True) -> RGBColor:
         >>> parse_color("puke_green")  # Extended
         (154, 174, 7)
     """
-    # Normalize for caching: strip whitespace and lowercase
-    # This ensures "RED", "red", " red " all hit the same cache entry
-    value_normalized = value.strip().lower()
+    # Strip once; the pattern match below needs the original case
+    value_stripped = value.strip()
 
-    # Try named colors first (CSS4 + Rich)
-    named_result = _try_named_color(value_normalized)
-    if named_result:
-        return named_result
+    # Color names never start with "#" or "(", so skip the name tables for those
+    first_char = value_stripped[:1]
+    if first_char != "#" and first_char != "(":
+        # Names are case-insensitive: "RED", "red", " red " are the same color
+        value_normalized = value_stripped.lower()
 
-    # Try extended colors if enabled
-    if include_extended:
-        from styledconsole.utils.color_registry import get_color
+        # Try named colors first (CSS4 + Rich)
+        named_result = _try_named_color(value_normalized)
+        if named_result:
+            return named_result
 
-        extended_hex = get_color(value_normalized, include_extended=True)
-        if extended_hex:
-            return hex_to_rgb(extended_hex)
+        # Try extended colors if enabled
+        if include_extended:
+            from styledconsole.utils.color_registry import get_color
 
-    # Try hex format (use original stripped value to preserve case for regex)
-    value_stripped = value.strip()
-    if HEX_PATTERN.match(value_stripped):
-        return hex_to_rgb(value_stripped)
+            extended_hex = get_color(value_normalized, include_extended=True)
+            if extended_hex:
+                return hex_to_rgb(extended_hex)
 
-    # Try rgb/tuple formats
-    pattern_result = _try_rgb_pattern(value_stripped)
+    # Try hex/rgb/tuple formats in one match (original case: "rgb" is lowercase-only)
+    pattern_result = _try_color_pattern(value_stripped)
     if pattern_result:
         return pattern_result
 
@@ -215,7 +247,9 @@ def parse_color(value: str, include_extended: bool = True) -> RGBColor:
         from styledconsole.utils.suggestions import suggest_similar
 
         # Try CSS4 colors first (most common), then Rich colors for suggestions
-        suggestion = suggest_similar(value_normalized, list(CSS4_COLORS.keys()), max_distance=2)
+        suggestion = suggest_similar(
+            value_stripped.lower(), list(CSS4_COLORS.keys()), max_distance=2
+        )
         if suggestion:
             raise ValueError(
                 f"{base_msg}. {suggestion} "
@@ -247,26 +281,23 @@ def interpolate_rgb(
 
     Example:
         >>> interpolate_rgb((255, 0, 0), (0, 0, 255), 0.5)
-        (128, 0, 128)
+        (127, 0, 127)
     """
-
-    from rich.color import ColorTriplet, blend_rgb
-
-    # Ensure inputs are in the format Rich expects (ColorTriplet or tuple)
-    # Rich's blend_rgb handles tuples generally, but explicit casting ensures safety
-    c1 = ColorTriplet(*start_rgb)
-    c2 = ColorTriplet(*end_rgb)
-
-    # Rich clamps cross_fade internally? Actually blend_rgb might not clamp.
-    # We should keep our clamping for safety as per original implementation.
-    t = max(0.0, min(1.0, t))
-
-    result = blend_rgb(c1, c2, cross_fade=t)
-
-    # Return as tuple[int, int, int]
-    return (result.red, result.green, result.blue)
+    # Clamp t to [0, 1] with plain comparisons (no min/max calls)
+    t = 0.0 if t < 0.0 else (t if t <= 1.0 else 1.0)
+
+    # Same arithmetic as rich.color.blend_rgb (truncating), without building
+    # ColorTriplets; t is clamped, so every channel stays within 0-255
+    r1, g1, b1 = start_rgb
+    r2, g2, b2 = end_rgb
+    return (
+        int(r1 + (r2 - r1) * t),
+        int(g1 + (g2 - g1) * t),
+        int(b1 + (b2 - b1) * t),
+    )
 
 
+@lru_cache(maxsize=1024)
 def interpolate_color(
     start: str | RGBColor,
     end: str | RGBColor,
@@ -282,13 +313,17 @@ def interpolate_color(
     Returns:
         Hex color string for interpolated color
 
+    Note:
+        Cached with LRU cache (1024 entries): effects and animations
+        request the same (start, end, t) triples on every frame.
+
     Example:
         >>> interpolate_color("#000000", "#FFFFFF", 0.5)
-        '#808080'
+        '#7F7F7F'
         >>> interpolate_color("red", "blue", 0.5)
-        '#800080'
+        '#7F007F'
         >>> interpolate_color((255, 0, 0), (0, 0, 255), 0.5)
-        '#800080'
+        '#7F007F'
     """
     # Parse colors to RGB
     start_rgb = start if isinstance(start, tuple) else parse_color(start)
@@ -320,13 +355,78 @@ def color_distance(color1: str | RGBColor, color2: str | RGBColor) -> float:
         >>> color_distance("red", "darkred") < color_distance("red", "blue")
         True
     """
-    # Parse colors
-    rgb1 = color1 if isinstance(color1, tuple) else parse_color(color1)
+    # Euclidean distance in RGB space
+    return color_distance_sq(color1, color2) ** 0.5
+
+
+def color_distance_sq(color1: str | RGBColor, color2: str | RGBColor) -> int:
+    """Calculate squared Euclidean distance between two colors in RGB space.
 
+    Orders colors the same way as color_distance() without the square root,
+    so prefer it when distances are only compared (e.g. nearest color).
+
+    Args:
+        color1: First color
+        color2: Second color
+
+    Returns:
+        Squared distance (0 = identical, 195075 = black<->white)
+
+    Example:
+        >>> color_distance_sq("#000000", "#FFFFFF")
+        195075
+    """
+    rgb1 = color1 if isinstance(color1, tuple) else parse_color(color1)
     rgb2 = color2 if isinstance(color2, tuple) else parse_color(color2)
 
-    # Euclidean distance in RGB space
-    return ((rgb1[0] - rgb2[0]) ** 2 + (rgb1[1] - rgb2[1]) ** 2 + (rgb1[2] - rgb2[2]) ** 2) ** 0.5
+    dr = rgb1[0] - rgb2[0]
+    dg = rgb1[1] - rgb2[1]
+    db = rgb1[2] - rgb2[2]
+    return dr * dr + dg * dg + db * db
+
+
+@lru_cache(maxsize=1)
+def _css4_palette() -> tuple[tuple[str, int, int, int], ...]:
+    """Build (name, r, g, b) rows for the CSS4 colors, in table order."""
+    return tuple((name, *hex_to_rgb(hex_code)) for name, hex_code in CSS4_COLORS.items())
+
+
+@lru_cache(maxsize=256)
+def _nearest_css4_name(rgb: RGBColor) -> str:
+    """Find the CSS4 name closest to an RGB tuple (first match on ties)."""
+    r, g, b = rgb
+    best_name = ""
+    best_dist = 1 << 20  # Above the largest possible squared distance
+    for name, pr, pg, pb in _css4_palette():
+        dr = pr - r
+        dg = pg - g
+        db = pb - b
+        dist = dr * dr + dg * dg + db * db
+        if dist < best_dist:
+            best_name, best_dist = name, dist
+    return best_name
+
+
+def nearest_color_name(color: str | RGBColor) -> str:
+    """Find the CSS4 color name closest to a color.
+
+    Closeness is squared Euclidean distance in RGB space (see
+    color_distance_sq). Results are cached per RGB value.
+
+    Args:
+        color: Color in any supported format, or an RGB tuple
+
+    Returns:
+        CSS4 color name (lowercase)
+
+    Example:
+        >>> nearest_color_name("#FE0101")
+        'red'
+        >>> nearest_color_name((30, 144, 250))
+        'dodgerblue'
+    """
+    rgb = color if isinstance(color, tuple) else parse_color(color)
+    return _nearest_css4_name(rgb)
 
 
 @lru_cache(maxsize=256)
@@ -376,7 +476,12 @@ def normalize_color_for_rich(color: str | None) -> str | None:
     if color.startswith("#"):
         return color
 
-    # Try parsing as CSS4/Rich color name
+    # CSS4/Rich names resolve straight from the precomputed hex table
+    named_hex = _named_hex().get(color.lower())
+    if named_hex is not None:
+        return named_hex
+
+    # Try parsing as extended name, rgb() or tuple
     try:
         r, g, b = parse_color(color)
         return rgb_to_hex(r, g, b)
@@ -423,31 +528,22 @@ def apply_line_gradient(
     start_rgb = parse_color(start_color)
     end_rgb = parse_color(end_color)
 
-    from rich.text import Text
+    hex_colors = _gradient_colors(start_rgb, end_rgb, len(lines))
+    return _render_styled_lines(lines, hex_colors)
 
-    from styledconsole.utils.color import _get_string_render_console
 
-    console = _get_string_render_console()
-    colored_lines = []
-    num_lines = len(lines)
+@lru_cache(maxsize=128)
+def _gradient_colors(start_rgb: RGBColor, end_rgb: RGBColor, num_lines: int) -> tuple[str, ...]:
+    """Compute the hex color of each line of a vertical gradient.
 
-    for i, line in enumerate(lines):
-        # Calculate gradient position (0.0 to 1.0)
-        t = i / (num_lines - 1) if num_lines > 1 else 0.0
-
-        # Interpolate color using optimized RGB function
-        r, g, b = interpolate_rgb(start_rgb, end_rgb, t)
-        hex_color = rgb_to_hex(r, g, b)
-
-        # Create Text object from line (handling existing ANSI)
-        text_obj = Text.from_ansi(line)
-        text_obj.stylize(hex_color)
-
-        with console.capture() as capture:
-            console.print(text_obj, end="")
-        colored_lines.append(capture.get())
-
-    return colored_lines
+    Cached so repeated gradients (same endpoints and height) reuse the ramp.
+    """
+    last = num_lines - 1
+    return tuple(
+        # Gradient position runs from 0.0 (first line) to 1.0 (last line)
+        rgb_to_hex(*interpolate_rgb(start_rgb, end_rgb, i / last if last else 0.0))
+        for i in range(num_lines)
+    )
 
 
 def apply_rainbow_gradient(
@@ -481,32 +577,126 @@ def apply_rainbow_gradient(
     if policy is not None and not policy.color:
         return lines
 
-    from rich.text import Text
+    num_lines = len(lines)
+    # Calculate gradient position (0.0 to 1.0) and the rainbow color there
+    hex_colors = [
+        get_rainbow_color(i / (num_lines - 1) if num_lines > 1 else 0.0) for i in range(num_lines)
+    ]
 
-    from styledconsole.utils.color import _get_string_render_console
+    return _render_styled_lines(lines, hex_colors)
 
-    console = _get_string_render_console()
-    colored_lines = []
-    num_lines = len(lines)
 
-    for i, line in enumerate(lines):
-        # Calculate gradient position (0.0 to 1.0)
-        t = i / (num_lines - 1) if num_lines > 1 else 0.0
+def _render_styled_lines(lines: list[str], colors: Sequence[str]) -> list[str]:
+    """Render each line in its color to an ANSI string.
+
+    Plain lines in plain colors are wrapped in SGR codes directly; the rest
+    go through Rich.
+
+    Args:
+        lines: Text lines, possibly containing ANSI codes.
+        colors: Color for each line, in a form Rich's stylize accepts.
+
+    Returns:
+        ANSI-colored lines, one per input line.
+    """
+    rendered = [_colorize_plain(line, color) for line, color in zip(lines, colors, strict=True)]
+    pending = [i for i, text in enumerate(rendered) if text is None]
+    if pending:
+        rich_lines = _render_with_rich([lines[i] for i in pending], [colors[i] for i in pending])
+        for i, text in zip(pending, rich_lines, strict=True):
+            rendered[i] = text
+    return rendered  # type: ignore[return-value]
+
 
-        # Get rainbow color at this position
-        hex_color = get_rainbow_color(t)
+def _render_with_rich(lines: list[str], colors: Sequence[str]) -> list[str]:
+    """Render each line in its color through Rich.
 
+    All lines go through Rich in one capture, joined by newlines, instead of
+    one capture per line; the output is split back into lines. If a line
+    renders to more than one line (it contains a newline or wraps), the
+    split no longer lines up and every line is rendered on its own instead.
+
+    Args:
+        lines: Text lines, possibly containing ANSI codes.
+        colors: Color for each line, in a form Rich's stylize accepts.
+
+    Returns:
+        ANSI-colored lines, one per input line.
+    """
+    from rich.text import Text
+
+    console = _get_string_render_console()
+
+    texts = []
+    for line, color in zip(lines, colors, strict=True):
         # Create Text object from line (handling existing ANSI)
         text_obj = Text.from_ansi(line)
-        text_obj.stylize(hex_color)
+        text_obj.stylize(color)
+        texts.append(text_obj)
+
+    with console.capture() as capture:
+        console.print(Text("\n").join(texts), end="")
+    rendered = capture.get().split("\n")
+    if len(rendered) == len(lines):
+        return rendered
 
+    colored_lines = []
+    for text_obj in texts:
         with console.capture() as capture:
             console.print(text_obj, end="")
         colored_lines.append(capture.get())
-
     return colored_lines
 
 
+_RESET = "\x1b[0m"
+
+# Longest text guaranteed to fit the string render console's width, even
+# if every character is double-width
+_PLAIN_TEXT_MAX_LEN = 5000
+
+
+@lru_cache(maxsize=1024)
+def _ansi_fg(r: int, g: int, b: int) -> str:
+    """Return the truecolor foreground SGR sequence for an RGB color."""
+    return f"\x1b[38;2;{r};{g};{b}m"
+
+
+@lru_cache(maxsize=256)
+def _fg_prefix(color: str) -> str | None:
+    """Return the SGR sequence Rich emits for a plain foreground color.
+
+    Returns None for anything that is not a single color (e.g. "bold red"),
+    which has to go through Rich.
+    """
+    hex_color = normalize_color_for_rich(color)
+    if hex_color is None or len(hex_color) != 7 or hex_color[0] != "#":
+        return None
+    try:
+        return _ansi_fg(*hex_to_rgb(hex_color))
+    except ValueError:
+        return None
+
+
+def _colorize_plain(text: str, color: str) -> str | None:
+    """Wrap plain text in the SGR codes Rich would emit for it.
+
+    Only handles text Rich prints verbatim (no ANSI codes, control
+    characters, tabs, or lines long enough to wrap) in a single color.
+
+    Returns:
+        The colored text, or None if it has to be rendered through Rich.
+    """
+    if len(text) > _PLAIN_TEXT_MAX_LEN or not text.replace("\n", "").isprintable():
+        return None
+    prefix = _fg_prefix(color)
+    if prefix is None:
+        return None
+    if "\n" not in text:
+        return prefix + text + _RESET if text else text
+    # Rich styles each line on its own and leaves empty lines bare
+    return "\n".join(prefix + line + _RESET if line else line for line in text.split("\n"))
+
+
 @lru_cache(maxsize=1)
 def _get_string_render_console() -> Console:
     """Get a cached Rich Console for string rendering operations."""
@@ -542,6 +732,11 @@ def colorize_text(
     if policy is not None and not policy.color:
         return text
 
+    # Plain text in a plain color needs no Rich round trip
+    colored = _colorize_plain(text, color)
+    if colored is not None:
+        return colored
+
     # Optimizing: Use a shared/cached console for rendering to string
     # We do this lazily to avoid import overhead if possible, or global caching
     from styledconsole.utils.color import _get_string_render_console
@@ -613,9 +808,19 @@ NEON_RAINBOW_COLORS = [
 ]
 
 
+@lru_cache(maxsize=2)
+def _rainbow_stops(neon: bool) -> tuple[RGBColor, ...]:
+    """Parse the rainbow spectrum to RGB tuples once per palette."""
+    return tuple(parse_color(color) for color in (NEON_RAINBOW_COLORS if neon else RAINBOW_COLORS))
+
+
+@lru_cache(maxsize=1024)
 def get_rainbow_color(position: float, neon: bool = False) -> str:
     """Get rainbow color at a specific position.
 
+    Cached with LRU cache (1024 entries): gradients ask for the same
+    positions (i / (n - 1)) on every line they color.
+
     Args:
         position: Position in rainbow (0.0 = red, 1.0 = violet)
         neon: If True, use neon/cyberpunk color palette instead of standard rainbow
@@ -623,14 +828,16 @@ def get_rainbow_color(position: float, neon: bool = False) -> str:
     Returns:
         Hex color code at that position in rainbow spectrum
     """
-    colors = NEON_RAINBOW_COLORS if neon else RAINBOW_COLORS
+    stops = _rainbow_stops(neon)
     position = max(0.0, min(1.0, position))
-    num_segments = len(colors) - 1
+    num_segments = len(stops) - 1
     segment_size = 1.0 / num_segments
     segment_index = min(int(position / segment_size), num_segments - 1)
     local_position = (position - segment_index * segment_size) / segment_size
 
-    return interpolate_color(colors[segment_index], colors[segment_index + 1], local_position)
+    return rgb_to_hex(
+        *interpolate_rgb(stops[segment_index], stops[segment_index + 1], local_position)
+    )
 
 
 def apply_dim(color: str | RGBColor | None, factor: float = 0.5) -> str | RGBColor | None:
@@ -652,6 +859,17 @@ def apply_dim(color: str | RGBColor | None, factor: float = 0.5) -> str | RGBCol
         r, g, b = color
         return (int(r * factor), int(g * factor), int(b * factor))
 
+    # Fast path for the default half-brightness dim of "#RRGGBB": masking each
+    # channel's low bit lets one shift halve all three channels at once
+    # (same truncation as interpolating with black).
+    if factor == 0.5 and len(color) == 7 and color[0] == "#":
+        digits = color[1:]
+        if digits.isascii() and digits.isalnum():
+            try:
+                return f"#{(int(digits, 16) & 0xFEFEFE) >> 1:06X}"
+            except ValueError:
+                pass
+
     # Handle string (hex or name)
     # We want to return hex if input was string to maintain compatibility
     return interpolate_color("#000000", color, factor)
@@ -668,6 +886,7 @@ __all__ = [
     "apply_line_gradient",
     "apply_rainbow_gradient",
     "color_distance",
+    "color_distance_sq",
     "color_to_ansi",
     "colorize",
     "colorize_text",
@@ -676,6 +895,7 @@ __all__ = [
     "hex_to_rgb",
     "interpolate_color",
     "interpolate_rgb",
+    "nearest_color_name",
     "normalize_color_for_rich",
     "parse_color",
     "rgb_to_hex",
@@ -42,6 +42,13 @@ except ImportError as err:
 
 EMOJI_PACKAGE_AVAILABLE = True
 
+# Match classes yielded by emoji.analyze(); loops dispatch on the exact type,
+# which is cheaper than isinstance() walking the subclass chain
+# (EmojiMatchZWJNonRGI -> EmojiMatchZWJ -> EmojiMatch)
+_EmojiMatch = _emoji_pkg.EmojiMatch
+_EmojiMatchZWJ = _emoji_pkg.EmojiMatchZWJ
+_EmojiMatchZWJNonRGI = _emoji_pkg.EmojiMatchZWJNonRGI
+
 if TYPE_CHECKING:
     from typing import Any
 
@@ -109,18 +116,16 @@ def is_zwj_sequence(text: str) -> bool:
         >>> is_zwj_sequence("🚀")
         False
     """
+    # Every ZWJ sequence contains U+200D; without it there is nothing to analyze
+    if "\u200d" not in text:
+        return False
     for token in _emoji_pkg.analyze(text, join_emoji=True):
-        if hasattr(token.value, "emoji"):
-            # Check if the matched emoji contains ZWJ character
-            emoji_str = token.value.emoji
-            if "\u200d" in emoji_str:
-                return True
-            # Also check for ZWJ/non-RGI match types
-            if isinstance(
-                token.value,
-                (_emoji_pkg.EmojiMatchZWJ, _emoji_pkg.EmojiMatchZWJNonRGI),
-            ):
-                return True
+        match_type = type(token.value)
+        # ZWJ/non-RGI match types, or a plain match that contains the ZWJ character
+        if match_type is _EmojiMatchZWJ or match_type is _EmojiMatchZWJNonRGI:
+            return True
+        if match_type is _EmojiMatch and "\u200d" in token.value.emoji:
+            return True
     return False
 
 
@@ -149,29 +154,39 @@ def analyze_emoji_safety(text: str) -> dict[str, Any]:
         False
     """
     results: dict[str, Any] = {
-        "emoji_count": _emoji_pkg.emoji_count(text),
+        "emoji_count": 0,
         "safe_emojis": [],
         "zwj_sequences": [],
         "non_rgi": [],
         "all_safe": True,
     }
+    # ASCII-only text holds no emoji; skip tokenizing it
+    if text.isascii():
+        return results
 
+    # Count in the same pass: emoji_count() would tokenize the text again, and
+    # counts each emoji of a joined non-RGI sequence separately
+    emoji_count = 0
     for token in _emoji_pkg.analyze(text, join_emoji=True):
-        if hasattr(token.value, "emoji"):
-            match = token.value
+        match = token.value
+        match_type = type(match)
+
+        # Check for non-RGI ZWJ sequences first
+        if match_type is _EmojiMatchZWJNonRGI:
+            emoji_count += len(match.emojis)
+            results["non_rgi"].append(match.emoji)
+            results["all_safe"] = False
+        elif match_type is _EmojiMatchZWJ or match_type is _EmojiMatch:
+            emoji_count += 1
             emoji_char = match.emoji
-
-            # Check for non-RGI ZWJ sequences first
-            if isinstance(match, _emoji_pkg.EmojiMatchZWJNonRGI):
-                results["non_rgi"].append(emoji_char)
-                results["all_safe"] = False
             # Check for ZWJ match type or ZWJ character in emoji
-            elif isinstance(match, _emoji_pkg.EmojiMatchZWJ) or "\u200d" in emoji_char:
+            if match_type is _EmojiMatchZWJ or "\u200d" in emoji_char:
                 results["zwj_sequences"].append(emoji_char)
                 results["all_safe"] = False
             else:
                 results["safe_emojis"].append(emoji_char)
 
+    results["emoji_count"] = emoji_count
     return results
 
 
@@ -195,36 +210,25 @@ def get_emoji_info(char: str) -> EmojiInfo:
         >>> info.version
         0.6
     """
-    if not _emoji_pkg.is_emoji(char):
+    # One lookup both validates and provides the metadata (is_emoji is a
+    # membership test on the same table)
+    data = _emoji_pkg.EMOJI_DATA.get(char)
+    if data is None:
         return EmojiInfo(emoji=char, name="", is_valid=False, terminal_safe=False)
 
-    # Check if ZWJ sequence - either by match type or presence of ZWJ character
-    is_zwj = "\u200d" in char  # Direct check for ZWJ character
-    is_zwj_non_rgi = False
-    for token in _emoji_pkg.analyze(char, join_emoji=True):
-        if hasattr(token.value, "emoji"):
-            if isinstance(token.value, _emoji_pkg.EmojiMatchZWJNonRGI):
-                is_zwj_non_rgi = True
-                is_zwj = True
-            elif isinstance(token.value, _emoji_pkg.EmojiMatchZWJ):
-                is_zwj = True
-
-    # Get metadata from EMOJI_DATA
-    data = _emoji_pkg.EMOJI_DATA.get(char, {})
-    name = data.get("en", "").strip(":").replace("_", " ")
-    version = data.get("E")
-
-    # ZWJ sequences are not terminal-safe
-    terminal_safe = not is_zwj
+    # A valid emoji is a single RGI entry, so analyze() would match it whole as
+    # a plain EmojiMatch: ZWJ status is just the presence of the joiner, and a
+    # non-RGI ZWJ sequence can't be valid
+    is_zwj = "\u200d" in char
 
     return EmojiInfo(
         emoji=char,
-        name=name,
+        name=data.get("en", "").strip(":").replace("_", " "),
         is_valid=True,
         is_zwj=is_zwj,
-        is_zwj_non_rgi=is_zwj_non_rgi,
-        version=version,
-        terminal_safe=terminal_safe,
+        version=data.get("E"),
+        # ZWJ sequences are not terminal-safe
+        terminal_safe=not is_zwj,
     )
 
 
@@ -247,10 +251,9 @@ def get_emoji_version(char: str) -> float | None:
         >>> get_emoji_version("A")  # Not an emoji
         None
     """
-    if not _emoji_pkg.is_emoji(char):
-        return None
-
-    return _emoji_pkg.version(char)
+    # emoji.version() would repeat the membership test before the same lookup
+    data = _emoji_pkg.EMOJI_DATA.get(char)
+    return None if data is None else data["E"]
 
 
 def filter_by_version(text: str, max_version: float = 5.0, replacement: str = "□") -> str:
@@ -347,6 +350,10 @@ def emoji_list(text: str) -> list[dict[str, Any]]:
         [{'emoji': '👋', 'match_start': 6, 'match_end': 7},
          {'emoji': '🌍', 'match_start': 14, 'match_end': 15}]
     """
+    # Every emoji has a non-ASCII codepoint, so plain ASCII text (the common
+    # case for log lines) needs no scan
+    if text.isascii():
+        return []
     return list(_emoji_pkg.emoji_list(text))  # type: ignore[arg-type]
 
 
@@ -0,0 +1,17 @@
+"""Shared types for the icon data modules."""
+
+from typing import NamedTuple
+
+
+class IconMapping(NamedTuple):
+    """Mapping from emoji to ASCII with optional color.
+
+    Attributes:
+        emoji: The Unicode emoji character(s)
+        ascii: ASCII fallback representation
+        color: Rich-compatible color (CSS4 name, hex, or None for default)
+    """
+
+    emoji: str
+    ascii: str
+    color: str | None
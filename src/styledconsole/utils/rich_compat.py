@@ -19,23 +19,37 @@ Usage:
 
 from __future__ import annotations
 
-from collections.abc import Callable, Generator
+import importlib
+from collections.abc import Generator
 from contextlib import contextmanager
+from functools import cache
+from types import ModuleType
 
 from styledconsole.utils.terminal import is_modern_terminal
 
-# Rich modules that cache cell_len at import time and need patching.
+# Rich module attributes holding cell_len at import time that need patching.
 # We must patch ALL modules that import cell_len directly, not just rich.cells,
 # because Python's import creates separate local references.
-_RICH_MODULES_TO_PATCH = (
-    "rich.cells",
-    "rich.segment",
-    "rich.text",
-    "rich.containers",
-    "rich.panel",
-    "rich._wrap",
+_RICH_ATTRS_TO_PATCH = (
+    ("rich.cells", "cell_len"),
+    ("rich.cells", "cached_cell_len"),
+    ("rich.segment", "cell_len"),
+    ("rich.segment", "cached_cell_len"),
+    ("rich.text", "cell_len"),
+    ("rich.containers", "cell_len"),
+    ("rich.panel", "cell_len"),
+    ("rich._wrap", "cell_len"),
 )
 
+# Nesting depth of active patched_cell_len() blocks (e.g. a table in columns)
+_patch_depth = 0
+
+
+@cache
+def _patch_targets() -> tuple[tuple[ModuleType, str], ...]:
+    """Resolve the Rich modules to patch, importing them on first use."""
+    return tuple((importlib.import_module(name), attr) for name, attr in _RICH_ATTRS_TO_PATCH)
+
 
 @contextmanager
 def patched_cell_len() -> Generator[None, None, None]:
@@ -47,7 +61,9 @@ def patched_cell_len() -> Generator[None, None, None]:
 
     We must patch cell_len in ALL Rich modules that import it directly,
     not just in rich.cells, because Python's import system creates separate
-    references.
+    references. Nested blocks reuse the outer patch, and Rich's own
+    cached_cell_len LRU is left intact: it is swapped out while patched, so
+    it never sees patched widths and stays warm across renders.
 
     Example:
         >>> from styledconsole.utils.rich_compat import patched_cell_len
@@ -55,63 +71,32 @@ def patched_cell_len() -> Generator[None, None, None]:
         ...     # Rich Panel/Table/Columns will use correct emoji width
         ...     console.print(StyledPanel("Status: ✅"))
     """
-    if not is_modern_terminal():
-        # No patch needed for non-modern terminals
+    global _patch_depth
+
+    if _patch_depth or not is_modern_terminal():
+        # Already patched by an enclosing block, or not needed in this terminal
         yield
         return
 
-    # Import Rich modules dynamically to avoid import-time side effects
-    import rich._wrap
-    import rich.cells
-    import rich.containers
-    import rich.panel
-    import rich.segment
-    import rich.text
-
     from styledconsole.utils.text import visual_width
 
-    def _patched_cell_len(text: str) -> int:
-        """Use visual_width for accurate emoji width in modern terminals."""
+    def cell_len(text: str, unicode_version: str = "auto") -> int:
+        # Same signature as Rich's cell_len; visual_width has no unicode_version
         return visual_width(text)
 
-    # Clear LRU cache FIRST to prevent stale cached width values
-    if hasattr(rich.cells.cached_cell_len, "cache_clear"):
-        rich.cells.cached_cell_len.cache_clear()
-
-    # Save original functions from ALL modules that use cell_len
-    originals: dict[str, Callable[[str], int]] = {
-        "cells.cell_len": rich.cells.cell_len,
-        "cells.cached_cell_len": rich.cells.cached_cell_len,
-        "segment.cell_len": rich.segment.cell_len,
-        "segment.cached_cell_len": rich.segment.cached_cell_len,
-        "text": rich.text.cell_len,
-        "containers": rich.containers.cell_len,
-        "panel": rich.panel.cell_len,
-        "_wrap": rich._wrap.cell_len,
-    }
-
-    # Patch ALL modules including segment and cached_cell_len
-    rich.cells.cell_len = _patched_cell_len  # type: ignore[assignment]
-    rich.cells.cached_cell_len = _patched_cell_len  # type: ignore[assignment]
-    rich.segment.cell_len = _patched_cell_len  # type: ignore[assignment]
-    rich.segment.cached_cell_len = _patched_cell_len  # type: ignore[assignment]
-    rich.text.cell_len = _patched_cell_len  # type: ignore[assignment]
-    rich.containers.cell_len = _patched_cell_len  # type: ignore[assignment]
-    rich.panel.cell_len = _patched_cell_len  # type: ignore[assignment]
-    rich._wrap.cell_len = _patched_cell_len  # type: ignore[assignment]
+    targets = _patch_targets()
+    originals = [getattr(module, attr) for module, attr in targets]
+    for module, attr in targets:
+        setattr(module, attr, cell_len)
+    _patch_depth += 1
 
     try:
         yield
     finally:
+        _patch_depth -= 1
         # Restore ALL originals
-        rich.cells.cell_len = originals["cells.cell_len"]  # type: ignore[assignment]
-        rich.cells.cached_cell_len = originals["cells.cached_cell_len"]  # type: ignore[assignment]
-        rich.segment.cell_len = originals["segment.cell_len"]  # type: ignore[assignment]
-        rich.segment.cached_cell_len = originals["segment.cached_cell_len"]  # type: ignore[assignment]
-        rich.text.cell_len = originals["text"]  # type: ignore[assignment]
-        rich.containers.cell_len = originals["containers"]  # type: ignore[assignment]
-        rich.panel.cell_len = originals["panel"]  # type: ignore[assignment]
-        rich._wrap.cell_len = originals["_wrap"]  # type: ignore[assignment]
+        for (module, attr), original in zip(targets, originals, strict=True):
+            setattr(module, attr, original)
 
 
 __all__ = ["patched_cell_len"]
@@ -9,6 +9,8 @@ with optional color markup for visual consistency.
 
 from __future__ import annotations
 
+import re
+from functools import cache
 from typing import Any
 
 from rich.markup import escape
@@ -16,6 +18,50 @@ from rich.markup import escape
 from styledconsole.utils.icon_data import EMOJI_TO_ICON
 
 
+@cache
+def _translatable_emojis() -> frozenset[str]:
+    """Single-codepoint emojis that str.translate can replace safely.
+
+    A codepoint that also occurs inside a longer sequence (e.g. "❤" in "❤️")
+    is left to the regex pass, so translating it cannot break that sequence.
+    """
+    in_sequences = {char for emoji in EMOJI_TO_ICON if len(emoji) > 1 for char in emoji}
+    return frozenset(e for e in EMOJI_TO_ICON if len(e) == 1 and e not in in_sequences)
+
+
+@cache
+def _emoji_pattern() -> re.Pattern[str] | None:
+    """Compile an alternation of the emojis not handled by str.translate.
+
+    Longer sequences must win over their prefixes (e.g. "❤️" over "❤"), so
+    the alternation is ordered by length. Built on first use.
+
+    Returns:
+        Compiled pattern, or None if every emoji is translatable.
+    """
+    translatable = _translatable_emojis()
+    rest = sorted((e for e in EMOJI_TO_ICON if e not in translatable), key=len, reverse=True)
+    return re.compile("|".join(map(re.escape, rest))) if rest else None
+
+
+@cache
+def _replacements(with_color: bool) -> dict[str, str]:
+    """Map each known emoji to its (optionally colored) ASCII replacement."""
+    return {
+        emoji: f"[{mapping.color}]{escape(mapping.ascii)}[/]"
+        if with_color and mapping.color
+        else escape(mapping.ascii)
+        for emoji, mapping in EMOJI_TO_ICON.items()
+    }
+
+
+@cache
+def _translation_table(with_color: bool) -> dict[int, str]:
+    """Build the str.translate table for single-codepoint emojis."""
+    replacements = _replacements(with_color)
+    return {ord(emoji): replacements[emoji] for emoji in _translatable_emojis()}
+
+
 def sanitize_emoji_content(content: Any, with_color: bool = True) -> Any:
     """Sanitize content by replacing emoji with ASCII equivalents.
 
@@ -34,23 +80,24 @@ def sanitize_emoji_content(content: Any, with_color: bool = True) -> Any:
 
     Example:
         >>> sanitize_emoji_content("Status: ✅ Done")
-        'Status: [green][OK][/] Done'
+        'Status: [green](OK)[/] Done'
         >>> sanitize_emoji_content("Status: ✅ Done", with_color=False)
-        'Status: [OK] Done'
+        'Status: (OK) Done'
     """
     if not isinstance(content, str):
         return content
+    # Every known emoji is non-ASCII; most cells (headers, numbers, IDs) are not
+    if content.isascii():
+        return content
 
-    result = content
-    for emoji, mapping in EMOJI_TO_ICON.items():
-        if emoji in result:
-            if with_color and mapping.color:
-                # Use Rich markup for color
-                replacement = f"[{mapping.color}]{escape(mapping.ascii)}[/]"
-            else:
-                replacement = escape(mapping.ascii)
-            result = result.replace(emoji, replacement)
-    return result
+    # Most known emojis are single codepoints: map them in one C-level pass,
+    # then resolve the remaining multi-codepoint sequences with one regex scan
+    result = content.translate(_translation_table(with_color))
+    pattern = _emoji_pattern()
+    if pattern is None:
+        return result
+    replacements = _replacements(with_color)
+    return pattern.sub(lambda m: replacements[m.group()], result)
 
 
 __all__ = ["sanitize_emoji_content"]
@@ -5,6 +5,8 @@ Tests real-world usage patterns and visual output correctness.
 
 from io import StringIO
 
+from rich.color import ColorSystem
+
 from styledconsole import Console
 from styledconsole.utils.text import strip_ansi, visual_width
 
@@ -16,7 +18,7 @@ def render_banner_to_lines(text: str, **kwargs) -> list[str]:
     console = Console(file=buffer, width=width)
     # Force terminal to ensure ANSI codes are generated
     console._rich_console.force_terminal = True
-    console._rich_console._color_system = "truecolor"  # Force truecolor for ANSI checks
+    console._rich_console._color_system = ColorSystem.TRUECOLOR  # Force truecolor for ANSI checks
     console.banner(text, **kwargs)
     return buffer.getvalue().splitlines()
 
@@ -3,12 +3,15 @@
 import pytest
 
 from styledconsole.utils.color import (
+    apply_dim,
     apply_line_gradient,
     color_distance,
+    color_distance_sq,
     colorize_text,
     get_color_names,
     hex_to_rgb,
     interpolate_color,
+    nearest_color_name,
     normalize_color_for_rich,
     parse_color,
     rgb_to_hex,
@@ -50,6 +53,17 @@ class TestHexToRgb:
         with pytest.raises(ValueError, match="Invalid hex color"):
             hex_to_rgb("#1234567")
 
+    @pytest.mark.parametrize("value", ["#12 34 5", "#fff\n", "#0x1234", "#"])
+    def test_non_hex_characters_raise(self, value):
+        """Whitespace and other non-hex characters are rejected."""
+        with pytest.raises(ValueError, match="Invalid hex color"):
+            hex_to_rgb(value)
+
+    def test_matches_int_parsing_for_all_bytes(self):
+        """Every byte value round-trips in both cases."""
+        for i in range(256):
+            assert hex_to_rgb(f"#{i:02x}{i:02X}{i:02x}") == (i, i, i)
+
 
 class TestRgbToHex:
     """Test RGB to hex conversion."""
@@ -67,6 +81,15 @@ class TestRgbToHex:
         assert rgb_to_hex(30, 144, 255) == "#1E90FF"  # dodgerblue
         assert rgb_to_hex(255, 127, 80) == "#FF7F50"  # coral
 
+    def test_matches_format_spec_for_all_bytes(self):
+        """Every byte value renders as two uppercase hex digits."""
+        for i in range(256):
+            assert rgb_to_hex(i, 255 - i, i // 2) == f"#{i:02X}{255 - i:02X}{i // 2:02X}"
+
+    def test_round_trip_with_hex_to_rgb(self):
+        """rgb_to_hex inverts hex_to_rgb."""
+        assert hex_to_rgb(rgb_to_hex(1, 128, 254)) == (1, 128, 254)
+
     def test_out_of_range_raises(self):
         """Values outside 0-255 raise ValueError."""
         with pytest.raises(ValueError, match="must be 0-255"):
@@ -75,6 +98,10 @@ class TestRgbToHex:
             rgb_to_hex(0, -1, 0)
         with pytest.raises(ValueError, match="must be 0-255"):
             rgb_to_hex(0, 0, 300)
+        with pytest.raises(ValueError, match="must be 0-255"):
+            rgb_to_hex(-256, 0, 0)
+        with pytest.raises(ValueError, match="must be 0-255"):
+            rgb_to_hex(0, 1 << 20, 0)
 
 
 class TestParseColor:
@@ -131,6 +158,45 @@ class TestParseColor:
         with pytest.raises(ValueError, match="Invalid color format"):
             parse_color("")
 
+    def test_parse_rejects_non_ascii_digits(self):
+        """rgb()/tuple components must be ASCII digits."""
+        with pytest.raises(ValueError, match="Invalid color format"):
+            parse_color("(\u0661, \u0662, \u0663)")  # Arabic-Indic 1, 2, 3
+        with pytest.raises(ValueError, match="Invalid color format"):
+            parse_color("rgb(\uff11, 0, 0)")  # Fullwidth 1
+
+    def test_rgb_prefix_is_case_sensitive(self):
+        """Only lowercase rgb() is accepted, as before the combined pattern."""
+        with pytest.raises(ValueError, match="Invalid color format"):
+            parse_color("RGB(1, 2, 3)")
+        with pytest.raises(ValueError, match="Invalid color format"):
+            parse_color("rgb(1, 2)")
+
+    def test_named_table_matches_source_tables(self):
+        """CSS4 names win over Rich names in the merged lookup table."""
+        from styledconsole.utils.color import _named_rgb
+        from styledconsole.utils.color_data import CSS4_COLORS, RICH_TO_CSS4_MAPPING
+
+        table = _named_rgb()
+        assert table.keys() == CSS4_COLORS.keys() | RICH_TO_CSS4_MAPPING.keys()
+        for name, hex_code in CSS4_COLORS.items():
+            assert table[name] == hex_to_rgb(hex_code)
+
+    def test_hex_and_tuple_skip_name_lookup(self, monkeypatch):
+        """Values starting with '#' or '(' never reach the name tables."""
+        from styledconsole.utils import color
+
+        def fail(_value):
+            raise AssertionError("name lookup should be skipped")
+
+        monkeypatch.setattr(color, "_try_named_color", fail)
+        parse_color.cache_clear()
+        try:
+            assert parse_color("#0a0B0c") == (10, 11, 12)
+            assert parse_color(" (1, 2, 3) ") == (1, 2, 3)
+        finally:
+            parse_color.cache_clear()
+
 
 class TestInterpolateColor:
     """Test color interpolation."""
@@ -177,6 +243,25 @@ class TestInterpolateColor:
         # t > 1 should be treated as 1
         assert interpolate_color("#000000", "#FFFFFF", 1.5) == "#FFFFFF"
 
+    def test_interpolate_color_cached(self):
+        """Repeated (start, end, t) triples are served from the cache."""
+        interpolate_color.cache_clear()
+        first = interpolate_color("red", (0, 0, 255), 0.25)
+        assert interpolate_color("red", (0, 0, 255), 0.25) == first
+        assert interpolate_color.cache_info().hits == 1
+
+    def test_interpolate_rgb_matches_rich_blend(self):
+        """interpolate_rgb truncates exactly like Rich's blend_rgb."""
+        from rich.color import ColorTriplet, blend_rgb
+
+        from styledconsole.utils.color import interpolate_rgb
+
+        start, end = (255, 10, 3), (0, 200, 254)
+        for i in range(11):
+            t = i / 10
+            expected = blend_rgb(ColorTriplet(*start), ColorTriplet(*end), t)
+            assert interpolate_rgb(start, end, t) == tuple(expected)
+
     def test_interpolate_gradient_examples(self):
         """Real-world gradient examples."""
         # Coral to dodgerblue gradient
@@ -189,6 +274,30 @@ class TestInterpolateColor:
         assert 125 <= rgb[2] <= 140
 
 
+class TestApplyDim:
+    """Test dimming colors."""
+
+    @pytest.mark.parametrize("color", ["#FFFFFF", "#cdd6f4", "#010101", "#000000", "#7F80FE"])
+    def test_hex_fast_path_matches_interpolation(self, color):
+        """Half dim of #RRGGBB matches interpolating with black."""
+        assert apply_dim(color) == interpolate_color("#000000", color, 0.5)
+
+    def test_other_formats_and_factors(self):
+        """Names, shorthand hex and custom factors still work."""
+        assert apply_dim("red") == "#7F0000"
+        assert apply_dim("#abc") == "#555D66"
+        assert apply_dim("#FFFFFF", 0.25) == interpolate_color("#000000", "#FFFFFF", 0.25)
+
+    def test_invalid_hex_digits_rejected(self):
+        """Strings that only look like hex fall back to normal parsing."""
+        with pytest.raises(ValueError):
+            apply_dim("#-12345")
+
+    def test_rgb_tuple(self):
+        """RGB tuples are dimmed channel-wise."""
+        assert apply_dim((255, 128, 1)) == (127, 64, 0)
+
+
 class TestColorDistance:
     """Test color distance calculation."""
 
@@ -226,6 +335,41 @@ class TestColorDistance:
         assert dist1 == dist2 == 0.0
 
 
+class TestColorDistanceSq:
+    """Test squared color distance."""
+
+    def test_black_white(self):
+        """Squared distance is exact integer arithmetic."""
+        assert color_distance_sq("#000000", "#FFFFFF") == 3 * 255 * 255
+
+    def test_consistent_with_color_distance(self):
+        """color_distance is the square root of the squared distance."""
+        for a, b in [("red", "darkred"), ("coral", (0, 0, 255)), ("#123456", "rgb(1, 2, 3)")]:
+            assert color_distance(a, b) == color_distance_sq(a, b) ** 0.5
+
+
+class TestNearestColorName:
+    """Test nearest CSS4 color name lookup."""
+
+    def test_exact_match(self):
+        """A CSS4 color maps to itself (first alias on ties)."""
+        assert nearest_color_name("dodgerblue") == "dodgerblue"
+        assert nearest_color_name("#00FFFF") == "aqua"
+
+    def test_near_match(self):
+        """Off-palette colors map to the closest name."""
+        assert nearest_color_name("#FE0101") == "red"
+        assert nearest_color_name((30, 144, 250)) == "dodgerblue"
+
+    def test_matches_brute_force(self):
+        """Agrees with a min() over color_distance_sq."""
+        from styledconsole.utils.color import CSS4_COLORS
+
+        for rgb in [(0, 0, 0), (12, 200, 77), (250, 128, 114), (100, 100, 101)]:
+            expected = min(CSS4_COLORS, key=lambda name: color_distance_sq(name, rgb))
+            assert nearest_color_name(rgb) == expected
+
+
 class TestGetColorNames:
     """Test getting list of color names."""
 
@@ -340,6 +484,38 @@ class TestApplyLineGradient:
         colored = apply_line_gradient(lines, "cyan", "magenta")
         assert len(colored) == 2
 
+    @pytest.mark.parametrize(
+        "lines",
+        [
+            ["plain", "", "\033[1mbold\033[0m tail", "emoji ✅", "\033[31mopen", "next"],
+            ["embedded\nnewline", "after"],
+        ],
+    )
+    def test_batched_render_matches_per_line_render(self, lines):
+        """Rendering all lines in one pass matches rendering them one by one."""
+        colored = apply_line_gradient(lines, "red", "blue")
+
+        last = len(lines) - 1
+        expected = [
+            apply_line_gradient([line], color, color)[0]
+            for i, line in enumerate(lines)
+            for color in [interpolate_color("red", "blue", i / last)]
+        ]
+        assert colored == expected
+
+    def test_gradient_ramp_cached(self):
+        """Repeated gradients with the same endpoints reuse the color ramp."""
+        from styledconsole.utils.color import _gradient_colors
+
+        _gradient_colors.cache_clear()
+        first = apply_line_gradient(["a", "b", "c"], "red", "blue")
+        second = apply_line_gradient(["x", "y", "z"], "#FF0000", "#0000FF")
+        assert _gradient_colors.cache_info().hits == 1
+        # Same per-line color codes, only the text differs
+        assert [
+            line.replace(old, new) for line, old, new in zip(first, "abc", "xyz", strict=True)
+        ] == second
+
     def test_preserves_original_lines(self):
         """Test that original lines list is not modified."""
         lines = ["Test 1", "Test 2"]
@@ -392,6 +568,26 @@ class TestColorizeText:
         assert "!@#$%^&*()" in colored
         assert "\033[38;2;255;0;0m" in colored
 
+    @pytest.mark.parametrize(
+        ("text", "color", "expected"),
+        [
+            ("Hello", "red", "\033[38;2;255;0;0mHello\033[0m"),
+            ("✅ 中文", "#12ab34", "\033[38;2;18;171;52m✅ 中文\033[0m"),
+            ("[bold]x[/]", "bright_green", "\033[38;2;0;255;0m[bold]x[/]\033[0m"),
+            ("a\n\nb", "blue", "\033[38;2;0;0;255ma\033[0m\n\n\033[38;2;0;0;255mb\033[0m"),
+        ],
+    )
+    def test_plain_text_wrapped_directly(self, text, color, expected):
+        """Plain text gets the SGR codes Rich would emit for it."""
+        assert colorize_text(text, color) == expected
+
+    def test_fg_sequence_cached(self):
+        """The SGR sequence for an RGB color is built once."""
+        from styledconsole.utils.color import _ansi_fg
+
+        assert _ansi_fg(1, 2, 3) == "\033[38;2;1;2;3m"
+        assert _ansi_fg(1, 2, 3) is _ansi_fg(1, 2, 3)
+
 
 class TestNormalizeColorForRich:
     """Test color normalization for Rich compatibility."""
@@ -497,3 +693,47 @@ class TestNormalizeColorForRich:
         # Hex-like but invalid (would fail parse_color)
         result = normalize_color_for_rich("#GGGGGG")
         assert result == "#GGGGGG"  # Returns original
+
+    def test_names_skip_parse_color(self, monkeypatch):
+        """CSS4/Rich names come from the hex table without parse_color."""
+        from styledconsole.utils import color
+
+        def fail(*args, **kwargs):
+            raise AssertionError("parse_color called")
+
+        normalize_color_for_rich.cache_clear()
+        monkeypatch.setattr(color, "parse_color", fail)
+        try:
+            assert normalize_color_for_rich(" DodgerBlue ") == "#1E90FF"
+            assert normalize_color_for_rich("bright_green") == "#00FF00"
+        finally:
+            normalize_color_for_rich.cache_clear()
+
+
+class TestGetRainbowColor:
+    """Tests for get_rainbow_color()."""
+
+    @pytest.mark.parametrize("neon", [False, True])
+    def test_matches_pairwise_interpolation(self, neon):
+        """Colors match interpolating between the named spectrum stops."""
+        from styledconsole.utils.color import (
+            NEON_RAINBOW_COLORS,
+            RAINBOW_COLORS,
+            get_rainbow_color,
+        )
+
+        colors = NEON_RAINBOW_COLORS if neon else RAINBOW_COLORS
+        segments = len(colors) - 1
+        for i in range(101):
+            position = i / 100
+            index = min(int(position * segments), segments - 1)
+            local = (position - index / segments) * segments
+            expected = interpolate_color(colors[index], colors[index + 1], local)
+            assert get_rainbow_color(position, neon=neon) == expected
+
+    def test_endpoints_and_clamping(self):
+        """Positions outside 0-1 clamp to the spectrum ends."""
+        from styledconsole.utils.color import get_rainbow_color
+
+        assert get_rainbow_color(-1.0) == get_rainbow_color(0.0) == "#FF0000"
+        assert get_rainbow_color(2.0) == get_rainbow_color(1.0) == "#9400D3"
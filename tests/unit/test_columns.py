@@ -46,6 +46,22 @@ def test_columns_keep_emoji_when_allowed():
     assert "✅" in columns.renderables[1]
 
 
+def test_columns_subclass_override_called_with_emoji():
+    """Test a subclass add_renderable override runs when emoji=True."""
+    added = []
+
+    class _RecordingColumns(StyledColumns):
+        def add_renderable(self, renderable):
+            added.append(renderable)
+            super().add_renderable(renderable)
+
+    columns = _RecordingColumns(policy=RenderPolicy(emoji=True))
+    columns.add_renderable("🚀 Speed")
+
+    assert added == ["🚀 Speed"]
+    assert columns.renderables == ["🚀 Speed"]
+
+
 def test_console_columns_facade():
     """Test that Console.columns() works without error."""
     from styledconsole import Console as StyledConsole
@@ -665,6 +665,51 @@ class TestConsolePrintMethod:
         assert "Test" in output
 
 
+class _CountingWriter(io.StringIO):
+    """StringIO that counts write() calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+class TestConsoleBuffered:
+    """Test buffered() output batching."""
+
+    def test_single_write_for_block(self):
+        """Test output printed in the block is written once on exit."""
+        buffer = _CountingWriter()
+        console = Console(file=buffer, detect_terminal=False)
+
+        with console.buffered():
+            console.frame("Header")
+            console.rule("Section")
+            console.print("Body")
+            assert buffer.getvalue() == ""
+
+        assert buffer.writes == 1
+        output = buffer.getvalue()
+        assert output.index("Header") < output.index("Section") < output.index("Body")
+
+    def test_nested_blocks_flush_at_outermost_exit(self):
+        """Test nested blocks write nothing until the outer block exits."""
+        buffer = _CountingWriter()
+        console = Console(file=buffer, detect_terminal=False)
+
+        with console.buffered():
+            with console.buffered():
+                console.print("inner")
+            assert buffer.getvalue() == ""
+            console.print("outer")
+
+        assert buffer.writes == 1
+        assert "inner" in buffer.getvalue()
+
+
 class TestConsoleDebugLogging:
     """Test debug logging functionality."""
 
@@ -0,0 +1,377 @@
+"""Tests for emoji rendering helpers used by image export."""
+
+import gc
+import subprocess
+import sys
+from io import BytesIO
+
+import pytest
+from PIL import Image, ImageDraw, ImageFont
+
+from styledconsole.export import emoji_renderer
+from styledconsole.export.emoji_parser import (
+    EMOJI_REGEX,
+    Node,
+    NodeType,
+    parse_line,
+    parse_text_with_emojis,
+)
+from styledconsole.export.emoji_renderer import EmojiRenderer
+from styledconsole.export.emoji_sources import (
+    NOTO_COLOR_EMOJI_CANVAS_POOL_SIZE,
+    BaseEmojiSource,
+    NotoColorEmojiSource,
+    SpriteAtlasEmojiSource,
+    TwemojiSource,
+    emoji_to_hex_sequence,
+    resize_emoji_image,
+)
+
+
+class _CountingFont:
+    """Minimal font stand-in that counts metric lookups."""
+
+    size = 10
+
+    def __init__(self):
+        self.calls = 0
+
+    def getlength(self, text):
+        self.calls += 1
+        return len(text) * 6
+
+
+class TestFontMetricCache:
+    """Tests for the per-font text width cache."""
+
+    def test_repeated_text_measured_once(self):
+        font = _CountingFont()
+        renderer = EmojiRenderer(Image.new("RGB", (1, 1)))
+
+        assert renderer.getwidth("hello", font=font) == 30
+        assert renderer.getwidth("hello", font=font) == 30
+        assert font.calls == 1
+
+    def test_cache_is_per_font(self):
+        font_a = _CountingFont()
+        font_b = _CountingFont()
+        renderer = EmojiRenderer(Image.new("RGB", (1, 1)))
+
+        renderer.getwidth("abc", font=font_a)
+        renderer.getwidth("abc", font=font_b)
+        assert font_a.calls == 1
+        assert font_b.calls == 1
+
+    def test_entries_released_with_font(self):
+        font = _CountingFont()
+        emoji_renderer._cached_text_length(font, "x")
+        assert font in emoji_renderer._metric_cache
+
+        del font
+        gc.collect()
+        assert not any(isinstance(f, _CountingFont) for f in emoji_renderer._metric_cache)
+
+    def test_matches_uncached_measurement(self):
+        font = ImageFont.load_default()
+        assert emoji_renderer._cached_text_length(
+            font, "Status: OK"
+        ) == emoji_renderer._font_text_length(font, "Status: OK")
+
+
+class TestEmojiParser:
+    """Tests for emoji/text node parsing."""
+
+    def test_plain_line_is_single_text_node(self):
+        nodes = parse_line("INFO  | server started on :8080")
+        assert nodes == [Node(NodeType.TEXT, "INFO  | server started on :8080")]
+
+    def test_emoji_split_into_nodes(self):
+        nodes = parse_line("Hello 🌍 World")
+        assert [n.type for n in nodes] == [NodeType.TEXT, NodeType.EMOJI, NodeType.TEXT]
+        assert nodes[1].content == "🌍"
+
+    def test_keycap_sequence_detected(self):
+        nodes = parse_line("step 1️⃣ done")
+        assert Node(NodeType.EMOJI, "1️⃣") in nodes
+
+    def test_fast_path_matches_regex_split(self):
+        for line in ["plain", "box ╭──╮ │", "©", "a ✅ b ❌", "naïve café"]:
+            expected = [
+                Node(NodeType.EMOJI if i % 2 else NodeType.TEXT, chunk)
+                for i, chunk in enumerate(EMOJI_REGEX.split(line))
+                if chunk
+            ]
+            assert parse_line(line) == expected
+
+    @pytest.mark.parametrize(
+        "text",
+        ["", "\n", "a\n", "✅\n\n", "✅\n❌ x\r\nq\r", "x🌍y\n\n👍🏽 z", "plain\ntext\n"],
+    )
+    def test_single_pass_matches_per_line_parse(self, text):
+        expected = [parse_line(line) for line in text.splitlines()]
+        assert parse_text_with_emojis(text) == expected
+
+    def test_emoji_regex_not_compiled_on_import(self):
+        code = (
+            "import styledconsole.export.emoji_renderer\n"
+            "from styledconsole.export import emoji_parser\n"
+            "print(emoji_parser._build_emoji_regex.cache_info().currsize)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert out.strip() == "0"
+
+    def test_emoji_regex_reexported_lazily(self):
+        assert emoji_renderer.EMOJI_REGEX is EMOJI_REGEX
+
+    def test_parse_text_keeps_line_structure(self):
+        lines = parse_text_with_emojis("one\n\n✅ three")
+        assert len(lines) == 3
+        assert lines[1] == []
+        assert lines[2][0] == Node(NodeType.EMOJI, "✅")
+
+
+class TestNotoImageCache:
+    """Tests for NotoColorEmojiSource decoded image cache."""
+
+    @pytest.fixture
+    def source(self, monkeypatch):
+        source = NotoColorEmojiSource()
+        renders = []
+
+        def fake_render(emoji):
+            renders.append(emoji)
+            return Image.new("RGBA", (40, 40), (255, 0, 0, 255))
+
+        monkeypatch.setattr(source, "_render", fake_render)
+        source.renders = renders
+        return source
+
+    def test_image_is_resized_and_cached(self, source):
+        first = source.get_emoji_image("✅", 16)
+        assert first.size == (16, 16)
+        assert source.get_emoji_image("✅", 16) is first
+        assert source.renders == ["✅"]
+
+    def test_sizes_cached_separately(self, source):
+        assert source.get_emoji_image("✅", 16).size == (16, 16)
+        assert source.get_emoji_image("✅", 24).size == (24, 24)
+
+    def test_renderer_pastes_decoded_image(self, source):
+        image = Image.new("RGB", (40, 20), (0, 0, 0))
+        renderer = EmojiRenderer(image, source=source, char_width=8, line_height=20)
+        renderer.text((0, 0), "✅", fill="#ffffff", font=ImageFont.load_default())
+
+        assert (255, 0, 0) in {color for _, color in image.getcolors()}
+
+
+class _StubSource(BaseEmojiSource):
+    """Source returning a 72px PNG and counting fetches."""
+
+    STYLE = "stub"
+
+    def __init__(self):
+        self.fetches = 0
+
+    def get_emoji(self, emoji):
+        self.fetches += 1
+        stream = BytesIO()
+        Image.new("RGBA", (72, 72), (0, 255, 0, 255)).save(stream, format="PNG")
+        stream.seek(0)
+        return stream
+
+
+class TestSpriteAtlasEmojiSource:
+    """Tests for the sprite atlas emoji source."""
+
+    def test_hex_sequence_drops_variation_selector(self):
+        assert emoji_to_hex_sequence("❤️") == "2764"
+        assert emoji_to_hex_sequence("👍🏽") == "1f44d-1f3fd"
+
+    def test_tiles_stored_at_atlas_size(self, tmp_path):
+        atlas = SpriteAtlasEmojiSource(_StubSource(), atlas_size=32, cache_dir=tmp_path)
+        tile = atlas.get_emoji_image("✅", 32)
+        assert tile.size == (32, 32)
+        assert atlas.get_emoji_image("✅", 32) is tile
+
+    def test_other_sizes_resized_once(self, tmp_path):
+        stub = _StubSource()
+        atlas = SpriteAtlasEmojiSource(stub, atlas_size=32, cache_dir=tmp_path)
+        small = atlas.get_emoji_image("✅", 16)
+        assert small.size == (16, 16)
+        assert atlas.get_emoji_image("✅", 16) is small
+        assert stub.fetches == 1
+
+    def test_tiles_persisted_across_instances(self, tmp_path):
+        SpriteAtlasEmojiSource(
+            _StubSource(), atlas_size=32, cache_dir=tmp_path, persist=True
+        ).get_emoji("✅")
+        assert (tmp_path / "2705.png").exists()
+
+        stub = _StubSource()
+        atlas = SpriteAtlasEmojiSource(stub, atlas_size=32, cache_dir=tmp_path, persist=True)
+        assert atlas.get_emoji_image("✅", 32).size == (32, 32)
+        assert stub.fetches == 0
+
+    def test_writes_nothing_by_default(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        monkeypatch.setenv("LOCALAPPDATA", str(tmp_path))
+        atlas = SpriteAtlasEmojiSource(_StubSource(), atlas_size=32)
+        atlas.get_emoji_image("✅", 32)
+        atlas.get_emoji("✅")
+        assert not any(tmp_path.iterdir())
+
+    def test_larger_sizes_not_upscaled_from_tile(self, tmp_path):
+        class _StripedSource(_StubSource):
+            def get_emoji(self, emoji):
+                img = Image.new("RGBA", (72, 72), (0, 0, 0, 255))
+                for x in range(0, 72, 2):
+                    img.paste((255, 255, 255, 255), (x, 0, x + 1, 72))
+                stream = BytesIO()
+                img.save(stream, format="PNG")
+                stream.seek(0)
+                return stream
+
+        stub = _StripedSource()
+        atlas = SpriteAtlasEmojiSource(stub, atlas_size=32, cache_dir=tmp_path)
+        large = atlas.get_emoji_image("✅", 64)
+
+        assert large.size == (64, 64)
+        assert large.tobytes() == stub.get_emoji_image("✅", 64).tobytes()
+        assert atlas.get_emoji_image("✅", 64) is large
+
+
+class TestNotoCanvasPool:
+    """Tests for the shared Noto render canvas pool."""
+
+    def test_released_canvas_is_reused_and_cleared(self, monkeypatch):
+        monkeypatch.setattr(NotoColorEmojiSource, "_canvas_pool", [])
+        canvas = NotoColorEmojiSource._acquire_canvas()
+        canvas.putpixel((5, 5), (1, 2, 3, 255))
+        NotoColorEmojiSource._release_canvas(canvas)
+
+        reused = NotoColorEmojiSource._acquire_canvas()
+        assert reused is canvas
+        assert reused.getbbox() is None
+
+    def test_pool_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(NotoColorEmojiSource, "_canvas_pool", [])
+        canvases = [NotoColorEmojiSource._acquire_canvas() for _ in range(10)]
+        for canvas in canvases:
+            NotoColorEmojiSource._release_canvas(canvas)
+        assert len(NotoColorEmojiSource._canvas_pool) == NOTO_COLOR_EMOJI_CANVAS_POOL_SIZE
+
+
+class _BboxOnlyFont:
+    """Font stand-in without getlength."""
+
+    size = 10
+
+    def getbbox(self, text):
+        return (0, 0, len(text) * 5, 10)
+
+
+class TestFontCapabilities:
+    """Tests for per-font metric capability probing."""
+
+    def test_probe_detects_methods(self):
+        assert emoji_renderer._probe_font(_CountingFont()) == (True, False)
+        assert emoji_renderer._probe_font(_BboxOnlyFont()) == (False, True)
+
+    def test_bbox_font_measured_without_getlength(self):
+        font = _BboxOnlyFont()
+        assert emoji_renderer._font_text_length(font, "abcd") == 20
+        assert emoji_renderer._font_caps[font] == (False, True)
+
+    def test_font_without_metrics_uses_estimate(self):
+        assert emoji_renderer._font_text_length(object(), "abc") == 24
+
+
+class TestResizeEmojiImage:
+    """Tests for emoji resize filter selection."""
+
+    def test_equal_size_returns_same_image(self):
+        img = Image.new("RGBA", (72, 72))
+        assert resize_emoji_image(img, 72) is img
+
+    @pytest.mark.parametrize("size", [64, 24, 144])
+    def test_resizes_to_square(self, size):
+        img = Image.new("RGBA", (72, 72))
+        assert resize_emoji_image(img, size).size == (size, size)
+
+
+class TestEmojiCompositing:
+    """Tests for compositing emoji tiles onto the canvas."""
+
+    def test_rgba_canvas_keeps_background_alpha(self):
+        image = Image.new("RGBA", (20, 20), (0, 0, 255, 255))
+        renderer = EmojiRenderer(image, char_width=10, emoji_position_offset=(0, 0))
+        tile = Image.new("RGBA", (20, 20), (255, 0, 0, 0))
+        tile.putpixel((0, 0), (255, 0, 0, 128))
+
+        renderer._paste_emoji_image(0, 0, tile, 20, ImageFont.load_default())
+
+        # Fully transparent tile pixels leave the canvas untouched
+        assert image.getpixel((10, 10)) == (0, 0, 255, 255)
+        r, _, b, a = image.getpixel((0, 0))
+        assert a == 255
+        assert r > 100 and b > 100
+
+    def test_rgb_canvas_uses_masked_paste(self):
+        image = Image.new("RGB", (20, 20), (0, 0, 0))
+        renderer = EmojiRenderer(image, char_width=10)
+        tile = Image.new("RGBA", (20, 20), (0, 255, 0, 255))
+
+        renderer._paste_emoji_image(0, 0, tile, 20, ImageFont.load_default())
+        assert (0, 255, 0) in {color for _, color in image.getcolors()}
+
+    def test_source_error_draws_placeholder(self):
+        class _BrokenSource(BaseEmojiSource):
+            def get_emoji(self, emoji):
+                return None
+
+            def get_emoji_image(self, emoji, size):
+                raise ValueError("bad size")
+
+        font = ImageFont.load_default()
+        image = Image.new("RGB", (40, 20), (0, 0, 0))
+        renderer = EmojiRenderer(image, source=_BrokenSource(), char_width=8, line_height=20)
+        renderer.text((0, 0), "✅", fill="#ffffff", font=font)
+
+        expected = Image.new("RGB", (40, 20), (0, 0, 0))
+        ImageDraw.Draw(expected).text((0, 0), "□", fill="#ffffff", font=font)
+        assert image.tobytes() == expected.tobytes()
+
+
+class TestBaseEmojiImage:
+    """Tests for the decoded image API on emoji sources."""
+
+    def test_default_decodes_stream(self):
+        img = _StubSource().get_emoji_image("✅", 20)
+        assert img.mode == "RGBA"
+        assert img.size == (20, 20)
+
+    def test_unusable_size_returns_none(self):
+        assert _StubSource().get_emoji_image("✅", 0) is None
+
+    def test_undecodable_stream_returns_none(self):
+        class _JunkSource(BaseEmojiSource):
+            def get_emoji(self, emoji):
+                return BytesIO(b"not an image")
+
+        assert _JunkSource().get_emoji_image("✅", 20) is None
+
+    def test_cdn_source_caches_decoded_image(self, monkeypatch):
+        source = TwemojiSource()
+        stub = _StubSource()
+        monkeypatch.setattr(source, "_request", lambda url: stub.get_emoji("").getvalue())
+
+        first = source.get_emoji_image("✅", 20)
+        assert source.get_emoji_image("✅", 20) is first
+
+    def test_cdn_failure_not_cached(self, monkeypatch):
+        source = TwemojiSource()
+        monkeypatch.setattr(source, "_request", lambda url: None)
+        assert source.get_emoji_image("✅", 20) is None
+        assert source._image_cache == {}
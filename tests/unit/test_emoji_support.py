@@ -1,5 +1,7 @@
 """Tests for emoji_support module - PyPI emoji package integration."""
 
+import pytest
+
 from styledconsole.utils.emoji_support import (
     EMOJI_PACKAGE_AVAILABLE,
     EmojiInfo,
@@ -71,10 +73,43 @@ class TestIsZwjSequence:
         assert is_zwj_sequence("Hello 🚀 World") is False
         assert is_zwj_sequence("No emojis here") is False
 
+    def test_text_without_joiner_skips_analyze(self, monkeypatch):
+        """Text without U+200D can't hold a ZWJ sequence and isn't analyzed."""
+        from styledconsole.utils import emoji_support
+
+        def fail(text, **kwargs):
+            raise AssertionError("analyzed")
+
+        monkeypatch.setattr(emoji_support._emoji_pkg, "analyze", fail)
+        assert is_zwj_sequence("Hello 🚀 ✅ World") is False
+
 
 class TestAnalyzeEmojiSafety:
     """Tests for analyze_emoji_safety function."""
 
+    def test_ascii_text_skips_analyze(self, monkeypatch):
+        """ASCII-only text returns an empty result without tokenizing."""
+        from styledconsole.utils import emoji_support
+
+        def fail(text, **kwargs):
+            raise AssertionError("analyzed")
+
+        monkeypatch.setattr(emoji_support._emoji_pkg, "analyze", fail)
+        first = analyze_emoji_safety("Hello World")
+        assert first == {
+            "emoji_count": 0,
+            "safe_emojis": [],
+            "zwj_sequences": [],
+            "non_rgi": [],
+            "all_safe": True,
+        }
+        first["safe_emojis"].append("x")
+        assert analyze_emoji_safety("Hello World")["safe_emojis"] == []
+
+    def test_latin1_emoji_still_found(self):
+        """Emoji below U+2000 such as the copyright sign are still counted."""
+        assert analyze_emoji_safety("© 2024")["emoji_count"] == 1
+
     def test_safe_emojis(self):
         """Safe emojis should be categorized correctly."""
         result = analyze_emoji_safety("Hello 🚀 World")
@@ -100,6 +135,15 @@ class TestAnalyzeEmojiSafety:
         assert result["emoji_count"] == 0
         assert result["all_safe"] is True
 
+    @pytest.mark.parametrize(
+        "text", ["Hello 🚀 and 👨‍👩‍👧", "👨\u200d🚀\u200d🔥 x", "a👍🏽b 1️⃣", "🏳️\u200d🌈🚀\u200d"]
+    )
+    def test_count_matches_emoji_package(self, text):
+        """Single-pass count agrees with emoji.emoji_count()."""
+        import emoji
+
+        assert analyze_emoji_safety(text)["emoji_count"] == emoji.emoji_count(text)
+
 
 class TestGetEmojiInfo:
     """Tests for get_emoji_info function."""
@@ -126,6 +170,22 @@ class TestGetEmojiInfo:
         assert info.is_valid is False
         assert info.terminal_safe is False
 
+    def test_unlisted_zwj_sequence_is_invalid(self):
+        """A ZWJ sequence that isn't an RGI emoji is reported as invalid."""
+        info = get_emoji_info("👨\u200d🚀\u200d🔥")
+        assert info.is_valid is False
+        assert info.is_zwj_non_rgi is False
+
+    def test_matches_emoji_package_metadata(self):
+        """Name, version and ZWJ flag agree with the emoji package."""
+        import emoji
+
+        for char in ["🚀", "👨‍💻", "❤️", "🏳️‍🌈"]:
+            info = get_emoji_info(char)
+            assert info.version == emoji.version(char)
+            assert info.name == emoji.EMOJI_DATA[char]["en"].strip(":").replace("_", " ")
+            assert info.is_zwj == ("\u200d" in char)
+
 
 class TestGetEmojiVersion:
     """Tests for get_emoji_version function."""
@@ -229,6 +289,16 @@ class TestEmojiList:
         result = emoji_list("Hello World")
         assert len(result) == 0
 
+    def test_ascii_text_skips_scan(self, monkeypatch):
+        """ASCII-only text can't contain emoji and isn't scanned."""
+        from styledconsole.utils import emoji_support
+
+        def fail(text):
+            raise AssertionError("scanned")
+
+        monkeypatch.setattr(emoji_support._emoji_pkg, "emoji_list", fail)
+        assert emoji_list("INFO  | server started on :8080") == []
+
 
 class TestEmojiInfoDataclass:
     """Tests for EmojiInfo dataclass."""
@@ -190,6 +190,26 @@ class TestGroupContextAlignWidths:
         assert "Short" in output
         assert "This is much longer content here" in output
 
+    def test_align_widths_measures_repeated_lines_once(self, monkeypatch):
+        """Lines and titles shared by sibling frames are measured once."""
+        from styledconsole.utils import text
+
+        measured: list[str] = []
+        original = text.visual_width
+
+        def counting_visual_width(value, markup=False):
+            measured.append(value)
+            return original(value, markup=markup)
+
+        monkeypatch.setattr(text, "visual_width", counting_visual_width)
+        console = Console(record=True, width=80)
+        with console.group(align_widths=True) as group:
+            console.frame(["same", "line"], title=" PASS ")
+            console.frame(["same", "other"], title=" PASS ")
+            group._align_frame_widths()
+            assert sorted(measured) == sorted(["same", "line", " PASS ", "other"])
+            assert {frame.kwargs["width"] for frame in group._captured_frames} == {12}
+
 
 class TestGroupContextExceptionHandling:
     """Tests for exception handling in groups."""
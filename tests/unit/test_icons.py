@@ -8,6 +8,9 @@ Tests cover:
 - Terminal capability integration
 """
 
+import subprocess
+import sys
+
 import pytest
 
 from styledconsole.icons import (
@@ -19,7 +22,8 @@ from styledconsole.icons import (
     reset_icon_mode,
     set_icon_mode,
 )
-from styledconsole.utils.icon_data import ICON_REGISTRY
+from styledconsole.utils import icon_categories, icon_data
+from styledconsole.utils.icon_data import EMOJI_TO_ICON, ICON_REGISTRY
 
 
 class TestIcon:
@@ -330,6 +334,44 @@ class TestIconDataIntegrity:
             assert len(icon.ascii) > 0, f"Icon {name} has zero-length ASCII"
 
 
+class TestGeneratedIconData:
+    """Tests for the generated icon registry module."""
+
+    def test_registry_matches_category_tables(self):
+        """Generated registry is up to date with icon_categories (run gen_icon_data.py)."""
+        expected = icon_categories.build_icon_registry()
+        assert list(ICON_REGISTRY.items()) == list(expected.items())
+
+    def test_emoji_lookup_matches_registry(self):
+        """Reverse lookup keeps the last mapping for each emoji."""
+        expected = icon_categories.build_emoji_to_icon(ICON_REGISTRY)
+        assert list(EMOJI_TO_ICON.items()) == list(expected.items())
+
+    def test_category_dicts_match_tables(self):
+        """Category dicts built from the registry match the hand-written tables."""
+        for table_name, table in icon_categories.CATEGORY_TABLES.items():
+            assert list(getattr(icon_data, table_name).items()) == list(table.items())
+        first = icon_data.STATUS_ICONS
+        assert icon_data.STATUS_ICONS is first
+        with pytest.raises(AttributeError):
+            _ = icon_data.NOT_A_CATEGORY
+
+    def test_import_skips_emoji_name_lookup(self):
+        """Importing the icons or listing categories doesn't build the emoji name registry."""
+        code = (
+            "import styledconsole\n"
+            "from styledconsole.emoji_registry import EMOJI\n"
+            "from styledconsole.utils import icon_data\n"
+            "icon_data.STATUS_ICONS\n"
+            "styledconsole.icons.list_by_category()\n"
+            "print(EMOJI._initialized)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert out.strip() == "False"
+
+
 class TestIconProviderIntegration:
     """Integration tests for icon provider with other components."""
 
@@ -0,0 +1,77 @@
+"""Tests for image auto-cropping utilities."""
+
+import pytest
+from PIL import Image
+
+from styledconsole.export.image_cropper import auto_crop, auto_crop_frames, get_content_bbox
+
+
+def _frame(size=(40, 30), background="#1e1e2e", pixels=()):
+    img = Image.new("RGB", size, background)
+    for xy, color in pixels:
+        img.putpixel(xy, color)
+    return img
+
+
+class TestGetContentBbox:
+    """Tests for content bounding box detection."""
+
+    def test_background_only_returns_none(self):
+        assert get_content_bbox(_frame(), "#1e1e2e") is None
+
+    @pytest.mark.parametrize("color", [(0x1F, 0x1E, 0x2E), (0x1E, 0x1E, 0x2F), (255, 255, 255)])
+    def test_single_channel_difference_detected(self, color):
+        img = _frame(pixels=[((5, 7), color)])
+        assert get_content_bbox(img, "#1e1e2e") == (5, 7, 6, 8)
+
+    def test_bbox_spans_all_content(self):
+        img = _frame(pixels=[((2, 3), (255, 0, 0)), ((30, 20), (0, 255, 0))])
+        assert get_content_bbox(img, "#1e1e2e") == (2, 3, 31, 21)
+
+    def test_rgb_image_not_converted(self, monkeypatch):
+        img = _frame(pixels=[((4, 4), (255, 0, 0))])
+
+        def fail_convert(*args, **kwargs):
+            raise AssertionError("RGB image converted")
+
+        monkeypatch.setattr(img, "convert", fail_convert)
+        assert get_content_bbox(img, "#1e1e2e") == (4, 4, 5, 5)
+
+    def test_rgba_image_supported(self):
+        img = _frame(pixels=[((4, 4), (255, 0, 0))]).convert("RGBA")
+        assert get_content_bbox(img, "#1e1e2e") == (4, 4, 5, 5)
+
+
+class TestAutoCrop:
+    """Tests for cropping images and frames to content."""
+
+    def test_crop_applies_margin(self):
+        img = _frame(pixels=[((20, 15), (255, 255, 255))])
+        assert auto_crop(img, "#1e1e2e", margin=2).size == (5, 5)
+
+    def test_frames_share_union_bbox(self):
+        frames = [
+            _frame(pixels=[((5, 5), (255, 255, 255))]),
+            _frame(pixels=[((10, 8), (255, 255, 255))]),
+        ]
+        cropped = auto_crop_frames(frames, "#1e1e2e", margin=0)
+        assert [f.size for f in cropped] == [(6, 4), (6, 4)]
+
+    def test_frames_of_different_sizes(self):
+        frames = [
+            _frame(size=(20, 20), pixels=[((5, 5), (255, 255, 255))]),
+            _frame(size=(40, 30), pixels=[((12, 9), (255, 255, 255))]),
+        ]
+        cropped = auto_crop_frames(frames, "#1e1e2e", margin=0)
+        assert [f.size for f in cropped] == [(8, 5), (8, 5)]
+
+    def test_all_background_frames_unchanged(self):
+        frames = [_frame(), _frame()]
+        assert auto_crop_frames(frames, "#1e1e2e") is frames
+
+    def test_repeated_frames_share_crop(self):
+        frame = _frame(pixels=[((5, 5), (255, 255, 255))])
+        other = _frame(pixels=[((9, 9), (255, 255, 255))])
+        cropped = auto_crop_frames([frame, frame, other, frame], "#1e1e2e", margin=0)
+        assert cropped[0] is cropped[1] is cropped[3]
+        assert cropped[2] is not cropped[0]
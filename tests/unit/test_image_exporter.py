@@ -358,3 +358,371 @@ class TestImageExporterFormats:
 
         img = Image.open(path)
         assert img.format == "GIF"
+
+
+def _same_pixels(a, b):
+    """Check two images have the same size and pixels."""
+    from PIL import ImageChops
+
+    return a.size == b.size and ImageChops.difference(a, b).getbbox() is None
+
+
+class TestRenderedOutput:
+    """Pixel tests for the exporter's cached and batched drawing paths."""
+
+    @pytest.fixture
+    def render(self, tmp_path):
+        """Render markup lines through save_png; returns (RGB image, exporter)."""
+        from itertools import count
+
+        from PIL import Image
+        from rich.console import Console as RichConsole
+
+        from styledconsole.export import get_image_exporter
+
+        paths = (tmp_path / f"render{i}.png" for i in count())
+
+        def render(*lines, theme=None, exporter=None):
+            if exporter is None:
+                console = RichConsole(record=True, width=60)
+                for line in lines:
+                    console.print(line)
+                exporter = get_image_exporter()(console, theme=theme, render_emojis=False)
+            path = next(paths)
+            exporter.save_png(path)
+            with Image.open(path) as img:
+                return img.convert("RGB"), exporter
+
+        return render
+
+    @pytest.fixture
+    def font_loader(self):
+        """FontLoader for the default theme, matching the exporter's font."""
+        from PIL import ImageFont
+
+        from styledconsole.export.font_loader import FontLoader
+        from styledconsole.export.image_theme import DEFAULT_THEME
+
+        loader = FontLoader(DEFAULT_THEME)
+        loader.load(ImageFont)
+        return loader
+
+    @pytest.mark.parametrize(
+        ("text", "cells"),
+        [
+            pytest.param("中文", [(0, "中"), (2, "文")], id="cached-wide-glyphs"),
+            pytest.param("Hello, gy", list(enumerate("Hello, gy")), id="ascii-run"),
+        ],
+    )
+    def test_matches_direct_drawing(self, render, font_loader, text, cells):
+        """Cached glyphs and batched runs land on the same pixels as per-cell draw.text."""
+        from PIL import Image, ImageDraw
+
+        from styledconsole.export.image_theme import DEFAULT_THEME
+        from styledconsole.utils.color import parse_color
+
+        img, _ = render(text)
+
+        padding = DEFAULT_THEME.padding
+        expected = Image.new("RGB", img.size, parse_color(DEFAULT_THEME.background))
+        draw = ImageDraw.Draw(expected)
+        for column, char in cells:
+            draw.text(
+                (padding + column * font_loader.char_width, padding),
+                char,
+                font=font_loader.font,
+                fill=parse_color(DEFAULT_THEME.foreground),
+            )
+        assert _same_pixels(img, expected)
+
+    @pytest.mark.parametrize(
+        ("lines", "equivalent", "from_column"),
+        [
+            pytest.param(["a\nb\n\nc"], ["a", "b", "", "c"], 0, id="embedded-newlines"),
+            pytest.param(["ab中cd"], ["ab..cd"], 4, id="text-after-wide-char"),
+            pytest.param(["中a⣿ 中a⣿"], ["     中a⣿"], 5, id="repeated-segment"),
+            pytest.param(["[bold]abc 中[/bold] abc 中"], ["abc 中 abc 中"], 7, id="style-keyed"),
+        ],
+    )
+    def test_matches_equivalent_markup(self, render, font_loader, lines, equivalent, from_column):
+        """Output from a column onward matches markup that draws it another way."""
+        from styledconsole.export.image_theme import DEFAULT_THEME
+
+        img, _ = render(*lines)
+        expected, _ = render(*equivalent)
+
+        box = (DEFAULT_THEME.padding + from_column * font_loader.char_width, 0, *img.size)
+        assert _same_pixels(img.crop(box), expected.crop(box))
+
+    def test_repeated_saves_identical(self, render):
+        """Saving again from warm caches and a reused frame buffer gives the same image."""
+        first, exporter = render("[bold red]Hello[/bold red] [underline]World[/underline] ⣿⣿ 中文")
+        second, _ = render(exporter=exporter)
+        assert _same_pixels(first, second)
+
+    def test_glyph_cache_eviction_keeps_output(self, render, monkeypatch):
+        """A one-entry glyph cache renders the same pixels as the default one."""
+        from styledconsole.export import image_exporter
+
+        text = "一二三四五六七八 中中 ⣿⣿"
+        expected, _ = render(text)
+        monkeypatch.setattr(image_exporter, "GLYPH_CACHE_SIZE", 1)
+        img, _ = render(text)
+        assert _same_pixels(img, expected)
+
+    def test_cached_glyph_reused_in_other_colors(self, render):
+        """A glyph mask cached in one color draws in the color of each segment."""
+        img, _ = render("[red]中[/red][blue]中[/blue]")
+        assert {(128, 0, 0), (0, 0, 128)} <= {color for _, color in img.getcolors(1 << 16)}
+
+    def test_underline_spans_whole_run(self, render, font_loader):
+        """Underlining a batched run only adds a thin line under all of its cells."""
+        from PIL import ImageChops
+
+        from styledconsole.export.image_theme import DEFAULT_THEME
+
+        plain, _ = render("Hello")
+        underlined, _ = render("[underline]Hello[/underline]")
+        left, top, right, bottom = ImageChops.difference(plain, underlined).getbbox()
+
+        assert left == DEFAULT_THEME.padding
+        assert right >= DEFAULT_THEME.padding + 5 * font_loader.char_width - 1
+        assert bottom - top < font_loader.char_height / 2
+
+    def test_background_continuous_across_segments(self, render, font_loader):
+        """Adjacent segments sharing a background color leave no gap between them."""
+        from styledconsole.export.image_theme import DEFAULT_THEME
+        from styledconsole.utils.color import parse_color
+
+        img, _ = render("[on blue]ab[/][bold on blue]cd[/]x[on red]e[/]")
+
+        padding = DEFAULT_THEME.padding
+        cell = font_loader.char_width
+        top_row = [img.getpixel((x, padding)) for x in range(padding, padding + 6 * cell)]
+        assert set(top_row[: 4 * cell]) == {(0, 0, 128)}
+        assert top_row[4 * cell + cell // 2] == parse_color(DEFAULT_THEME.background)
+        assert top_row[5 * cell + cell // 2] == (128, 0, 0)
+
+    def test_fixed_grid_clips_output(self, render, font_loader):
+        """A fixed terminal size sets the image size and clips rows past the grid."""
+        from dataclasses import replace
+
+        from styledconsole.export.image_theme import DEFAULT_THEME
+
+        lines = [f"[cyan]line {i}[/cyan] " + "x" * 50 for i in range(10)]
+        small, _ = render(*lines, theme=replace(DEFAULT_THEME, terminal_size=(20, 3)))
+        tall, _ = render(*lines, theme=replace(DEFAULT_THEME, terminal_size=(20, 12)))
+
+        padding = DEFAULT_THEME.padding
+        assert small.size == (
+            int(padding * 2 + 20 * font_loader.char_width),
+            int(padding * 2 + 3 * font_loader.char_height),
+        )
+        # The bottom padding of the small grid overlaps the tall grid's next row
+        box = (0, 0, small.width, small.height - padding)
+        assert _same_pixels(small.crop(box), tall.crop(box))
+
+
+class TestSaveAnimated:
+    """Tests for GIF frames written by save_gif."""
+
+    @pytest.fixture
+    def recorder(self):
+        """Create a recording console and exporter with a fixed 8-column grid."""
+        from dataclasses import replace
+
+        from rich.console import Console as RichConsole
+
+        from styledconsole.export import get_image_exporter
+        from styledconsole.export.image_theme import DEFAULT_THEME
+
+        def make(rows=4):
+            console = RichConsole(record=True, width=40)
+            theme = replace(DEFAULT_THEME, terminal_size=(8, rows))
+            return console, get_image_exporter()(console, theme=theme, render_emojis=False)
+
+        return make
+
+    @staticmethod
+    def _gif_durations(path):
+        from PIL import Image
+
+        with Image.open(path) as gif:
+            durations = []
+            for index in range(gif.n_frames):
+                gif.seek(index)
+                durations.append(gif.info["duration"])
+        return durations
+
+    @pytest.mark.parametrize(
+        ("steps", "fps", "expected"),
+        [
+            pytest.param(
+                [("red", None), ("green", None), ("blue", None)],
+                10,
+                [100, 100, 100],
+                id="frame-per-capture",
+            ),
+            pytest.param(
+                [("red", 300), ("green", None), ("blue", 50)],
+                5,
+                [300, 200, 50],
+                id="per-frame-durations",
+            ),
+            pytest.param(
+                [("red", None), (None, None), (None, None), (None, None), ("green", None)],
+                10,
+                [400, 100],
+                id="idle-captures-merged",
+            ),
+        ],
+    )
+    def test_frame_timeline(self, recorder, tmp_path, steps, fps, expected):
+        """Each distinct capture is one frame; repeats extend the previous frame."""
+        console, exporter = recorder()
+        for color, duration in steps:
+            if color:
+                console.print(f"[on {color}]    [/]")
+            exporter.capture_frame(duration=duration)
+
+        path = tmp_path / "anim.gif"
+        exporter.save_gif(path, fps=fps)
+        assert self._gif_durations(path) == expected
+
+    def test_without_frames_saves_current_output(self, recorder, tmp_path):
+        """Without captured frames, or after clear_frames, the GIF is the current output."""
+        from PIL import Image
+
+        console, exporter = recorder()
+        console.print("[on red]    [/]")
+        exporter.capture_frame()
+        console.print("[on green]    [/]")
+        exporter.capture_frame()
+        exporter.clear_frames()
+        exporter.save_png(tmp_path / "out.png")
+        exporter.save_gif(tmp_path / "out.gif")
+
+        with Image.open(tmp_path / "out.gif") as gif, Image.open(tmp_path / "out.png") as png:
+            assert gif.n_frames == 1
+            assert _same_pixels(gif.convert("RGB"), png.convert("RGB"))
+
+    def test_gif_keeps_colors_of_every_frame(self, recorder, tmp_path):
+        """Each GIF frame matches a PNG saved at capture time, colors included."""
+        from PIL import Image
+
+        console, exporter = recorder(rows=40)
+        for i in range(40):
+            console.print(f"[on #{i * 6:02x}{255 - i * 5:02x}{i * 3 + 7:02x}]    [/]")
+            exporter.capture_frame()
+            exporter.save_png(tmp_path / f"frame{i}.png")
+
+        exporter.save_gif(tmp_path / "anim.gif")
+        with Image.open(tmp_path / "anim.gif") as gif:
+            assert gif.n_frames == 40
+            for index in range(40):
+                gif.seek(index)
+                with Image.open(tmp_path / f"frame{index}.png") as png:
+                    assert _same_pixels(gif.convert("RGB"), png.convert("RGB")), index
+
+    def test_gif_with_many_colors_still_saved(self, recorder, tmp_path):
+        """Animations past the GIF palette size fall back to per-frame palettes."""
+        from PIL import Image
+
+        console, exporter = recorder()
+        for i in range(3):
+            console.print(f"[#{i * 80:02x}8040]{'█' * 30}[/]")
+            exporter.capture_frame()
+
+        exporter.save_gif(tmp_path / "anim.gif")
+        with Image.open(tmp_path / "anim.gif") as gif:
+            assert gif.n_frames == 3
+
+
+class TestExporterHelpers:
+    """Tests for the exporter's memoized helpers and font checks."""
+
+    @pytest.fixture
+    def exporter(self):
+        """Create an exporter over an empty recording console."""
+        from rich.console import Console as RichConsole
+
+        from styledconsole.export import get_image_exporter
+
+        return get_image_exporter()(RichConsole(record=True), render_emojis=False)
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [("⠀", True), ("⢕", True), ("⣿", True), ("⤀", False), ("a", False), ("⣿⣿", False)],
+    )
+    def test_is_braille(self, exporter, text, expected):
+        """Only single characters in the U+2800 block are Braille patterns."""
+        assert exporter._is_braille(text) is expected
+
+    @pytest.mark.parametrize(("advance", "expected"), [(8.0, True), (8.4, False)])
+    def test_fractional_advance_not_grid_aligned(self, exporter, advance, expected):
+        """Runs whose glyphs would drift off their 8px cells use per-cell drawing."""
+
+        class _Font:
+            def getlength(self, text):
+                return len(text) * advance
+
+        assert exporter._is_grid_aligned("ab", _Font(), 16) is expected
+
+    @pytest.mark.parametrize(("color", "rgb"), [("#ff8000", (255, 128, 0)), ("red", (128, 0, 0))])
+    def test_color_to_rgb(self, color, rgb):
+        """Rich colors convert to their truecolor RGB tuple."""
+        from rich.color import Color
+
+        from styledconsole.export.image_exporter import _color_to_rgb
+
+        assert _color_to_rgb(Color.parse(color)) == rgb
+
+    @pytest.mark.parametrize("color", ["#cdd6f4", "#ffffff", "#010203"])
+    def test_dim_color_matches_apply_dim(self, color):
+        """Dimming an RGB tuple matches the public apply_dim helper."""
+        from styledconsole.export.image_exporter import _apply_dim_color
+        from styledconsole.utils.color import apply_dim, parse_color
+
+        assert _apply_dim_color(parse_color(color)) == parse_color(apply_dim(color))
+
+    def test_char_dimensions_match_text_bbox(self):
+        """Cell width is the advance of "M" and height follows its bounding box."""
+        from PIL import Image, ImageDraw, ImageFont
+
+        from styledconsole.export.font_loader import FontLoader
+        from styledconsole.export.image_theme import DEFAULT_THEME
+
+        loader = FontLoader(DEFAULT_THEME)
+        loader.load(ImageFont)
+        bbox = ImageDraw.Draw(Image.new("RGB", (100, 100))).textbbox((0, 0), "M", font=loader.font)
+        assert loader.char_width == int(loader.font.getlength("M"))
+        assert loader.char_height == (bbox[3] - bbox[1]) * DEFAULT_THEME.line_height
+
+    def test_repeated_frames_merged(self):
+        """Runs of the same frame object collapse into one with summed durations."""
+        from PIL import Image
+
+        from styledconsole.export.image_exporter import _merge_repeated_frames
+
+        a, b = Image.new("RGB", (2, 2)), Image.new("RGB", (2, 2))
+        frames, durations = _merge_repeated_frames([a, a, b, b, b, a], [100, 50, 100, 100, 10, 100])
+        # Frames are matched by identity, not by (equal) pixel content
+        assert [id(frame) for frame in frames] == [id(a), id(b), id(a)]
+        assert durations == [150, 210, 100]
+
+    def test_frame_digest(self):
+        """The digest hashes mode, size and pixel bytes; copies hash the same."""
+        import hashlib
+
+        from PIL import Image
+
+        from styledconsole.export.image_exporter import _frame_digest
+
+        img = Image.new("RGB", (4, 2))
+        expected = hashlib.blake2b(digest_size=16)
+        expected.update(repr(("RGB", (4, 2))).encode())
+        expected.update(img.tobytes())
+        assert _frame_digest(img) == expected.digest() == _frame_digest(img.copy())
+
+        others = [Image.new("RGB", (2, 4)), Image.new("RGB", (4, 2), (0, 0, 1))]
+        assert len({_frame_digest(img), *map(_frame_digest, others)}) == 3
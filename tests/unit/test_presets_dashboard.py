@@ -0,0 +1,47 @@
+"""Tests for the dashboard preset."""
+
+from rich.table import Table
+
+from styledconsole.console import Console
+from styledconsole.presets.dashboard import dashboard
+
+
+def _render_grid(widgets, columns, monkeypatch):
+    console = Console(record=True, width=80)
+    printed = []
+    monkeypatch.setattr(console, "print", lambda renderable, **kw: printed.append(renderable))
+    dashboard("Monitor", widgets, columns=columns, console=console)
+    (grid,) = printed
+    assert isinstance(grid, Table)
+    return grid
+
+
+class TestDashboard:
+    """Tests for dashboard grid layout."""
+
+    def test_full_rows(self, monkeypatch):
+        widgets = [{"title": f"W{i}", "content": f"value {i}"} for i in range(4)]
+        grid = _render_grid(widgets, 2, monkeypatch)
+        assert grid.row_count == 2
+        assert len(grid.columns) == 2
+
+    def test_incomplete_row_is_padded(self, monkeypatch):
+        widgets = [{"title": f"W{i}", "content": f"value {i}"} for i in range(4)]
+        grid = _render_grid(widgets, 3, monkeypatch)
+        assert grid.row_count == 2
+        last_column = list(grid.columns[2].cells)
+        assert str(last_column[1]) == ""
+
+    def test_widget_order_preserved(self, monkeypatch):
+        widgets = [{"title": f"W{i}", "content": f"value {i}"} for i in range(3)]
+        grid = _render_grid(widgets, 2, monkeypatch)
+        first_column = [str(cell) for cell in grid.columns[0].cells]
+        assert "value 0" in first_column[0]
+        assert "value 2" in first_column[1]
+
+    def test_header_rendered(self):
+        console = Console(record=True, width=80)
+        dashboard("System Monitor", [{"title": "CPU", "content": "45%"}], console=console)
+        output = console.export_text()
+        assert "System Monitor" in output
+        assert "CPU" in output
@@ -122,3 +122,20 @@ def test_status_frame_kwargs_override(mock_console):
     assert kwargs["width"] == 100
     # Defaults that weren't overridden should remain
     assert kwargs["border_color"] == "success"  # Semantic color name
+
+
+@pytest.mark.parametrize("status", ["skip", "SKIP", "Skip"])
+def test_status_frame_is_case_insensitive(mock_console, status):
+    status_frame("Test Case", status, console=mock_console)
+
+    _args, kwargs = mock_console.frame.call_args
+    assert kwargs["title"] == " SKIP "
+    assert kwargs["border_color"] == "warning"
+
+
+def test_status_icons_follow_icon_mode(mock_console):
+    set_icon_mode("ascii")
+    status_frame("Test Case", "pass", console=mock_console)
+
+    _args, kwargs = mock_console.frame.call_args
+    assert "✅" not in kwargs["content"][0]
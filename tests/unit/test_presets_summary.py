@@ -1,4 +1,4 @@
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -10,7 +10,7 @@ from styledconsole.presets.summary import test_summary as render_test_summary
 
 @pytest.fixture
 def mock_console():
-    return Mock(spec=Console)
+    return MagicMock(spec=Console)
 
 
 @pytest.fixture(autouse=True)
@@ -85,3 +85,58 @@ def test_summary_default_console(mock_console_cls):
 
     mock_console_cls.assert_called_once()
     mock_instance.frame.assert_called_once()
+
+
+def test_summary_counts_statuses_case_insensitively(mock_console):
+    results: list[TestResult] = [
+        {"name": "a", "status": "pass", "duration": 0.1},
+        {"name": "b", "status": "Skip", "duration": 0.1},
+        {"name": "c", "status": "error", "duration": 0.1},
+        {"name": "d", "status": "UNKNOWN", "duration": 0.1},
+    ]
+
+    render_test_summary(results, console=mock_console)
+
+    _, kwargs = mock_console.frame.call_args_list[0]
+    content = kwargs["content"]
+    assert "Total:   [bold]4[/]" in content
+    assert "Passed:  1" in content
+    assert "Failed:  0" in content
+    assert "Skipped: 1" in content
+    assert "Errors:  1" in content
+
+
+def test_summary_output_written_once():
+    import io
+
+    class CountingWriter(io.StringIO):
+        writes = 0
+
+        def write(self, text):
+            self.writes += 1
+            return super().write(text)
+
+    buffer = CountingWriter()
+    console = Console(file=buffer, detect_terminal=False)
+    results: list[TestResult] = [
+        {"name": "a", "status": "FAIL", "duration": 0.1, "message": "boom"},
+        {"name": "b", "status": "ERROR", "duration": 0.1},
+    ]
+
+    render_test_summary(results, console=console)
+
+    assert buffer.writes == 1
+    assert "boom" in buffer.getvalue()
+
+
+def test_summary_lists_failures_in_order(mock_console):
+    results: list[TestResult] = [
+        {"name": "ok", "status": "pass", "duration": 0.1},
+        {"name": "broken", "status": "error", "duration": 0.1},
+        {"name": "wrong", "status": "Fail", "duration": 0.1},
+    ]
+
+    render_test_summary(results, console=mock_console)
+
+    failure_frames = [kwargs["content"][0] for _, kwargs in mock_console.frame.call_args_list[1:]]
+    assert failure_frames == ["🔥 [bold]broken[/]", "❌ [bold]wrong[/]"]
@@ -0,0 +1,61 @@
+"""Tests for the Rich cell_len compatibility patch."""
+
+import rich.cells
+import rich.text
+
+from styledconsole.utils import rich_compat
+from styledconsole.utils.rich_compat import patched_cell_len
+from styledconsole.utils.text import visual_width
+
+
+class TestPatchedCellLen:
+    """Tests for patched_cell_len."""
+
+    def test_patches_and_restores(self, monkeypatch):
+        monkeypatch.setattr(rich_compat, "is_modern_terminal", lambda: True)
+        original = rich.text.cell_len
+
+        with patched_cell_len():
+            assert rich.text.cell_len is not original
+            assert rich.text.cell_len("☁️ ok") == visual_width("☁️ ok")
+            assert rich.cells.cached_cell_len is rich.text.cell_len
+        assert rich.text.cell_len is original
+
+    def test_nested_blocks_restore_once(self, monkeypatch):
+        monkeypatch.setattr(rich_compat, "is_modern_terminal", lambda: True)
+        original = rich.cells.cell_len
+
+        with patched_cell_len():
+            patched = rich.cells.cell_len
+            with patched_cell_len():
+                assert rich.cells.cell_len is patched
+            # Leaving the inner block keeps the outer patch active
+            assert rich.cells.cell_len is patched
+        assert rich.cells.cell_len is original
+
+    def test_patch_keeps_cell_len_signature(self, monkeypatch):
+        """unicode_version is accepted and ignored, and never enables markup stripping."""
+        monkeypatch.setattr(rich_compat, "is_modern_terminal", lambda: True)
+        text = "[bold]✅[/bold]"
+
+        with patched_cell_len():
+            assert rich.cells.cell_len(text) == visual_width(text)
+            assert rich.cells.cell_len(text, "auto") == visual_width(text)
+            assert rich.cells.cell_len(text, unicode_version="auto") == visual_width(text)
+
+    def test_cached_cell_len_cache_kept_warm(self, monkeypatch):
+        monkeypatch.setattr(rich_compat, "is_modern_terminal", lambda: True)
+        cached = rich.cells.cached_cell_len
+        cached("warm")
+        hits = cached.cache_info().currsize
+
+        with patched_cell_len():
+            pass
+        assert cached.cache_info().currsize == hits
+
+    def test_no_patch_for_legacy_terminal(self, monkeypatch):
+        monkeypatch.setattr(rich_compat, "is_modern_terminal", lambda: False)
+        original = rich.cells.cell_len
+
+        with patched_cell_len():
+            assert rich.cells.cell_len is original
@@ -0,0 +1,46 @@
+"""Tests for emoji sanitization helpers."""
+
+import pytest
+
+from styledconsole.utils.icon_data import EMOJI_TO_ICON
+from styledconsole.utils.sanitize import sanitize_emoji_content
+
+
+class TestSanitizeEmojiContent:
+    """Tests for sanitize_emoji_content."""
+
+    def test_colored_replacement(self):
+        assert sanitize_emoji_content("Status: ✅ Done") == "Status: [green](OK)[/] Done"
+
+    def test_plain_replacement(self):
+        assert sanitize_emoji_content("Status: ✅ Done", with_color=False) == "Status: (OK) Done"
+
+    def test_multiple_emojis_replaced(self):
+        result = sanitize_emoji_content("✅ a ❌ b ✅", with_color=False)
+        assert "✅" not in result
+        assert "❌" not in result
+        assert result.count("(OK)") == 2
+
+    @pytest.mark.parametrize("content", [42, None, ["✅"]])
+    def test_non_strings_returned_unchanged(self, content):
+        assert sanitize_emoji_content(content) is content
+
+    def test_ascii_content_returned_unchanged(self):
+        content = "[bold]id-42[/] (OK)"
+        assert sanitize_emoji_content(content) is content
+
+    def test_all_known_emojis_are_non_ascii(self):
+        assert not any(emoji.isascii() for emoji in EMOJI_TO_ICON)
+
+    def test_sequence_codepoints_not_translated(self):
+        from styledconsole.utils import sanitize
+
+        translatable = sanitize._translatable_emojis()
+        for emoji in EMOJI_TO_ICON:
+            if len(emoji) > 1:
+                assert not translatable.intersection(emoji)
+
+    def test_variation_selector_sequence_replaced_whole(self):
+        result = sanitize_emoji_content("⚠️ disk", with_color=False)
+        assert "️" not in result
+        assert result.endswith(" disk")
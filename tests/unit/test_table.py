@@ -93,3 +93,32 @@ def test_table_sanitize_column_header():
 
     assert "🚀" not in output
     assert ">>>" in output or "Speed" in output
+
+
+def test_table_subclass_overrides_called_with_emoji():
+    """Test subclass add_row/add_column overrides run when emoji=True."""
+    calls = []
+
+    class _RecordingTable(StyledTable):
+        def add_row(self, *renderables, **kwargs):
+            calls.append("row")
+            super().add_row(*renderables, **kwargs)
+
+        def add_column(self, header="", footer="", **kwargs):
+            calls.append("column")
+            super().add_column(header, footer, **kwargs)
+
+    table = _RecordingTable(policy=RenderPolicy(emoji=True))
+    table.add_column("🚀 Speed")
+    table.add_row("✅ Done")
+
+    from rich.console import Console
+
+    console = Console()
+    with console.capture() as capture:
+        console.print(table)
+    output = capture.get()
+
+    assert calls == ["column", "row"]
+    assert "🚀" in output
+    assert "✅" in output